@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# jugastar.py
+# Description:
+# -----------------------------------------------------------------------------
+#
+# Started on <dom 18-10-2026 00:21:39.118249306 (1792282899)>
+# Carlos Linares López <carlos.linares@uc3m.es>
+#
+
+"""Implementation of a solver of the water jugs problem using A*
+
+"""
+
+# imports
+# -----------------------------------------------------------------------------
+import heapq
+
+import jugbudget
+import jugheuristics
+import jugproblem
+import jugsearch
+import jugsolution
+
+# constants
+# -----------------------------------------------------------------------------
+
+# backpointer of the start state
+NO_PARENT = -1
+
+# classes
+# -----------------------------------------------------------------------------
+
+# -----------------------------------------------------------------------------
+# JUGAStar
+#
+# Implementation of A* for solving the water jugs problem
+# -----------------------------------------------------------------------------
+class JUGAStar(jugsearch.JUGSearch):
+    """Implementation of A* for solving the water jugs problem"""
+
+    def __init__(self, problem: jugproblem.JUGProblem, heuristic="lookahead"):
+        """A solver of the water jugs problem using A* is initialized with the
+           instance to solve which has to be an instance of JUGProblem, and the
+           heuristic to use, either the name of one defined in jugheuristics or
+           a callable which receives the instance and a packed state
+
+        """
+
+        super().__init__(problem)
+
+        # store the data members of this instance
+        self._heuristic = jugheuristics.get_heuristic(heuristic)
+
+    @jugbudget.bounded
+    def solve(self) -> jugsolution.JUGSolution:
+        """apply A* to solve this instance
+
+           it returns the solution as an instance of JUGSolution
+
+        """
+
+        # A* expands nodes in ascending order of f(n) = g(n) + h(n), where g(n)
+        # is the number of steps from the start state to n, and h(n) is an
+        # admissible estimate of the number of steps from n to a goal. The open
+        # list is then implemented as a binary heap, where every item is a
+        # tuple (f(n), h(n), n), so that ties in f(n) are broken in favour of
+        # the nodes closer to the goal. Because all heuristics are consistent,
+        # every node is expanded at most once and the first goal expanded is
+        # optimal.
+        #
+        # Instead of updating the f(n) of nodes already in the open list when a
+        # shorter path to them is found, a new item is pushed to the heap, and
+        # the old one is skipped when popped, as the node has already been
+        # expanded by then. States are packed into integers (see
+        # JUGProblem.pack) and the parent of every node is stored in a
+        # dictionary to rebuild the path once a goal is found
+
+        # -- initialization
+        self._generated, self._duplicates, self._expanded = 0, 0, 0
+        problem, heuristic = self._problem, self._heuristic
+        successors = self._get_successors()
+        is_goal = self._get_is_goal()
+        start = problem.pack(problem.get_start())
+
+        # if no goal can be reached from the start state, return failure
+        # immediately
+        h = heuristic(problem, start)
+        if h == jugheuristics.INFINITY:
+            return None
+
+        # initialize the open list with the start state, and store its g-value
+        # and parent
+        open_list = [(h, h, start)]
+        g_values = {start: 0}
+        parents = {start: NO_PARENT}
+        closed = set()
+
+        # iterate until the open list is exhausted
+        while len(open_list) > 0:
+
+            # get the node with the least f-value, skipping those which were
+            # already expanded with a lower f-value
+            _, _, curr_state = heapq.heappop(open_list)
+            if curr_state in closed:
+                continue
+
+            # if this node is a goal, the return the solution immediately
+            if is_goal(curr_state):
+
+                # Yeah, we made it!!! Hoorrrayyy!!
+                return jugsolution.from_path(problem, self._path(parents, curr_state))
+
+            # otherwise, expand it
+            closed.add(curr_state)
+            children = successors(curr_state)
+            self._expanded += 1
+            self._generated += len(children)
+
+            g = g_values[curr_state] + 1
+            for child in children:
+
+                # skip children which were already expanded or reached with a
+                # path which is not longer, and also dead ends
+                if child in closed or g >= g_values.get(child, g + 1):
+                    self._duplicates += 1
+                    continue
+                h = heuristic(problem, child)
+                if h == jugheuristics.INFINITY:
+                    continue
+
+                g_values[child] = g
+                parents[child] = curr_state
+                heapq.heappush(open_list, (g + h, h, child))
+
+        # at this point, the open list has been exhausted, so return failure
+        return None
+
+    def _path(self, parents: dict, state: int) -> list:
+        """return the path from the start state to the given packed state by
+           following backpointers
+
+        """
+
+        path = []
+        while state != NO_PARENT:
+            path.append(state)
+            state = parents[state]
+
+        # states have been gathered from the goal to the start, so reverse them
+        path.reverse()
+        return path
+
+
+# Local Variables:
+# mode:python
+# fill-column:80
+# End:
@@ -0,0 +1,386 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# jugbatch.py
+# Description:
+# -----------------------------------------------------------------------------
+#
+# Started on <dom 18-10-2026 02:51:09.663120487 (1792291869)>
+# Carlos Linares López <carlos.linares@uc3m.es>
+#
+
+"""Solving many instances of the water jugs problem at once, read from a file
+and written in JSON format, one per line
+
+"""
+
+# imports
+# -----------------------------------------------------------------------------
+import array
+import concurrent.futures
+import concurrent.futures.process
+import csv
+import json
+
+import jugbezout
+import jugbudget
+import jugcache
+import jugcosts
+import jugproblem
+import jugstate
+
+# error messages
+# -----------------------------------------------------------------------------
+CRITICAL_WRONG_RECORD_LENGTH = "Every line should contain either five or six fields: small, large, small_initial, large_initial, target and, optionally, algorithm"
+CRITICAL_MISSING_ALGORITHM = "No search algorithm has been given for this instance"
+
+# constants
+# -----------------------------------------------------------------------------
+
+# names of the fields of every line given in CSV format, in the same order
+FIELDS = ("small", "large", "small_initial", "large_initial", "target", "algorithm")
+
+# globals
+# -----------------------------------------------------------------------------
+
+# every worker process solves instances with the search algorithm, cache,
+# precheck, budget and options given to it when it is created (see
+# _initialize)
+_worker = None
+
+# functions
+# -----------------------------------------------------------------------------
+def decode(item: tuple) -> dict:
+    """return the result (see solve) represented by the given item (see
+       encode)
+
+    """
+
+    if len(item) == 2:
+        return {"line": item[0], "error": item[1]}
+    if len(item) == 5:
+        return {"line": item[0], "algorithm": item[1], "budget": item[2], "expanded": item[3],
+                "elapsed": item[4]}
+    if item[2] is None:
+        return {"line": item[0], "algorithm": item[1], "length": None, "cost": None,
+                "solution": None}
+
+    volumes = array.array('I')
+    volumes.frombytes(item[2])
+    njugs = volumes[0]
+    solution = [tuple(volumes[index:index + njugs]) for index in range(1, len(volumes), njugs)]
+    return {"line": item[0], "algorithm": item[1], "length": len(solution) - 1, "cost": item[3],
+            "solution": solution}
+
+
+def encode(result: dict) -> tuple:
+    """return a compact representation of the given result (see solve) to be
+       sent between processes, i.e., a tuple whose length distinguishes errors,
+       searches exceeding their budget and solutions. Solutions are encoded as
+       the bytes of an array of unsigned ints with the number of jugs followed
+       by the volume of every jug of every state, along with their cost
+
+    """
+
+    if "error" in result:
+        return result["line"], result["error"]
+    if "budget" in result:
+        return (result["line"], result["algorithm"], result["budget"], result["expanded"],
+                result["elapsed"])
+    if result["solution"] is None:
+        return result["line"], result["algorithm"], None, None
+
+    volumes = array.array('I', [len(result["solution"][0])])
+    for state in result["solution"]:
+        volumes.extend(state)
+    return result["line"], result["algorithm"], volumes.tobytes(), result["cost"]
+
+
+def get_problem(record: dict) -> jugproblem.JUGProblem:
+    """return the instance of JUGProblem described by the given record, a
+       dictionary with either the capacities of any number of jugs (and
+       optionally their initial volume), or the capacity of the small and large
+       jugs (and optionally their initial volume), along with the target volume
+       and, optionally, the goal
+
+    """
+
+    # records are interpreted in the same way as the arguments of the command
+    # line (see jugs.get_problem)
+    if "capacities" in record:
+        capacities = record["capacities"]
+        initial = record.get("initial", [0] * len(capacities))
+    else:
+        capacities = [record["small"], record["large"]]
+        initial = [record.get("small_initial", 0), record.get("large_initial", 0)]
+
+    return jugproblem.JUGProblem(capacities, jugstate.JUGState(*initial),
+                                 record["target"], record.get("goal", jugproblem.GOAL_ANY))
+
+
+def lines(stream):
+    """return a generator with a pair (number, line) for every line of the
+       stream which describes an instance, where number is the line where it
+       was found (starting from 1). Empty lines, comments (starting with '#')
+       and headers (starting with 'small') are ignored
+
+    """
+
+    # lines are read one at a time, so that the memory used does not depend on
+    # the number of instances
+    for number, line in enumerate(stream, start=1):
+
+        line = line.strip()
+        if len(line) == 0 or line.startswith('#') or line.startswith(FIELDS[0]):
+            continue
+
+        yield number, line
+
+
+def parse(line: str) -> dict:
+    """return a dictionary with the description of the instance given in the
+       line (see get_problem). Lines are given either in JSON format, or as
+       comma separated values (small, large, small_initial, large_initial,
+       target and, optionally, algorithm)
+
+    """
+
+    if line.startswith('{'):
+        return json.loads(line)
+
+    fields = next(csv.reader([line]))
+    if len(fields) not in (len(FIELDS) - 1, len(FIELDS)):
+        raise ValueError(CRITICAL_WRONG_RECORD_LENGTH)
+    record = {field: int(value) for field, value in zip(FIELDS[:-1], fields)}
+    if len(fields) == len(FIELDS) and fields[-1].strip():
+        record[FIELDS[-1]] = fields[-1].strip()
+
+    return record
+
+
+def read(pairs):
+    """return a generator with a pair (number, record) for every pair (number,
+       line) given (see lines), where record is either the dictionary
+       describing the instance (see parse), or the exception raised when
+       parsing it
+
+    """
+
+    for number, line in pairs:
+        try:
+            yield number, parse(line)
+        except ValueError as error:
+            yield number, error
+
+
+def run(stream, output, algorithm: str = None, cache: jugcache.JUGCache = None,
+        precheck: bool = False, workers: int = 1, chunksize: int = 64,
+        ordered: bool = True, budget: jugbudget.JUGBudget = None, **options):
+    """solve all instances given in the input stream and write their solutions
+       to the output stream in JSON format, one per line, as soon as each one
+       is solved (see solve)
+
+       If more than one worker is requested, instances are solved in parallel
+       by a pool of processes, each one with its own cache of the same size
+       than the given one. Lines are sent to them in chunks of the given size,
+       and results are written either in the same order than the instances, or
+       as soon as every chunk is solved otherwise
+
+    """
+
+    if workers <= 1:
+        results = solve(read(lines(stream)), algorithm, cache, precheck, budget, **options)
+    else:
+        maxsize = jugcache.JUGCache().get_maxsize() if cache is None else cache.get_maxsize()
+        results = _solve_parallel(lines(stream), workers, chunksize, ordered,
+                                  (algorithm, maxsize, precheck, budget, options))
+
+    for result in results:
+        output.write(json.dumps(result, separators=(',', ':')) + '\n')
+        output.flush()
+
+
+def solve(records, algorithm: str = None, cache: jugcache.JUGCache = None,
+          precheck: bool = False, budget: jugbudget.JUGBudget = None, **options):
+    """return a generator with a dictionary for every pair (number, record)
+       given (see read), with either the solution of the instance, or the
+       error found. Instances are solved with the search algorithm given in
+       the record, or the given one otherwise, and the given options (see
+       jugsolvers.create). If a cache is given, repeated instances are taken
+       from it (see JUGCache). If a budget is given, every search is bounded
+       by it, and those exceeding it report the reason, the number of nodes
+       expanded and the time elapsed (in seconds) instead of a solution
+
+    """
+
+    cache = jugcache.JUGCache() if cache is None else cache
+    for number, record in records:
+
+        # every instance is solved separately, so that an error in one of them
+        # (e.g., a wrong record, or a table which can not be written, or
+        # running out of memory) does not prevent solving the others
+        try:
+            if isinstance(record, Exception):
+                raise record
+            name = record.get("algorithm", algorithm)
+            if name is None:
+                raise ValueError(CRITICAL_MISSING_ALGORITHM)
+            problem = get_problem(record)
+            if precheck and jugbezout.is_unsolvable(problem):
+                solution = None
+            else:
+                solution = cache.solve(name, problem, budget, **options)
+
+            # the cost of solutions is computed from the operators applied, as
+            # most search algorithms ignore costs
+            cost = None
+            if solution is not None and not isinstance(solution, jugbudget.JUGBudgetExceeded):
+                cost = _get_cost(problem, solution, options)
+        except Exception as error:
+            yield {"line": number, "error": str(error)}
+            continue
+
+        if isinstance(solution, jugbudget.JUGBudgetExceeded):
+            yield {"line": number,
+                   "algorithm": name,
+                   "budget": solution.get_reason(),
+                   "expanded": solution.get_expanded(),
+                   "elapsed": round(solution.get_elapsed(), 6)}
+            continue
+
+        yield {"line": number,
+               "algorithm": name,
+               "length": None if solution is None else len(solution) - 1,
+               "cost": cost,
+               "solution": None if solution is None else [state.get_volumes() for state in solution]}
+
+
+def _chunks(pairs, chunksize: int):
+    """return a generator with lists of the given size with consecutive pairs
+       (number, line) (see lines)
+
+    """
+
+    chunk = []
+    for pair in pairs:
+        chunk.append(pair)
+        if len(chunk) == chunksize:
+            yield chunk
+            chunk = []
+    if len(chunk) > 0:
+        yield chunk
+
+
+def _create_executor(workers: int, arguments: tuple) -> concurrent.futures.ProcessPoolExecutor:
+    """return a new pool with the given number of worker processes, every one
+       initialized with the given arguments (see _initialize)
+
+    """
+
+    return concurrent.futures.ProcessPoolExecutor(workers, initializer=_initialize,
+                                                  initargs=arguments)
+
+
+def _finished(pending: dict, ordered: bool):
+    """return a generator with the results of the oldest chunk among the
+       pending ones (a dictionary which maps every future to its chunk, in the
+       order they were sent) if order is required, or those of any finished
+       chunks otherwise, which are removed from the pending ones
+
+    """
+
+    if ordered:
+        futures = [next(iter(pending))]
+    else:
+        futures, _ = concurrent.futures.wait(pending, return_when=concurrent.futures.FIRST_COMPLETED)
+
+    # chunks whose worker failed (e.g., because it was killed by the system
+    # when running out of memory) report the error for every instance in them,
+    # so that the results of all other chunks are still written
+    for future in futures:
+        chunk = pending.pop(future)
+        try:
+            items = future.result()
+        except Exception as error:
+            items = [encode({"line": number, "error": str(error)}) for number, _ in chunk]
+        for item in items:
+            yield decode(item)
+
+
+def _get_cost(problem: jugproblem.JUGProblem, solution, options: dict) -> int:
+    """return the cost of the given solution of the given instance with the
+       cost given in the options, if any, or its number of steps otherwise
+
+    """
+
+    if options.get("cost") is None:
+        return solution.get_cost()
+    return jugcosts.get_path_cost(problem, solution, options["cost"])
+
+
+def _initialize(algorithm: str, maxsize: int, precheck: bool, budget: jugbudget.JUGBudget,
+                options: dict):
+    """initialize a worker process with the arguments used to solve every
+       instance, and its own cache
+
+    """
+
+    global _worker
+    _worker = (algorithm, jugcache.JUGCache(maxsize), precheck, budget, options)
+
+
+def _solve_chunk(chunk: list) -> list:
+    """solve all instances of the given chunk of pairs (number, line) in a
+       worker process and return their results encoded (see encode)
+
+    """
+
+    algorithm, cache, precheck, budget, options = _worker
+    return [encode(result) for result in solve(read(chunk), algorithm, cache, precheck, budget,
+                                               **options)]
+
+
+def _solve_parallel(pairs, workers: int, chunksize: int, ordered: bool, arguments: tuple):
+    """return a generator with the result of every pair (number, line) given
+       (see lines), solved in parallel by the given number of workers in
+       chunks of the given size
+
+    """
+
+    # the number of chunks sent to the workers but not written yet is bounded,
+    # so that the memory used does not depend on the number of instances
+    # (note that Pool.imap reads all the input in advance instead). Every
+    # worker has at most a couple of chunks waiting
+    executor = _create_executor(workers, arguments)
+    try:
+
+        pending = {}
+        for chunk in _chunks(pairs, chunksize):
+
+            # before sending a new chunk, make room by writing the results of
+            # the oldest chunk, or any finished one if no order is required
+            if len(pending) >= 2 * workers:
+                yield from _finished(pending, ordered)
+
+            # if a worker died, the pool can not be used anymore, and it is
+            # replaced with a new one to solve the remaining chunks
+            try:
+                future = executor.submit(_solve_chunk, chunk)
+            except concurrent.futures.process.BrokenProcessPool:
+                executor.shutdown(wait=False)
+                executor = _create_executor(workers, arguments)
+                future = executor.submit(_solve_chunk, chunk)
+            pending[future] = chunk
+
+        # write the results of all chunks still pending
+        while len(pending) > 0:
+            yield from _finished(pending, ordered)
+
+    finally:
+        executor.shutdown()
+
+
+# Local Variables:
+# mode:python
+# fill-column:80
+# End:
@@ -0,0 +1,441 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# jugbench.py
+# Description:
+# -----------------------------------------------------------------------------
+#
+# Started on <sáb 17-10-2026 21:12:37.205118664 (1792271557)>
+# Carlos Linares López <carlos.linares@uc3m.es>
+#
+
+"""Benchmarks of the search algorithms for solving the water jugs problem
+
+"""
+
+# imports
+# -----------------------------------------------------------------------------
+import argparse
+import json
+import sys
+import tempfile
+import time
+import tracemalloc
+
+import jugbfs
+import jugbibfs
+import jugproblem
+import jugsolvers
+import jugstate
+import jugtransitions
+
+# constants
+# -----------------------------------------------------------------------------
+
+# instances of the benchmark suite. Every case has a name, the family it belongs
+# to, the capacity of every jug (all of them initially empty), the target volume
+# to achieve in any jug and the search algorithms that are skipped, because they
+# would take too long: depth-first search without a closed list takes time
+# quadratic in the capacities when the instance is unsolvable, IDA* re-expands
+# nodes once per iteration, and precomputed tables store one entry per state and
+# target. Cases in the family "scaling" have increasing capacities, so that the
+# growth of time and memory of every search algorithm is shown
+SKIP_LARGE = ("idastar", "table")
+CASES = [
+    {"name": "diehard", "family": "coprime", "capacities": [3, 5], "target": 4, "skip": ()},
+    {"name": "coprime-7-11", "family": "coprime", "capacities": [7, 11], "target": 6, "skip": ()},
+    {"name": "coprime-3-5-7", "family": "coprime", "capacities": [3, 5, 7], "target": 6, "skip": ()},
+    {"name": "gcd-6-9", "family": "non-coprime", "capacities": [6, 9], "target": 3, "skip": ()},
+    {"name": "gcd-12-18", "family": "non-coprime", "capacities": [12, 18], "target": 6, "skip": ()},
+    {"name": "gcd-6-10-15", "family": "non-coprime", "capacities": [6, 10, 15], "target": 1, "skip": ()},
+    {"name": "unsolvable-gcd", "family": "unsolvable", "capacities": [6, 9], "target": 4, "skip": ()},
+    {"name": "unsolvable-large", "family": "unsolvable", "capacities": [10, 16], "target": 20, "skip": ()},
+    {"name": "unsolvable-primes", "family": "unsolvable", "capacities": [101, 103], "target": 200, "skip": SKIP_LARGE},
+    {"name": "primes-997-1009", "family": "large-primes", "capacities": [997, 1009], "target": 500, "skip": SKIP_LARGE},
+    {"name": "primes-1009-1013", "family": "large-primes", "capacities": [1009, 1013], "target": 1, "skip": SKIP_LARGE},
+    {"name": "scaling-31-37", "family": "scaling", "capacities": [31, 37], "target": 1, "skip": ()},
+    {"name": "scaling-61-67", "family": "scaling", "capacities": [61, 67], "target": 1, "skip": ()},
+    {"name": "scaling-127-131", "family": "scaling", "capacities": [127, 131], "target": 1, "skip": SKIP_LARGE},
+    {"name": "scaling-251-257", "family": "scaling", "capacities": [251, 257], "target": 1, "skip": SKIP_LARGE},
+    {"name": "scaling-503-509", "family": "scaling", "capacities": [503, 509], "target": 1, "skip": SKIP_LARGE}]
+
+# metrics compared against the baseline. Time and memory are allowed to vary
+# within a tolerance, and differences below the given absolute values (one
+# millisecond and one kilobyte) are ignored since they are just noise. Any other
+# metric has to be exactly the same, so that any change in the search is
+# reported as well
+METRICS = {"time": 1e-3, "peak": 1024, "expanded": None, "generated": None, "length": None}
+
+# instances used by default by every benchmark, given with the capacity of
+# every jug and the target volume. Large instances with two jugs whose whole
+# state space is explored are used by default. However, bidirectional search
+# saves nothing with only two jugs, since every state has very few children
+# and the number of states per layer does not grow with the depth. Thus, more
+# jugs are used by default to compare it with breadth-first search
+DEFAULTS = {"memory": ([997, 1009], 2000),
+            "transitions": ([997, 1009], 2000),
+            "bidirectional": ([7, 11, 13, 17, 19], 16)}
+
+# classes
+# -----------------------------------------------------------------------------
+
+# -----------------------------------------------------------------------------
+# _OriginalNode
+#
+# Node as stored by the original search algorithms, only used to measure the
+# memory they used (see memory_per_node)
+# -----------------------------------------------------------------------------
+class _OriginalNode(object):
+    """Node as stored by the original search algorithms, i.e., a state with a
+       dictionary of attributes and the path from the start state to it
+
+    """
+
+    def __init__(self, volumes: tuple):
+        """A node is initialized with the volume of every jug, and an empty
+           path
+
+        """
+
+        self._volumes = volumes
+        self._path = []
+
+    def __eq__(self, other) -> bool:
+        """return True if and only if this instance is strictly equal to other"""
+
+        return self._volumes == other._volumes
+
+    def __hash__(self) -> int:
+        """return the hash of this instance"""
+
+        return hash(self._volumes)
+
+
+# functions
+# -----------------------------------------------------------------------------
+def bidirectional_savings(problem: jugproblem.JUGProblem) -> dict:
+    """return a dictionary with the number of nodes expanded and generated by
+       breadth-first search and bidirectional breadth-first search when
+       solving the given instance, along with the time (in seconds) they took
+       and the length of their solutions
+
+    """
+
+    results = {}
+    for name, solver in (("breadth-first", jugbfs.JUGBFS),
+                         ("bidirectional", jugbibfs.JUGBiBFS)):
+        engine = solver(problem)
+        start = time.perf_counter()
+        solution = engine.solve()
+        elapsed = time.perf_counter() - start
+        results[name] = {"expanded": engine.get_expanded(),
+                         "generated": engine.get_generated(),
+                         "time": elapsed,
+                         "length": None if solution is None else len(solution) - 1}
+
+    return results
+
+
+def compare(results: list, baseline: list, tolerance: float) -> list:
+    """return a list of tuples (case, algorithm, metric, baseline, current) with
+       all the metrics of the given results which are worse than those of the
+       baseline, by more than the given tolerance (e.g., 0.25 for 25%) in case
+       of time and memory, or which are just different otherwise. Results
+       which are not found in the baseline are ignored
+
+    """
+
+    previous = {(result["case"], result["algorithm"]): result for result in baseline}
+    regressions = []
+    for result in results:
+        reference = previous.get((result["case"], result["algorithm"]))
+        if reference is None:
+            continue
+        for metric, noise in METRICS.items():
+            if noise is None:
+                worse = result[metric] != reference[metric]
+            else:
+                worse = (result[metric] > reference[metric] * (1 + tolerance) and
+                         result[metric] - reference[metric] > noise)
+            if worse:
+                regressions.append((result["case"], result["algorithm"], metric,
+                                    reference[metric], result[metric]))
+
+    return regressions
+
+
+def memory_per_node(problem: jugproblem.JUGProblem) -> dict:
+    """return a dictionary with the number of bytes used per node stored by
+       breadth-first search when solving the given instance, both with a set
+       of packed states (packed) and a bitmap (bitmap) for duplicate detection.
+       For the sake of comparison, it also returns the number of bytes per node
+       used when storing the same nodes as the original search algorithms did,
+       i.e., instances with a dictionary of attributes and a list with the
+       path from the start state to them (original), and as instances of
+       JUGState (objects), in a list and a set as the open and closed lists
+
+    """
+
+    # run breadth-first search and trace the peak memory used. The number of
+    # nodes stored is the number of nodes generated which were not discarded
+    # (plus the start state)
+    packed = {}
+    for name, bitmap in (("packed", False), ("bitmap", True)):
+        engine = jugbfs.JUGBFS(problem, bitmap=bitmap)
+        tracemalloc.start()
+        engine.solve()
+        _, packed[name] = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    nodes = 1 + engine.get_generated() - engine.get_duplicates()
+
+    # the original nodes carried the path from the start state to them, so
+    # that their size depends on their depth. Thus, the same nodes stored by
+    # breadth-first search are generated in the same order, along with the
+    # location of their parent, before tracing memory
+    keys, parents = [problem.pack(problem.get_start())], [None]
+    seen = set(keys)
+    head = 0
+    while len(keys) < nodes:
+        for child in problem.successors(keys[head]):
+            if child not in seen and len(keys) < nodes:
+                seen.add(child)
+                keys.append(child)
+                parents.append(head)
+        head += 1
+
+    # every original node copies the path of its parent and appends itself to
+    # it. Note this is a lower bound, as the original search algorithms
+    # deep-copied the states in the path as well
+    tracemalloc.start()
+    open_list, closed_list = [], set()
+    for key, parent in zip(keys, parents):
+        node = _OriginalNode(tuple(problem.unpack_volumes(key)))
+        node._path = ([] if parent is None else list(open_list[parent]._path)) + [node]
+        open_list.append(node)
+        closed_list.add(node)
+    original, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del open_list, closed_list
+
+    # next, store the same number of instances of JUGState in a list and a set.
+    # Note that the actual states are not relevant here, but only their number
+    tracemalloc.start()
+    open_list, closed_list = [], set()
+    for key in range(nodes):
+        state = problem.unpack(key)
+        open_list.append(state)
+        closed_list.add(state)
+    objects, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {"nodes": nodes,
+            "original": original / nodes,
+            "objects": objects / nodes,
+            "packed": packed["packed"] / nodes,
+            "bitmap": packed["bitmap"] / nodes}
+
+
+def transitions_speedup(problem: jugproblem.JUGProblem, sample: int = 100000) -> dict:
+    """return a dictionary with the time (in seconds) taken to build the table
+       of transitions of the given instance, its size in bytes (along with its
+       estimate), and the time per node expanded (in microseconds) by the
+       successor function of the instance and the table, over a sample of the
+       given number of states. Besides, it returns the time taken by
+       breadth-first search to solve the instance with and without the table
+
+    """
+
+    # build the table of transitions
+    start = time.perf_counter()
+    table = jugtransitions.JUGTransitions(problem)
+    build = time.perf_counter() - start
+
+    # expand the same states with both successor functions. States are taken
+    # evenly from the whole state space
+    keys = range(0, problem.get_nstates(), max(1, problem.get_nstates() // sample))
+    expansion = {}
+    for name, successors in (("problem", problem.successors), ("table", table.successors)):
+        start = time.perf_counter()
+        for key in keys:
+            successors(key)
+        expansion[name] = 1e6 * (time.perf_counter() - start) / len(keys)
+
+    # and solve the instance with breadth-first search with and without the
+    # table
+    search = {}
+    for name, transitions in (("problem", None), ("table", table)):
+        engine = jugbfs.JUGBFS(problem)
+        engine.set_transitions(transitions)
+        start = time.perf_counter()
+        engine.solve()
+        search[name] = time.perf_counter() - start
+
+    return {"build": build,
+            "memory": table.get_memory(),
+            "estimate": jugtransitions.JUGTransitions.estimate(problem.get_capacities()),
+            "expansion": expansion,
+            "search": search}
+
+
+def suite(names: list, repeat: int = 3, cases: list = CASES) -> list:
+    """return a list of dictionaries with the results of running every search
+       algorithm with the given names on every case of the benchmark suite
+       (see CASES). Every result consists of the name of the case and the
+       search algorithm, the best wall time (in seconds) out of the given
+       number of runs, the number of nodes expanded and generated, the peak of
+       memory (in bytes) traced in a separate run, and the length of the
+       solution, if any
+
+    """
+
+    # precomputed tables are stored in a temporary directory, so that they are
+    # built the first time (and only the first time) they are used
+    results = []
+    with tempfile.TemporaryDirectory() as cache_dir:
+        for case in cases:
+            problem = jugproblem.JUGProblem(case["capacities"],
+                                            jugstate.JUGState(*[0] * len(case["capacities"])),
+                                            case["target"])
+            for name in names:
+                if name in case["skip"]:
+                    continue
+
+                # the wall time is measured without tracing memory, which slows
+                # down Python significantly. Note that the memory of other
+                # processes (if any) is not traced
+                elapsed = []
+                for _ in range(repeat):
+                    engine = jugsolvers.create(name, problem, cache_dir=cache_dir)
+                    start = time.perf_counter()
+                    solution = engine.solve()
+                    elapsed.append(time.perf_counter() - start)
+
+                engine = jugsolvers.create(name, problem, cache_dir=cache_dir)
+                tracemalloc.start()
+                engine.solve()
+                _, peak = tracemalloc.get_traced_memory()
+                tracemalloc.stop()
+
+                results.append({"case": case["name"],
+                                "family": case["family"],
+                                "algorithm": name,
+                                "capacities": case["capacities"],
+                                "target": case["target"],
+                                "time": min(elapsed),
+                                "expanded": engine.get_expanded(),
+                                "generated": engine.get_generated(),
+                                "peak": peak,
+                                "length": None if solution is None else len(solution) - 1})
+
+    return results
+
+
+# main
+# -----------------------------------------------------------------------------
+def main():
+    """main body"""
+
+    # parse the arguments. Every benchmark is a different command, and all of
+    # them are run over the same instance. By default, every benchmark uses its
+    # own instance (see DEFAULTS)
+    parser = argparse.ArgumentParser(description="Benchmarks of the search algorithms for solving the water jugs problem")
+    parser.add_argument('benchmark',
+                        choices=['memory', 'bidirectional', 'transitions', 'suite'],
+                        help="benchmark to run: either the number of bytes per node stored in 'memory' by breadth-first search, the number of nodes saved by 'bidirectional' search with regard to breadth-first search, the speedup per node expanded with a table of 'transitions', or the whole benchmark 'suite' of all search algorithms over a collection of instances")
+    parser.add_argument('-c', '--capacities', type=int, nargs='+',
+                        help="capacity of every jug. By default, 7, 11, 13, 17 and 19 gallons for 'bidirectional', and 997 and 1009 gallons otherwise")
+    parser.add_argument('-i', '--initial', type=int, nargs='+',
+                        help="initial amount of water in every jug. By default, all jugs are empty")
+    parser.add_argument('-t', '--target', type=int,
+                        help="target amount of water to be achieved in any jug. By default, 16 gallons for 'bidirectional', and 2000 gallons otherwise (so that the whole state space is explored)")
+    parser.add_argument('-x', '--algorithms', nargs='+', choices=jugsolvers.get_names(),
+                        default=jugsolvers.get_names(),
+                        help="search algorithms run in the benchmark suite. By default, all")
+    parser.add_argument('-r', '--repeat', type=int, default=3,
+                        help="number of runs of every search algorithm in the benchmark suite, of which the best wall time is reported. By default, 3")
+    parser.add_argument('-o', '--output', type=str,
+                        help="file where the results of the benchmark suite are written in JSON format")
+    parser.add_argument('-b', '--baseline', type=str,
+                        help="file with results of the benchmark suite written before with --output, which are compared with the current ones")
+    parser.add_argument('-T', '--tolerance', type=float, default=0.25,
+                        help="fraction of time and memory that results of the benchmark suite can exceed those of the baseline without being considered a regression. By default, 0.25")
+    params = parser.parse_args()
+
+    # the benchmark suite runs over its own instances
+    if params.benchmark == 'suite':
+        results = suite(params.algorithms, params.repeat)
+        print(" {0:<18} {1:<22} {2:>10} {3:>10} {4:>10} {5:>12} {6:>7}".format(
+            "case", "algorithm", "time (s)", "expanded", "generated", "peak (bytes)", "length"))
+        for result in results:
+            print(" {0:<18} {1:<22} {2:>10.4f} {3:>10} {4:>10} {5:>12} {6:>7}".format(
+                result["case"], result["algorithm"], result["time"], result["expanded"],
+                result["generated"], result["peak"], str(result["length"])))
+
+        if params.output:
+            with open(params.output, "w") as stream:
+                json.dump(results, stream, indent=2)
+
+        # if a baseline is given, report all regressions and exit with an error
+        # status if there are any
+        if params.baseline:
+            with open(params.baseline) as stream:
+                regressions = compare(results, json.load(stream), params.tolerance)
+            for case, name, metric, reference, current in regressions:
+                print(" Regression: {0} / {1}: {2} {3} -> {4}".format(case, name, metric,
+                                                                    reference, current))
+            print(" {0} regressions found".format(len(regressions)))
+            if len(regressions) > 0:
+                sys.exit(1)
+        return
+
+    capacities, target = DEFAULTS[params.benchmark]
+    capacities = params.capacities if params.capacities else capacities
+    target = target if params.target is None else params.target
+    initial = params.initial if params.initial else [0] * len(capacities)
+    problem = jugproblem.JUGProblem(capacities, jugstate.JUGState(*initial), target)
+
+    if params.benchmark == 'memory':
+        memory = memory_per_node(problem)
+        print(" Nodes stored          : {0}".format(memory["nodes"]))
+        print(" Bytes per node        : {0:.1f} (original, with paths)".format(memory["original"]))
+        for name, label in (("objects", "JUGState"), ("packed", "packed"),
+                            ("bitmap", "packed, bitmap")):
+            print(" Bytes per node        : {0:.1f} ({1}, {2:.2f}x fewer)".format(
+                memory[name], label, memory["original"] / memory[name]))
+
+    elif params.benchmark == 'transitions':
+        results = transitions_speedup(problem)
+        print(" Build time            : {0:.3f} seconds".format(results["build"]))
+        print(" Table size            : {0} bytes (estimated: {1} bytes)".format(
+            results["memory"], results["estimate"]))
+        print(" Time per node (table) : {0:.3f} us".format(results["expansion"]["table"]))
+        print(" Time per node         : {0:.3f} us ({1:.2f}x)".format(
+            results["expansion"]["problem"],
+            results["expansion"]["problem"] / results["expansion"]["table"]))
+        print(" Breadth-first (table) : {0:.3f} seconds".format(results["search"]["table"]))
+        print(" Breadth-first         : {0:.3f} seconds ({1:.2f}x)".format(
+            results["search"]["problem"],
+            results["search"]["problem"] / results["search"]["table"]))
+
+    else:
+        results = bidirectional_savings(problem)
+        for name, result in results.items():
+            print(" {0:<14}: {1} expanded, {2} generated in {3:.6f} seconds (length: {4})".format(
+                name, result["expanded"], result["generated"], result["time"],
+                result["length"]))
+        if results["bidirectional"]["expanded"] > 0:
+            print(" Savings       : {0:.2f}x fewer nodes expanded, {1:.2f}x faster".format(
+                results["breadth-first"]["expanded"] / results["bidirectional"]["expanded"],
+                results["breadth-first"]["time"] / results["bidirectional"]["time"]))
+
+
+# -----------------------------------------------------------------------------
+if __name__ == '__main__':
+
+    main()
+
+
+# Local Variables:
+# mode:python
+# fill-column:80
+# End:
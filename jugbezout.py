@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# jugbezout.py
+# Description:
+# -----------------------------------------------------------------------------
+#
+# Started on <sáb 17-10-2026 22:48:20.061734915 (1792277300)>
+# Carlos Linares López <carlos.linares@uc3m.es>
+#
+
+"""Implementation of an analytic solver of the water jugs problem based on
+Bezout's identity, which requires no search at all
+
+"""
+
+# imports
+# -----------------------------------------------------------------------------
+import math
+
+import jugbfs
+import jugbudget
+import jugproblem
+import jugsearch
+import jugsolution
+import jugstate
+
+# functions
+# -----------------------------------------------------------------------------
+def is_unsolvable(problem: jugproblem.JUGProblem, volumes=None) -> bool:
+    """return True if the given instance has no solution at all from the given
+       volumes of every jug (by default, those of its start state). Note that
+       False does not necessarily mean that the instance is solvable, but only
+       that it could not be proven unsolvable without search
+
+    """
+
+    # trivially, if the start state is a goal the instance is solvable
+    capacities, target = problem.get_capacities(), problem.get_target()
+    if volumes is None:
+        volumes = problem.get_start().get_volumes()
+    if problem.is_goal(jugstate.JUGState(*volumes)):
+        return False
+
+    # first, no jug can contain more water than its capacity
+    goal = problem.get_goal()
+    if goal == jugproblem.GOAL_ANY:
+        bound = max(capacities)
+    elif goal == jugproblem.GOAL_TOTAL:
+        bound = sum(capacities)
+    else:
+        bound = capacities[goal]
+    if target < 0 or target > bound:
+        return True
+
+    # second, by Bezout's identity, filling and emptying jugs only adds or
+    # removes multiples of g, the greatest common divisor of all capacities.
+    # Thus, the volume of every jug modulo g is always the sum of the volumes
+    # (modulo g) of a subset of the jugs in the start state: pouring water
+    # merges the water of two jugs, or leaves a full jug (with no volume
+    # modulo g) and the rest of the merged water in the other one. Besides,
+    # the subsets of different jugs are disjoint, so that the total volume
+    # modulo g is also the sum of one of these subsets. Hence, if the target
+    # modulo g is not the sum of any subset, then it is unreachable
+    divisor = math.gcd(*capacities)
+    residues = {0}
+    for volume in volumes:
+        residues |= {(residue + volume) % divisor for residue in residues}
+
+    return target % divisor not in residues
+
+
+# classes
+# -----------------------------------------------------------------------------
+
+# -----------------------------------------------------------------------------
+# JUGBezout
+#
+# Analytic solver of the water jugs problem based on Bezout's identity
+# -----------------------------------------------------------------------------
+class JUGBezout(jugsearch.JUGSearch):
+    """Analytic solver of the water jugs problem based on Bezout's identity.
+
+       It proves instances unsolvable in time logarithmic in the capacities.
+       Besides, the classical variant (two jugs, initially empty, with the
+       target in any jug) is solved optimally in time linear in the length of
+       the solution. Any other instance is solved with breadth-first search
+
+    """
+
+    def __init__(self, problem: jugproblem.JUGProblem):
+        """An analytic solver of the water jugs problem is initialized with the
+           instance to solve which has to be an instance of JUGProblem
+
+        """
+
+        super().__init__(problem)
+
+    @jugbudget.bounded
+    def solve(self) -> jugsolution.JUGSolution:
+        """solve this instance analytically, if possible, or with breadth-first
+           search otherwise
+
+           it returns the solution as an instance of JUGSolution
+
+        """
+
+        # -- initialization
+        self._generated, self._duplicates, self._expanded = 0, 0, 0
+        problem = self._problem
+
+        # first, return failure if this instance is proven unsolvable
+        if is_unsolvable(problem):
+            return None
+
+        # if this instance is not the classical variant, then solve it with
+        # breadth-first search with the same budget, taking its statistics
+        if problem.get_njugs() != 2 or problem.get_goal() != jugproblem.GOAL_ANY or \
+           problem.get_start().get_volumes() != (0, 0):
+            engine = jugbfs.JUGBFS(problem)
+            engine.set_budget(self._budget)
+            solution = engine.solve()
+            self._generated, self._duplicates, self._expanded = \
+                engine.get_generated(), engine.get_duplicates(), engine.get_expanded()
+            return solution
+
+        # otherwise, an optimal solution consists of repeatedly filling one jug
+        # and pouring it into the other one, emptying the latter whenever it
+        # gets full. There are only two choices: either to fill the first jug
+        # or the second one, and the shortest of both is optimal. Note that as
+        # the instance is not unsolvable, both choices eventually reach the
+        # target
+        forward = self._pour(0, 1)
+        backward = self._pour(1, 0)
+        return jugsolution.from_states(problem.get_capacities(),
+                                       forward if len(forward) <= len(backward) else backward)
+
+    def _pour(self, source: int, destination: int) -> list:
+        """return the path from the start state which results from repeatedly
+           filling the source jug and pouring it into the destination, which is
+           emptied whenever it gets full
+
+        """
+
+        # -- initialization
+        capacities, target = self._problem.get_capacities(), self._problem.get_target()
+        volumes = [0, 0]
+        path = [jugstate.JUGState(*volumes)]
+
+        # apply the only operator that makes sense in every state until the
+        # target is found in either jug
+        while target not in volumes:
+
+            # if the source is empty, fill it up
+            if volumes[source] == 0:
+                volumes[source] = capacities[source]
+
+            # if the destination is full, empty it
+            elif volumes[destination] == capacities[destination]:
+                volumes[destination] = 0
+
+            # otherwise, pour water from the source into the destination
+            else:
+                volume = min(volumes[source], capacities[destination] - volumes[destination])
+                volumes[source] -= volume
+                volumes[destination] += volume
+
+            path.append(jugstate.JUGState(*volumes))
+
+        return path
+
+
+# Local Variables:
+# mode:python
+# fill-column:80
+# End:
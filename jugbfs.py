@@ -16,14 +16,19 @@ search
 
 # imports
 # -----------------------------------------------------------------------------
-import copy
+import array
 
-import jugstate
+import jugbitmap
+import jugbudget
+import jugproblem
+import jugsearch
 import jugsolution
 
-# error messages
+# constants
 # -----------------------------------------------------------------------------
-CRITICAL_WRONG_START_TYPE = "The start state shall be an instance of JUGState. Aboring ..."
+
+# backpointer of the start state in the arena of nodes
+NO_PARENT = -1
 
 # classes
 # -----------------------------------------------------------------------------
@@ -34,30 +39,77 @@ CRITICAL_WRONG_START_TYPE = "The start state shall be an instance of JUGState. A
 # Implementation of a breadth-first search (BFS, not to confuse with best-first
 # search) for solving the water jugs problem
 # -----------------------------------------------------------------------------
-class JUGBFS(object):
+class JUGBFS(jugsearch.JUGSearch):
     """Implementation of a breadth-first search (BFS, not to confuse with
        best-first search) for solving the water problem jugs
 
     """
 
-    def __init__(self, start: jugstate.JUGState):
+    def __init__(self, problem: jugproblem.JUGProblem, bitmap: bool = False):
         """A solver of the water jugs problem using breadth-first search is
-           initialized with a start state which has to be an instance of a
-           JUGState
+           initialized with the instance to solve which has to be an instance
+           of JUGProblem. If bitmap is True, then states seen are stored in a
+           bitmap (see JUGBitmap) instead of a set, and the arena uses the
+           smallest unsigned integers which can store any packed state
 
         """
 
-        # verify the type of the start state
-        if not isinstance(start, jugstate.JUGState):
-            raise TypeError(CRITICAL_WRONG_START_TYPE)
+        super().__init__(problem)
 
         # store the data members of this instance
-        self._start = start
+        self._bitmap = bitmap
 
-    def solve(self) -> jugsolution.JUGSolution:
-        """apply breadth-first search to solve this instance
+    def iter_reachable(self):
+        """return a generator with a pair (state, depth) for every state
+           reachable from the start state of this instance, in the same order
+           they are generated by breadth-first search, where depth is the
+           length of the shortest path from the start state. States are
+           returned as instances of JUGState. The target is ignored
+
+        """
 
-           it returns the solution as an instance of JUGSolution
+        # this is the very same breadth-first search than iter_solutions, but
+        # no backpointers are stored and the queue is never stopped at goal
+        # states. The depth of every state is not stored either, since nodes in
+        # the queue are sorted in ascending order of their depth: it suffices
+        # to remember where the last layer ends
+        self._generated, self._duplicates, self._expanded = 0, 0, 0
+        problem = self._problem
+        successors = self._get_successors()
+        start = problem.pack(problem.get_start())
+        queue = array.array(self._typecode(), [start])
+        seen = self._set()
+        seen.add(start)
+        yield problem.get_start(), 0
+
+        head, depth, last = 0, 0, 1
+        while head < len(queue):
+
+            # when all nodes of the current layer have been expanded, then the
+            # next layer ends with the last node in the queue
+            if head == last:
+                depth, last = depth + 1, len(queue)
+
+            children = successors(queue[head])
+            head += 1
+            self._expanded += 1
+            self._generated += len(children)
+
+            for child in children:
+                if child in seen:
+                    self._duplicates += 1
+                    continue
+                seen.add(child)
+                queue.append(child)
+                yield problem.unpack(child), depth + 1
+
+    def iter_solutions(self):
+        """return a generator with the solutions found by breadth-first search
+           to every goal state reachable from the start state, in ascending
+           order of their length, as instances of JUGSolution. The first one is
+           precisely the solution returned by solve(), and there is only one
+           solution per goal state, i.e., the first one found. Solutions never
+           traverse other goal states
 
         """
 
@@ -66,78 +118,151 @@ class JUGBFS(object):
         # some textbooks refer to this data structure as a priority queue). In
         # this case, however, all operators have the same cost (we say there is
         # no user-preference over their applicability and they are all equally
-        # relevant/important), thus an ordinary list suffices for our purposes
-        # as there is a bijection between depth and cost, so that inserting by
-        # the back effectively sorts nodes in ascending order of their cost
+        # relevant/important), thus an ordinary FIFO queue suffices for our
+        # purposes as there is a bijection between depth and cost, so that
+        # inserting by the back effectively sorts nodes in ascending order of
+        # their cost.
         #
         # Note also, that because a queue is used, then this solver is *NOT*
         # implemented recursively but instead iteratively. Therefore, it does
-        # not require any specific arguments as the start state is already given
-        # to the constructor of this class
+        # not require any specific arguments as the instance to solve is already
+        # given to the constructor of this class
+        #
+        # Importantly, states do not keep a copy of the path from the start
+        # state to them. Instead, every node generated is stored in an arena,
+        # i.e., a pair of parallel arrays: the first one with the states
+        # themselves, and the second one with the index in the arena of their
+        # parent (a backpointer). The path is rebuilt only once, when a goal is
+        # found. Besides, states are not stored as instances of JUGState but
+        # packed into integers (see JUGProblem.pack), so that both arrays
+        # store plain machine integers and no Python object is created per node
+        #
+        # Because nodes are appended to the arena in exactly the same order they
+        # would be inserted in the queue, the arena itself is used as the queue:
+        # the nodes waiting to be expanded are those stored after the last one
+        # expanded, so that an index into the arena suffices to pop nodes from
+        # the front of the queue in constant time ---note that popping the first
+        # item of a Python list takes time linear in its length instead
         #
-        # Importantly, this implementation forces states to keep a copy of the
-        # path from the start state to it. This is extraordinarily inefficient
-        # and, instead, backpointers shall be used in the closed list
-        # (implemented as a set below). this state space, however, is tiny (even
-        # for large values of the maximum capacity of each jug) and thus this
-        # approach has been preferred ---also for didactical purposes
+        # Once a solution is found, the search is resumed only if another one
+        # is requested. Goal states are never expanded, so that every solution
+        # contains only one goal state, the last one
 
         # -- initialization
-
-        # first, initialize the path from the start with the start state itself
-        self._start += self._start
-
-        # populate the queue with the start state
-        queue = [self._start]
-
-        # create a closed list (implemented as a set) for storing all states
-        # previously expanded ---duplicate detection!
-        closed = set()
+        self._generated, self._duplicates, self._expanded = 0, 0, 0
+        problem = self._problem
+        successors = self._get_successors()
+        is_goal = self._get_is_goal()
+        start = problem.pack(problem.get_start())
+
+        # the arena is initialized with the start state, which has no parent
+        # at all. If a bitmap is used, the state space is assumed to be huge,
+        # and the arena stores unsigned integers as small as possible (see
+        # _typecode). In this case, the parent of the start state is just any
+        # location, since it is never used (see _path)
+        states = array.array(self._typecode(), [start])
+        parents = array.array(self._typecode(), [0 if self._bitmap else NO_PARENT])
+
+        # and the queue is initialized with the location of the start state in
+        # the arena
+        head = 0
+
+        # create a set with all states seen so far, i.e., either already
+        # expanded or waiting in the queue to be expanded ---duplicate
+        # detection! Because states are added to it as soon as they are
+        # generated, every state is inserted in the queue at most once. If
+        # requested, a bitmap with one bit per state is used instead, which
+        # takes much less memory in dense state spaces, as it is the case in
+        # this domain
+        seen = self._set()
+        seen.add(start)
 
         # iterate until doomsday or the queue is exhausted
-        while len(queue) > 0:
+        while head < len(states):
 
             # first, get the first node from the queue
-            curr_state = queue.pop(0)
+            curr_index, head = head, head + 1
+            curr_state = states[curr_index]
 
             # if this node is a goal, the return the solution immediately
-            if curr_state.is_goal():
+            if is_goal(curr_state):
 
                 # Yeah, we made it!!! Hoorrrayyy!!
-
-                # the path to this solution consits of instances of JUGState.
-                # There is something tricky here going around, if the path is
-                # right away used to build the solution then each state,
-                # independently printed would show the path leading to it, and
-                # that's not what we want. Indeed, all we want is a list of
-                # instances of JUGState which contain no path at all.
-                # Comprehension lists come in handy ...
-                solution =[jugstate.JUGState(state.get_smaller(), state.get_larger()) \
-                           for state in curr_state.get_path()]
-                return jugsolution.JUGSolution(solution)
+                yield jugsolution.from_path(problem, self._path(states, parents, curr_index))
+                continue
 
             # otherwise, generate all children
-            children = curr_state.children()
+            children = successors(curr_state)
+            self._expanded += 1
+            self._generated += len(children)
 
-            # because the current state has been expanded add it to the closed
-            # list
-            closed.add(curr_state)
-
-            # and add all children to the queue that has not been previously
-            # expanded
+            # and add all children to the queue that have not been seen before
             for child in children:
 
-                if child not in closed:
+                if child in seen:
+                    self._duplicates += 1
+                    continue
 
-                    # extend the path of this child with the current state
-                    child.set_path(copy.deepcopy(curr_state.get_path()))
-                    child += child
-                    queue.append(child)
+                # store the child in the arena along with a backpointer to its
+                # parent, which effectively inserts it in the queue
+                seen.add(child)
+                states.append(child)
+                parents.append(curr_index)
 
             # and go on until the queue is exhausted or a solution is found
 
-        # at this point, the queue has been exhausted, so return failure
-        return None
+    @jugbudget.bounded
+    def solve(self) -> jugsolution.JUGSolution:
+        """apply breadth-first search to solve this instance
+
+           it returns the solution as an instance of JUGSolution, or None if
+           there is no solution
+
+        """
+
+        # the first solution found by breadth-first search is optimal. If the
+        # queue is exhausted before finding any, then return failure
+        return next(self.iter_solutions(), None)
+
+    def _path(self, states: array.array, parents: array.array, index: int) -> list:
+        """return the path from the start state to the state stored at the given
+           location of the arena, by following backpointers
+
+        """
+
+        # walk backwards from the given location until the start state is
+        # reached, which is always the first state of the arena
+        path = [states[index]]
+        while index != 0:
+            index = parents[index]
+            path.append(states[index])
+
+        # states have been gathered from the goal to the start, so reverse them
+        path.reverse()
+        return path
+
+
+    def _set(self):
+        """return an empty set of packed states, either a Python set or a
+           bitmap (see JUGBitmap) if requested
+
+        """
+
+        if self._bitmap:
+            return jugbitmap.JUGBitmap(self._problem.get_nstates())
+        return set()
+
+    def _typecode(self) -> str:
+        """return the typecode of the arrays used to store packed states and
+           locations in the arena. If a bitmap is used, they are the smallest
+           unsigned integers which can store any of them, since both are less
+           than the number of states
+
+        """
+
+        if self._bitmap:
+            return jugbitmap.get_typecode(self._problem.get_nstates())
+        return 'q'
 
 
 # Local Variables:
@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# jugbibfs.py
+# Description:
+# -----------------------------------------------------------------------------
+#
+# Started on <sáb 17-10-2026 23:20:44.389120567 (1792279244)>
+# Carlos Linares López <carlos.linares@uc3m.es>
+#
+
+"""Implementation of a solver of the water jugs problem using bidirectional
+breadth-first search
+
+"""
+
+# imports
+# -----------------------------------------------------------------------------
+import jugbudget
+import jugproblem
+import jugsearch
+import jugsolution
+
+# constants
+# -----------------------------------------------------------------------------
+
+# backpointer of the roots of both search trees, i.e., the start state in the
+# forward search and the goal states in the backward search
+NO_PARENT = -1
+
+# classes
+# -----------------------------------------------------------------------------
+
+# -----------------------------------------------------------------------------
+# JUGBiBFS
+#
+# Implementation of bidirectional breadth-first search for solving the water
+# jugs problem
+# -----------------------------------------------------------------------------
+class JUGBiBFS(jugsearch.JUGSearch):
+    """Implementation of bidirectional breadth-first search for solving the
+       water jugs problem
+
+    """
+
+    def __init__(self, problem: jugproblem.JUGProblem):
+        """A solver of the water jugs problem using bidirectional breadth-first
+           search is initialized with the instance to solve which has to be an
+           instance of JUGProblem
+
+        """
+
+        super().__init__(problem)
+
+    @jugbudget.bounded
+    def solve(self) -> jugsolution.JUGSolution:
+        """apply bidirectional breadth-first search to solve this instance
+
+           it returns the solution as an instance of JUGSolution
+
+        """
+
+        # bidirectional search simultaneously runs two searches: a forward
+        # search from the start state, and a backward search from all goal
+        # states at once which uses the inverse operators (see
+        # JUGProblem.predecessors). Both searches proceed layer by layer, and
+        # in every iteration the smallest layer is expanded. The search
+        # finishes as soon as a node generated in one direction has been seen
+        # in the other one. Because the number of nodes grows with the depth,
+        # two searches meeting in the middle generally expand far fewer nodes
+        # than one search going all the way down to the goal.
+        #
+        # Note that as soon as a layer generates a node seen in the opposite
+        # direction, no shorter solution exists: otherwise, it would have been
+        # found when expanding any previous layer. Hence, all nodes meeting the
+        # opposite direction when expanding a layer yield solutions with the
+        # same length and the first one is returned. Thus, this algorithm is
+        # admissible as well
+        #
+        # Every direction keeps a dictionary which maps every node seen to its
+        # parent in that direction, i.e., the node it was generated from. In
+        # the backward direction, the parent of a node is indeed its successor
+        # towards the goal
+
+        # -- initialization
+        self._generated, self._duplicates, self._expanded = 0, 0, 0
+        problem = self._problem
+        start = problem.pack(problem.get_start())
+
+        # initialize the search tree of both directions
+        forward = {start: NO_PARENT}
+        backward = {goal: NO_PARENT for goal in problem.goals()}
+
+        # if the start state is a goal, then return it immediately
+        if start in backward:
+            return jugsolution.JUGSolution(problem.get_capacities(), problem.get_start(), [])
+
+        # and also initialize the current layer of both directions
+        forward_layer, backward_layer = [start], list(backward)
+        successors = self._get_successors()
+
+        # iterate until either direction is exhausted
+        while len(forward_layer) > 0 and len(backward_layer) > 0:
+
+            # expand the smallest layer, after checking the budget, if any, with
+            # the nodes in it
+            self._check(min(len(forward_layer), len(backward_layer)))
+            if len(forward_layer) <= len(backward_layer):
+                forward_layer, meeting = self._expand(forward_layer, forward, backward,
+                                                      successors)
+            else:
+                backward_layer, meeting = self._expand(backward_layer, backward, forward,
+                                                       problem.predecessors)
+
+            # if both searches met, then return the solution
+            if meeting is not None:
+
+                # Yeah, we made it!!! Hoorrrayyy!!
+                return jugsolution.from_path(problem, self._path(forward, backward, meeting))
+
+        # at this point, either direction has been exhausted, so return failure
+        return None
+
+    def _expand(self, layer: list, tree: dict, opposite: dict, successors):
+        """expand all nodes in the given layer of the given search tree using
+           the given successor function. It returns the next layer and the
+           first node seen in the opposite search tree, if any, or None
+           otherwise
+
+        """
+
+        # -- initialization
+        next_layer = []
+        meeting = None
+
+        for node in layer:
+
+            # generate all children of this node
+            children = successors(node)
+            self._expanded += 1
+            self._generated += len(children)
+
+            for child in children:
+
+                if child in tree:
+                    self._duplicates += 1
+                    continue
+
+                # add this child to the search tree of this direction, and check
+                # whether it was seen in the opposite direction
+                tree[child] = node
+                next_layer.append(child)
+                if child in opposite:
+                    return next_layer, child
+
+        return next_layer, meeting
+
+    def _path(self, forward: dict, backward: dict, meeting: int) -> list:
+        """return the path from the start state to a goal state through the
+           given node, which has been seen in both directions
+
+        """
+
+        # first, walk backwards from the meeting node to the start state in the
+        # forward search tree
+        path = []
+        node = meeting
+        while node != NO_PARENT:
+            path.append(node)
+            node = forward[node]
+        path.reverse()
+
+        # next, walk forward from the meeting node to a goal state in the
+        # backward search tree
+        node = backward[meeting]
+        while node != NO_PARENT:
+            path.append(node)
+            node = backward[node]
+
+        return path
+
+
+# Local Variables:
+# mode:python
+# fill-column:80
+# End:
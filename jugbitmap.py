@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# jugbitmap.py
+# Description:
+# -----------------------------------------------------------------------------
+#
+# Started on <dom 18-10-2026 05:02:16.350991207 (1792299736)>
+# Carlos Linares López <carlos.linares@uc3m.es>
+#
+
+"""Set of packed states stored as a bitmap with one bit per state
+
+"""
+
+# imports
+# -----------------------------------------------------------------------------
+import array
+
+# error messages
+# -----------------------------------------------------------------------------
+CRITICAL_WRONG_SIZE = "The size of a bitmap shall be a non-negative integer. Aborting ..."
+
+# classes
+# -----------------------------------------------------------------------------
+
+# -----------------------------------------------------------------------------
+# JUGBitmap
+#
+# Set of packed states stored as a bitmap with one bit per state
+# -----------------------------------------------------------------------------
+class JUGBitmap(object):
+    """Set of packed states stored as a bitmap with one bit per state. It
+       provides the same operations than the sets used by search algorithms,
+       i.e., membership, insertion and deletion
+
+    """
+
+    def __init__(self, size: int):
+        """A bitmap is initialized with the number of states, all of them
+           being absent, and packed states shall be less than it (see
+           JUGProblem.get_nstates)
+
+        """
+
+        # verify the size of the bitmap
+        if not isinstance(size, int) or size < 0:
+            raise ValueError(CRITICAL_WRONG_SIZE)
+
+        # packed states are dense integers in the range [0, size), so that every
+        # state is mapped to a bit of a bytearray, i.e., the bit at position
+        # key & 7 of the byte at location key >> 3. Membership then takes one
+        # bit per state, whereas Python sets take dozens of bytes per state
+        # (the hash table itself plus one object per integer)
+        self._size = size
+        self._bits = bytearray((size + 7) >> 3)
+
+    def __contains__(self, key: int) -> bool:
+        """return True if the given packed state is in this bitmap"""
+
+        return (self._bits[key >> 3] >> (key & 7)) & 1 == 1
+
+    def add(self, key: int):
+        """add the given packed state to this bitmap"""
+
+        self._bits[key >> 3] |= 1 << (key & 7)
+
+    def discard(self, key: int):
+        """remove the given packed state from this bitmap, if present"""
+
+        self._bits[key >> 3] &= ~(1 << (key & 7))
+
+    def get_size(self) -> int:
+        """return the number of states this bitmap can store"""
+
+        return self._size
+
+
+# functions
+# -----------------------------------------------------------------------------
+def get_typecode(size: int) -> str:
+    """return the typecode of the smallest array of unsigned integers which can
+       store any value less than the given size
+
+    """
+
+    for typecode in ('H', 'I', 'L', 'Q'):
+        if size <= 1 << (8 * array.array(typecode).itemsize):
+            return typecode
+
+    return 'Q'
+
+
+# Local Variables:
+# mode:python
+# fill-column:80
+# End:
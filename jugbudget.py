@@ -0,0 +1,308 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# jugbudget.py
+# Description:
+# -----------------------------------------------------------------------------
+#
+# Started on <dom 18-10-2026 11:03:48.120554937 (1792321428)>
+# Carlos Linares López <carlos.linares@uc3m.es>
+#
+
+"""Budgets of time, nodes and memory, and cancellation of search algorithms
+
+"""
+
+# imports
+# -----------------------------------------------------------------------------
+import functools
+import os
+import resource
+import time
+
+# error messages
+# -----------------------------------------------------------------------------
+CRITICAL_WRONG_LIMIT = "Limits of a budget shall be positive numbers. Aborting ..."
+
+# constants
+# -----------------------------------------------------------------------------
+
+# reasons why a search is interrupted
+TIME, NODES, MEMORY, CANCELLED = "time", "nodes", "memory", "cancelled"
+
+# by default, budgets are checked once every this number of nodes expanded
+INTERVAL = 256
+
+# classes
+# -----------------------------------------------------------------------------
+
+# -----------------------------------------------------------------------------
+# JUGToken
+#
+# Token used to cancel a search from another thread or coroutine
+# -----------------------------------------------------------------------------
+class JUGToken(object):
+    """Token used to cancel a search from another thread or coroutine. Searches
+       check it cooperatively (see JUGBudget), so that they stop shortly after
+       it is cancelled
+
+    """
+
+    def __init__(self):
+        """A token is initialized as not cancelled"""
+
+        self._cancelled = False
+
+    def cancel(self):
+        """cancel all searches using this token"""
+
+        self._cancelled = True
+
+    def is_cancelled(self) -> bool:
+        """return True if this token has been cancelled"""
+
+        return self._cancelled
+
+
+# -----------------------------------------------------------------------------
+# JUGBudget
+#
+# Budget of time, nodes and memory of a search
+# -----------------------------------------------------------------------------
+class JUGBudget(object):
+    """Budget of time (in seconds), nodes expanded and memory (in bytes) of a
+       search, along with a cancellation token. Any of them can be None, in
+       which case it is not bounded. The same budget can be used in many
+       searches, as it is restarted every time a search starts
+
+    """
+
+    def __init__(self, time: float = None, nodes: int = None, memory: int = None,
+                 token: JUGToken = None, interval: int = INTERVAL):
+        """A budget is initialized with the maximum time (in seconds), nodes
+           expanded and memory (in bytes, beyond the memory used when the
+           search starts) of every search, and a cancellation token. Limits
+           are checked once every the given number of nodes expanded
+
+        """
+
+        # verify all limits are positive
+        for limit in (time, nodes, memory, interval):
+            if limit is not None and limit <= 0:
+                raise ValueError(CRITICAL_WRONG_LIMIT)
+
+        # store the data members of this instance
+        self._time, self._nodes, self._memory = time, nodes, memory
+        self._token, self._interval = token, interval
+
+        # the budget of every search starts when it starts (see start)
+        self._started, self._baseline = None, None
+
+    def check(self, expanded: int):
+        """raise JUGBudgetInterrupt if the search that started last (see start)
+           exceeded this budget when expanding the given number of nodes, or if
+           it has been cancelled
+
+        """
+
+        # budgets which were not explicitly started, start with their first
+        # check
+        if self._started is None:
+            self.start()
+
+        if self._token is not None and self._token.is_cancelled():
+            raise JUGBudgetInterrupt(CANCELLED)
+        if self._nodes is not None and expanded > self._nodes:
+            raise JUGBudgetInterrupt(NODES)
+        if self._time is not None and time.perf_counter() - self._started >= self._time:
+            raise JUGBudgetInterrupt(TIME)
+        if self._memory is not None and _memory() - self._baseline >= self._memory:
+            raise JUGBudgetInterrupt(MEMORY)
+
+    def get_elapsed(self) -> float:
+        """return the time elapsed (in seconds) since the last search started"""
+
+        return time.perf_counter() - self._started
+
+    def get_interval(self) -> int:
+        """return the number of nodes expanded between two checks"""
+
+        return self._interval
+
+    def get_memory(self) -> int:
+        """return the maximum memory (in bytes) of every search"""
+
+        return self._memory
+
+    def get_nodes(self) -> int:
+        """return the maximum number of nodes expanded by every search"""
+
+        return self._nodes
+
+    def get_time(self) -> float:
+        """return the maximum time (in seconds) of every search"""
+
+        return self._time
+
+    def get_token(self) -> JUGToken:
+        """return the cancellation token of this budget"""
+
+        return self._token
+
+    def start(self):
+        """start the budget of a new search"""
+
+        self._started = time.perf_counter()
+        self._baseline = _memory() if self._memory is not None else None
+
+
+# -----------------------------------------------------------------------------
+# JUGBudgetExceeded
+#
+# Result of a search which exceeded its budget
+# -----------------------------------------------------------------------------
+class JUGBudgetExceeded(object):
+    """Result of a search which exceeded its budget, or which was cancelled,
+       with the statistics of the search when it was interrupted
+
+    """
+
+    def __init__(self, reason: str, expanded: int, generated: int, duplicates: int,
+                 elapsed: float):
+        """A result of a search which exceeded its budget is initialized with
+           the reason (either TIME, NODES, MEMORY or CANCELLED), the number of
+           nodes expanded, generated and discarded as duplicates, and the time
+           elapsed (in seconds) until it was interrupted
+
+        """
+
+        self._reason = reason
+        self._expanded, self._generated, self._duplicates = expanded, generated, duplicates
+        self._elapsed = elapsed
+
+    def __str__(self) -> str:
+        """return a string representation of this result"""
+
+        return " Budget exceeded ({0}) after expanding {1} nodes in {2:.3f} seconds".format(
+            self._reason, self._expanded, self._elapsed)
+
+    def get_duplicates(self) -> int:
+        """return the number of nodes discarded as duplicates"""
+
+        return self._duplicates
+
+    def get_elapsed(self) -> float:
+        """return the time elapsed (in seconds) until the search was
+           interrupted
+
+        """
+
+        return self._elapsed
+
+    def get_expanded(self) -> int:
+        """return the number of nodes expanded"""
+
+        return self._expanded
+
+    def get_generated(self) -> int:
+        """return the number of nodes generated"""
+
+        return self._generated
+
+    def get_reason(self) -> str:
+        """return the reason why the search was interrupted"""
+
+        return self._reason
+
+
+# -----------------------------------------------------------------------------
+# JUGBudgetInterrupt
+#
+# Exception raised to interrupt a search which exceeded its budget
+# -----------------------------------------------------------------------------
+class JUGBudgetInterrupt(Exception):
+    """Exception raised to interrupt a search which exceeded its budget. It is
+       caught by the search algorithm, which then returns an instance of
+       JUGBudgetExceeded (see bounded)
+
+    """
+
+    def __init__(self, reason: str):
+        """An interruption is initialized with its reason"""
+
+        super().__init__(reason)
+        self.reason = reason
+
+
+# functions
+# -----------------------------------------------------------------------------
+def bounded(solve):
+    """decorator of the method solve of search algorithms (see JUGSearch),
+       which starts their budget, if any, and returns an instance of
+       JUGBudgetExceeded if it is exceeded
+
+    """
+
+    @functools.wraps(solve)
+    def wrapper(self):
+        budget = self.get_budget()
+        if budget is None:
+            return solve(self)
+
+        # searches whose token was cancelled before they started do not
+        # expand any node at all
+        budget.start()
+        try:
+            budget.check(0)
+            return solve(self)
+        except JUGBudgetInterrupt as interrupt:
+            return JUGBudgetExceeded(interrupt.reason, self.get_expanded(), self.get_generated(),
+                                     self.get_duplicates(), budget.get_elapsed())
+
+    return wrapper
+
+
+def observe_budget(budget: JUGBudget, successors):
+    """return a successor function which behaves exactly as the given one (see
+       JUGProblem.successors) but checks the given budget once every its
+       interval of nodes expanded
+
+    """
+
+    # the number of nodes expanded is counted here, so that search algorithms
+    # need not be modified at all. The budget is checked before expanding
+    # every node beyond the maximum number of nodes, so that it is never
+    # exceeded
+    interval = budget.get_interval()
+    nodes = budget.get_nodes() if budget.get_nodes() is not None else float("inf")
+    expanded = 0
+
+    def wrapper(key: int) -> list:
+        nonlocal expanded
+        expanded += 1
+        if expanded % interval == 0 or expanded > nodes:
+            budget.check(expanded)
+        return successors(key)
+
+    return wrapper
+
+
+def _memory() -> int:
+    """return the memory currently used by this process (in bytes). If it can
+       not be computed, the peak of memory used is returned instead
+
+    """
+
+    # the resident set size is given in pages in Linux. In other systems, the
+    # peak of the resident set size is used instead
+    try:
+        with open("/proc/self/statm") as stream:
+            return int(stream.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+# Local Variables:
+# mode:python
+# fill-column:80
+# End:
@@ -0,0 +1,307 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# jugcache.py
+# Description:
+# -----------------------------------------------------------------------------
+#
+# Started on <dom 18-10-2026 02:14:31.208846113 (1792289671)>
+# Carlos Linares López <carlos.linares@uc3m.es>
+#
+
+"""In-process cache of the solutions found by any search algorithm, with a
+bounded size and least-recently-used eviction
+
+"""
+
+# imports
+# -----------------------------------------------------------------------------
+import array
+import collections
+
+import jugbudget
+import jugproblem
+import jugsolution
+import jugsolvers
+
+# error messages
+# -----------------------------------------------------------------------------
+CRITICAL_WRONG_MAXSIZE = "The size of the cache shall be a positive integer. Aborting ..."
+CRITICAL_WRONG_MAXTREES = "The number of trees and states of the cache shall be non-negative integers. Aborting ..."
+
+# constants
+# -----------------------------------------------------------------------------
+
+# backpointer of the start state in the arena of nodes
+NO_PARENT = -1
+
+# search algorithms whose solutions are exactly those found by breadth-first
+# search, so that they can be taken from a breadth-first search tree (see
+# JUGTree)
+TREE_SOLVERS = ("breadth-first", "breadth-first-numpy")
+
+# classes
+# -----------------------------------------------------------------------------
+
+# -----------------------------------------------------------------------------
+# JUGTree
+#
+# Breadth-first search tree with all states reachable from a start state, which
+# can answer any target volume
+# -----------------------------------------------------------------------------
+class JUGTree(object):
+    """Breadth-first search tree with all states reachable from a start state,
+       which can answer any target volume
+
+    """
+
+    def __init__(self, problem: jugproblem.JUGProblem):
+        """A breadth-first search tree is initialized with an instance of
+           JUGProblem. Its target is ignored, and all states reachable from its
+           start state are generated right away
+
+        """
+
+        # the tree is stored in an arena exactly as in breadth-first search (see
+        # JUGBFS), but the queue is exhausted instead of stopping at the first
+        # goal. Because states are stored in the very same order, the first
+        # state of the arena which is a goal is precisely the one which would be
+        # found by breadth-first search, with the same path
+        self._problem = problem
+        successors = problem.successors
+        start = problem.pack(problem.get_start())
+        self._states = array.array('q', [start])
+        self._parents = array.array('q', [NO_PARENT])
+        seen = {start}
+        head = 0
+        while head < len(self._states):
+            for child in successors(self._states[head]):
+                if child not in seen:
+                    seen.add(child)
+                    self._states.append(child)
+                    self._parents.append(head)
+            head += 1
+
+        # for every goal, the location in the arena of the first state reaching
+        # every target is computed only the first time it is requested
+        self._firsts = {}
+
+    def __len__(self) -> int:
+        """return the number of states in this tree"""
+
+        return len(self._states)
+
+    def solve(self, problem: jugproblem.JUGProblem) -> jugsolution.JUGSolution:
+        """return the solution found by breadth-first search for the given
+           instance, which should have the same capacities and start state
+           than this tree, or None if it has no solution
+
+        """
+
+        # compute, if not done before, the location of the first state reaching
+        # every target for the goal of the given instance
+        goal = problem.get_goal()
+        if goal not in self._firsts:
+            self._firsts[goal] = self._first(goal)
+
+        index = self._firsts[goal].get(problem.get_target())
+        if index is None:
+            return None
+
+        # walk backwards from the goal until the start state (which has no
+        # parent) is reached
+        path = []
+        while index != NO_PARENT:
+            path.append(self._states[index])
+            index = self._parents[index]
+        path.reverse()
+
+        return jugsolution.from_path(self._problem, path)
+
+    def _first(self, goal) -> dict:
+        """return a dictionary which maps every target volume that can be
+           reached with the given goal to the location of the first state in
+           the arena which reaches it
+
+        """
+
+        firsts = {}
+        for index, key in enumerate(self._states):
+            volumes = self._problem.unpack_volumes(key)
+            if goal == jugproblem.GOAL_ANY:
+                targets = volumes
+            elif goal == jugproblem.GOAL_TOTAL:
+                targets = (sum(volumes),)
+            else:
+                targets = (volumes[goal],)
+            for target in targets:
+                firsts.setdefault(target, index)
+
+        return firsts
+
+
+# -----------------------------------------------------------------------------
+# JUGCache
+#
+# In-process cache of the solutions found by any search algorithm, with a
+# bounded size and least-recently-used eviction
+# -----------------------------------------------------------------------------
+class JUGCache(object):
+    """In-process cache of the solutions found by any search algorithm, with a
+       bounded size and least-recently-used eviction. Besides, breadth-first
+       search trees are kept for start states which are queried repeatedly,
+       so that further queries with the same capacities and start state are
+       answered without searching, whatever their target
+
+    """
+
+    def __init__(self, maxsize: int = 128, maxtrees: int = 8, maxstates: int = 1 << 17):
+        """A cache is initialized with the maximum number of solutions it
+           stores and, separately, the maximum number of breadth-first search
+           trees. Trees are only built for instances with at most the given
+           number of states (see JUGProblem.get_nstates)
+
+        """
+
+        # verify the size of the cache
+        if not isinstance(maxsize, int) or maxsize <= 0:
+            raise ValueError(CRITICAL_WRONG_MAXSIZE)
+        for bound in (maxtrees, maxstates):
+            if not isinstance(bound, int) or bound < 0:
+                raise ValueError(CRITICAL_WRONG_MAXTREES)
+
+        # store the data members of this instance. Ordered dictionaries are used
+        # to keep entries sorted from the least to the most recently used one.
+        # Besides the trees, the start states queried so far are remembered to
+        # decide when a tree pays off
+        self._maxsize, self._maxtrees, self._maxstates = maxsize, maxtrees, maxstates
+        self._solutions = collections.OrderedDict()
+        self._trees = collections.OrderedDict()
+        self._starts = collections.OrderedDict()
+
+        # and initialize the statistics of the cache
+        self._hits, self._misses = 0, 0
+
+    def __len__(self) -> int:
+        """return the number of solutions currently stored in this cache"""
+
+        return len(self._solutions)
+
+    def clear(self):
+        """remove all entries and reset the statistics of this cache"""
+
+        self._solutions.clear()
+        self._trees.clear()
+        self._starts.clear()
+        self._hits, self._misses = 0, 0
+
+    def get_hits(self) -> int:
+        """return the number of queries answered without searching"""
+
+        return self._hits
+
+    def get_maxsize(self) -> int:
+        """return the maximum number of entries of this cache"""
+
+        return self._maxsize
+
+    def get_maxstates(self) -> int:
+        """return the maximum number of states of the instances whose trees are
+           stored
+
+        """
+
+        return self._maxstates
+
+    def get_maxtrees(self) -> int:
+        """return the maximum number of breadth-first search trees of this
+           cache
+
+        """
+
+        return self._maxtrees
+
+    def get_misses(self) -> int:
+        """return the number of queries which required searching"""
+
+        return self._misses
+
+    def solve(self, name: str, problem: jugproblem.JUGProblem,
+              budget: jugbudget.JUGBudget = None, **options) -> jugsolution.JUGSolution:
+        """return the solution of the given instance found by the search
+           algorithm with the given name and options (see jugsolvers.create),
+           or None if it has no solution. The search is performed only if the
+           same query has not been answered before. If a budget is given and
+           the search exceeds it, an instance of JUGBudgetExceeded is returned
+           instead, which is not stored in the cache
+
+        """
+
+        # queries are identified by the search algorithm, the instance and only
+        # those options accepted by the search algorithm
+        accepted = jugsolvers.get_options(name)
+        capacities, start = problem.get_capacities(), problem.get_start().get_volumes()
+        key = (name, capacities, start, problem.get_target(), problem.get_goal(),
+               tuple(sorted((option, value) for option, value in options.items()
+                            if option in accepted and value is not None)))
+
+        # if the same query was answered before, then return its solution
+        if key in self._solutions:
+            self._hits += 1
+            self._solutions.move_to_end(key)
+            return self._solutions[key]
+
+        # trees can only answer queries of those search algorithms whose
+        # solutions can be taken from them. Because trees are built by
+        # exhausting the state space, they are not used when searches are
+        # bounded
+        start_key = (capacities, start)
+        trees = name in TREE_SOLVERS and budget is None
+
+        # if a breadth-first search tree exists from the same start state, then
+        # take the solution from it
+        if trees and start_key in self._trees:
+            self._hits += 1
+            self._trees.move_to_end(start_key)
+            solution = self._trees[start_key].solve(problem)
+
+        # otherwise, a tree is built only if the same start state was queried
+        # before and the state space is small enough, since building it takes
+        # far longer than a search which finds a goal early. In any other case,
+        # search
+        else:
+            self._misses += 1
+            if trees and start_key in self._starts and self._maxtrees > 0 and \
+               problem.get_nstates() <= self._maxstates:
+                self._store(self._trees, start_key, JUGTree(problem), self._maxtrees)
+                solution = self._trees[start_key].solve(problem)
+            else:
+                engine = jugsolvers.create(name, problem, **options)
+                engine.set_budget(budget)
+                solution = engine.solve()
+                if isinstance(solution, jugbudget.JUGBudgetExceeded):
+                    return solution
+                if trees:
+                    self._store(self._starts, start_key, None, self._maxsize)
+
+        # solutions are never modified once created, so that they are returned
+        # as they are stored
+        self._store(self._solutions, key, solution, self._maxsize)
+        return solution
+
+    def _store(self, entries: collections.OrderedDict, key, value, maxsize: int):
+        """store the given value in entries, evicting the least recently used
+           entry if there are more than the given number of entries
+
+        """
+
+        entries[key] = value
+        entries.move_to_end(key)
+        if len(entries) > maxsize:
+            entries.popitem(last=False)
+
+
+# Local Variables:
+# mode:python
+# fill-column:80
+# End:
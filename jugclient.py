@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+#
+# jugclient.py
+# Description:
+# -----------------------------------------------------------------------------
+#
+# Started on <dom 18-10-2026 09:47:31.604118275 (1792316851)>
+# Carlos Linares López <carlos.linares@uc3m.es>
+#
+
+"""Solving the water jugs problem with a server (see jugserver.py). It accepts
+the same arguments than jugs.py and shows the same output
+
+"""
+
+# imports
+# -----------------------------------------------------------------------------
+import json
+import os
+import socket
+import time
+
+import jugparser
+import jugs
+import jugserver
+import jugstate
+
+# error messages
+# -----------------------------------------------------------------------------
+CRITICAL_NO_SERVER = "No server is listening on '{0}'. Start one with jugserver.py, or set the environment variable JUGS_SOCKET. Aborting ..."
+
+# functions
+# -----------------------------------------------------------------------------
+def request(message: dict, path: str = None) -> dict:
+    """send the given request to the server listening on the Unix domain socket
+       with the given path and return its response. By default, the path is
+       taken from the environment variable JUGS_SOCKET or, if it is not
+       defined, the default path of the server is used
+
+    """
+
+    path = os.environ.get("JUGS_SOCKET", jugserver.DEFAULT_SOCKET) if path is None else path
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as connection:
+        try:
+            connection.connect(path)
+        except (FileNotFoundError, ConnectionRefusedError):
+            raise ConnectionError(CRITICAL_NO_SERVER.format(path))
+        connection.sendall((json.dumps(message) + '\n').encode())
+        with connection.makefile('r') as stream:
+            return json.loads(stream.readline())
+
+
+# main
+# -----------------------------------------------------------------------------
+def main():
+    """main body"""
+
+    # invoke the parser. Note that the instance is created here just to verify
+    # the arguments given, exactly as jugs.py does
+    params = jugparser.JUGParser().parse()
+    problem = jugs.get_problem(params)
+
+    # and request the server to solve it with the same options and budget, if
+    # any
+    message = {"capacities": problem.get_capacities(),
+               "initial": problem.get_start().get_volumes(),
+               "target": problem.get_target(),
+               "goal": problem.get_goal(),
+               "algorithm": params.algorithm,
+               "precheck": params.precheck,
+               "options": {"closed": params.closed, "heuristic": params.heuristic,
+                           "cache_dir": params.cache_dir, "bitmap": params.bitmap,
+                           "cost": params.cost}}
+    if any(bound is not None for bound in (params.max_time, params.max_nodes, params.max_memory)):
+        message["budget"] = {"time": params.max_time, "nodes": params.max_nodes,
+                             "memory": params.max_memory}
+    st = time.time()
+    response = request(message)
+    et = time.time()
+
+    if "error" in response:
+        raise ValueError(response["error"])
+
+    # searches exceeding their budget are reported exactly as jugs.py does
+    # (see JUGBudgetExceeded)
+    if "budget" in response:
+        print(" Budget exceeded ({0}) after expanding {1} nodes in {2:.3f} seconds".format(
+            response["budget"], response["expanded"], response["elapsed"]))
+    elif response["solution"] is None:
+        print(" No solution found!")
+    else:
+        print(" -- ".join(str(jugstate.JUGState(*volumes)) for volumes in response["solution"]))
+
+    # the cost of solutions is shown only if the operators have a cost
+    if params.cost is not None and response.get("solution") is not None:
+        print("Cost: {0}".format(response["cost"]))
+
+    print("Elapsed time: {:.3f} seconds".format(et - st))
+
+
+# -----------------------------------------------------------------------------
+if __name__ == '__main__':
+
+    main()
+
+
+# Local Variables:
+# mode:python
+# fill-column:80
+# End:
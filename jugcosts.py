@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# jugcosts.py
+# Description:
+# -----------------------------------------------------------------------------
+#
+# Started on <dom 18-10-2026 11:48:22.307915264 (1792324102)>
+# Carlos Linares López <carlos.linares@uc3m.es>
+#
+
+"""Costs of the operators of the water jugs problem, used by cost-aware search
+algorithms
+
+"""
+
+# imports
+# -----------------------------------------------------------------------------
+import jugproblem
+
+# error messages
+# -----------------------------------------------------------------------------
+CRITICAL_UNKNOWN_COST = "Unknown cost '{0}'. Aborting ..."
+CRITICAL_WRONG_OPERATOR_COSTS = "Operator costs shall be given as three non-negative ints: the cost of emptying, filling and pouring. Aborting ..."
+
+# functions
+# -----------------------------------------------------------------------------
+
+# All cost functions receive the instance to solve and the volumes of every jug
+# in the parent and the child generated from it (see JUGProblem.unpack_volumes)
+# and return the cost of the operator applied, which has to be a non-negative
+# int. Note that the operator needs not be given, as it is recognized by the
+# total volume of water: it decreases when emptying a jug, increases when
+# filling it up, and it is preserved when pouring water from one jug to another
+def unit(problem: jugproblem.JUGProblem, parent, child) -> int:
+    """return one for every operator. With this cost, optimal solutions are the
+       shortest ones
+
+    """
+
+    return 1
+
+
+def volume(problem: jugproblem.JUGProblem, parent, child) -> int:
+    """return the volume of water moved by the operator, either emptied,
+       filled up or poured
+
+    """
+
+    # the volume moved is the volume lost by the jugs which lose water, or that
+    # gained by those which gain water, whichever is larger, i.e., the volume
+    # poured from one jug to another is counted only once
+    gained = sum(max(0, after - before) for before, after in zip(parent, child))
+    lost = sum(max(0, before - after) for before, after in zip(parent, child))
+    return max(gained, lost)
+
+
+def water(problem: jugproblem.JUGProblem, parent, child) -> int:
+    """return the volume of water taken from the tap, i.e., the volume filled up
+       by the operator, and zero for all others
+
+    """
+
+    return max(0, sum(child) - sum(parent))
+
+
+def operators(empty: int, fill: int, pour: int):
+    """return a cost function which returns the given costs for emptying,
+       filling up and pouring water, respectively
+
+    """
+
+    # verify all costs are non-negative ints
+    for cost in (empty, fill, pour):
+        if not isinstance(cost, int) or cost < 0:
+            raise ValueError(CRITICAL_WRONG_OPERATOR_COSTS)
+
+    def cost(problem: jugproblem.JUGProblem, parent, child) -> int:
+        difference = sum(child) - sum(parent)
+        if difference < 0:
+            return empty
+        if difference > 0:
+            return fill
+        return pour
+
+    return cost
+
+
+# globals
+# -----------------------------------------------------------------------------
+
+# all costs available, indexed by their name
+COSTS = {"unit": unit,
+         "volume": volume,
+         "water": water}
+
+
+def get_cost(cost):
+    """return the cost function with the given name. Besides, costs can be
+       given per operator, either as a sequence or a string with three
+       non-negative ints separated by commas: the cost of emptying, filling
+       up and pouring water (see operators). For the sake of extensibility,
+       callables are returned as they are
+
+    """
+
+    if callable(cost):
+        return cost
+    if isinstance(cost, str) and ',' in cost:
+        try:
+            cost = [int(value) for value in cost.split(',')]
+        except ValueError:
+            raise ValueError(CRITICAL_WRONG_OPERATOR_COSTS)
+    if isinstance(cost, (list, tuple)):
+        if len(cost) != 3:
+            raise ValueError(CRITICAL_WRONG_OPERATOR_COSTS)
+        return operators(*cost)
+    if cost not in COSTS:
+        raise ValueError(CRITICAL_UNKNOWN_COST.format(cost))
+
+    return COSTS[cost]
+
+
+def get_path_cost(problem: jugproblem.JUGProblem, solution, cost) -> int:
+    """return the cost of the given solution of the given instance, i.e., the
+       sum of the cost of every operator applied with the given cost (see
+       get_cost). Note that search algorithms which ignore costs return
+       solutions whose cost is just their number of steps
+
+    """
+
+    cost = get_cost(cost)
+    states = [state.get_volumes() for state in solution]
+    return sum(cost(problem, parent, child) for parent, child in zip(states, states[1:]))
+
+
+# Local Variables:
+# mode:python
+# fill-column:80
+# End:
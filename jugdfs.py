@@ -16,13 +16,12 @@ problem
 
 # imports
 # -----------------------------------------------------------------------------
-import jugstate
+import jugbitmap
+import jugbudget
+import jugproblem
+import jugsearch
 import jugsolution
 
-# error messages
-# -----------------------------------------------------------------------------
-CRITICAL_WRONG_START_TYPE = "The start state shall be an instance of a JUGState. Aborting ..."
-
 # classes
 # -----------------------------------------------------------------------------
 
@@ -31,87 +30,202 @@ CRITICAL_WRONG_START_TYPE = "The start state shall be an instance of a JUGState.
 #
 # Implementation of depth-first search (DFS) for solving the water jugs problem
 # -----------------------------------------------------------------------------
-class JUGDFS(object):
+class JUGDFS(jugsearch.JUGSearch):
     """Implementation of depth-first search (DFS) for solving the water jugs
        problem
 
     """
 
-    def __init__(self, start: jugstate.JUGState):
+    def __init__(self, problem: jugproblem.JUGProblem, closed: bool = False,
+                 bitmap: bool = False):
         """A solver of the water jugs problem using depth-first search is
-           initialized with a start state which has to be an instance of a
-           JUGState
+           initialized with the instance to solve which has to be an instance
+           of JUGProblem. If closed is True, then every state is expanded at
+           most once, i.e., states visited in other branches are pruned as
+           well. If bitmap is True, then states in the current path (and in the
+           closed list) are stored in a bitmap (see JUGBitmap) instead of a set
 
         """
 
-        # verify the type of the start state
-        if not isinstance(start, jugstate.JUGState):
-            raise TypeError(CRITICAL_WRONG_START_TYPE)
+        super().__init__(problem)
 
         # store the data members of this instance
-        self._start = start
+        self._closed = closed
+        self._bitmap = bitmap
 
-    def solve(self, state: jugstate.JUGState = None, path: list = []) -> jugsolution.JUGSolution:
-        """apply depth-first search to solve this instance
+    def iter_reachable(self):
+        """return a generator with a pair (state, depth) for every state
+           reachable from the start state of this instance, in the same order
+           they are generated by depth-first search, where depth is the length
+           of the path found by depth-first search from the start state, which
+           is not necessarily the shortest one. States are returned as
+           instances of JUGState. The target is ignored
 
-           it returns the solution as an instance of JUGSolution
+        """
+
+        # this is the very same depth-first search than iter_solutions, but
+        # every state is visited only once, whether a closed list has been
+        # requested or not (otherwise, states would be visited once per path
+        # leading to them), and the search never stops at goal states. Because
+        # the current path is not needed, the stack suffices, and the depth of
+        # every state is its size
+        self._generated, self._duplicates, self._expanded = 0, 0, 0
+        self._successors = self._get_successors()
+        problem = self._problem
+        start = problem.pack(problem.get_start())
+        seen = self._set()
+        seen.add(start)
+        stack = [iter(self._expand(start))]
+        yield problem.get_start(), 0
+
+        while len(stack) > 0:
+
+            child = next(stack[-1], None)
+            if child is None:
+                stack.pop()
+                continue
+
+            if child in seen:
+                self._duplicates += 1
+                continue
+
+            seen.add(child)
+            yield problem.unpack(child), len(stack)
+            stack.append(iter(self._expand(child)))
+
+    def iter_solutions(self):
+        """return a generator with all solutions found by depth-first search,
+           in the same order they are found, as instances of JUGSolution. The
+           first one is precisely the solution returned by solve(). Without a
+           closed list, all paths from the start state to any goal state
+           without cycles are generated, which might be a huge number. With a
+           closed list, only one per goal state is generated. Solutions never
+           traverse other goal states
 
         """
 
-        # depth-first search is implemented using a stack. For this, the system
-        # stack used in recursive functions can be used, and thus, this solver
-        # is implemented recursively. Note the two arguments to this function
-        # are the current state (which might be None) and the path from the
-        # start state.
+        # depth-first search is implemented using a stack. The system stack used
+        # in recursive functions could be used, but then every step down in
+        # depth would consume one frame of the Python interpreter, whose depth
+        # is limited (by default, to a thousand frames). Because solutions can
+        # be much longer than that (e.g., with capacities 997 and 1009), this
+        # solver is implemented iteratively with an explicit stack.
         #
-        # If the start state is not given, then the start given to the
-        # constructor is used instead. When invoking this method for the first
-        # time, the path shall be empty indeed. This provides a clear interface
-        # to third-party users
+        # Every item in the stack is an iterator over the children of a state in
+        # the current path, so that the top of the stack always provides the
+        # next child to explore. Along with it, the current path is stored both
+        # as a list (to return the solution) and as a set (to check in constant
+        # time whether a child is already in the current path). States are not
+        # stored as instances of JUGState but packed into integers (see
+        # JUGProblem.pack), and they are only unpacked to return the solution
 
         # importantly, depth-first search is generally invoked with a max_depth
         # parameter which bounds the maximum depth ---otherwise, the algorithm
         # might fall into an infinite loop. This is not necessary here, however,
-        # since the underlying graph state is finite
+        # since the underlying graph state is finite and cycles are avoided
+
+        # -- initialization
+        self._generated, self._duplicates, self._expanded = 0, 0, 0
+        problem = self._problem
+        is_goal = self._get_is_goal()
+        self._successors = self._get_successors()
+        start = problem.pack(problem.get_start())
+
+        # base case - the start state is the goal state. Any other solution
+        # would traverse it, so that there are no more solutions
+        if is_goal(start):
+            yield jugsolution.JUGSolution(problem.get_capacities(), problem.get_start(), [])
+            return
+
+        # the current path consists initially of the start state only, and the
+        # stack contains only an iterator over its children
+        path = [start]
+        on_path = self._set()
+        on_path.add(start)
+        stack = [iter(self._expand(start))]
+
+        # if requested, states are never expanded twice, even if they were
+        # reached along a different path. This is known as a closed list. Note
+        # that this might prune paths leading to solutions which are shorter
+        # than those found otherwise, but the algorithm is still complete and
+        # runs in time linear in the size of the state space
+        closed = self._set() if self._closed else None
+        if closed is not None:
+            closed.add(start)
+
+        # iterate until the stack is exhausted
+        while len(stack) > 0:
+
+            # get the next child of the state at the top of the stack
+            child = next(stack[-1], None)
+
+            # if all children of this state have already been explored then
+            # backtrack, removing it from the current path
+            if child is None:
+                stack.pop()
+                on_path.discard(path.pop())
+                continue
+
+            # skip those cases where this child was already explored in the
+            # current path (or anywhere, if a closed list is used)
+            if child in on_path or (closed is not None and child in closed):
+                self._duplicates += 1
+                continue
 
-        # first and foremost, if no state has been given then start with the
-        # start state given to the constructor. Type verification skipped ...
-        curr_state = state if state else self._start
+            # if this child is a goal then return the current path extended
+            # with it. If another solution is requested, goals are not
+            # expanded, but they are added to the closed list, if any, so that
+            # they are not found again along a different path
+            if is_goal(child):
 
-        # base case - the current state is the goal state
-        if curr_state.is_goal():
+                # Yeah, solution found!!!!
+                yield jugsolution.from_path(problem, path + [child])
+                if closed is not None:
+                    closed.add(child)
+                continue
 
-            # Yeah, solution found!!!! Build a solution from the path built
-            # explicitly adding the start state. This is necessary because
-            # originally the list is by default empty but it would be nice to
-            # show the start state as well
-            return jugsolution.JUGSolution([jugstate.JUGState(self._start.get_smaller(),
-                                                              self._start.get_larger())] + path)
+            # otherwise, go deeper: add this child to the current path and push
+            # an iterator over its children
+            path.append(child)
+            on_path.add(child)
+            if closed is not None:
+                closed.add(child)
+            stack.append(iter(self._expand(child)))
 
-        # general case - expand this node and employ tail recursion to explore
-        # the children
-        children = curr_state.children()
-        for child in children:
+    @jugbudget.bounded
+    def solve(self) -> jugsolution.JUGSolution:
+        """apply depth-first search to solve this instance
 
-            # skip those cases where this child was already explored in the
-            # current path. Note the start state is not included in the path and
-            # therefore equality is checked separately
-            if child in path or child == self._start:
-                continue
+           it returns the solution as an instance of JUGSolution, or None if
+           there is no solution
+
+        """
 
-            # recursively invoke this method over this child
-            solution = self.solve(child, path + [child])
+        # return the first solution found. If all states are explored but no
+        # solution is generated, then return failure
+        return next(self.iter_solutions(), None)
 
-            # if a solution has been found, then abort the current iteration and
-            # return it asap
-            if isinstance(solution, jugsolution.JUGSolution):
-                return solution
+    def _expand(self, state: int) -> list:
+        """return the children of the given packed state, updating the
+           statistics of the search
 
-            # otherwise, keep on exploring children
+        """
+
+        children = self._successors(state)
+        self._expanded += 1
+        self._generated += len(children)
+
+        return children
+
+    def _set(self):
+        """return an empty set of packed states, either a Python set or a
+           bitmap (see JUGBitmap) if requested
+
+        """
 
-        # at this point all children has been explored but no solution has been
-        # generated. Return failure
-        return None
+        if self._bitmap:
+            return jugbitmap.JUGBitmap(self._problem.get_nstates())
+        return set()
 
 
 # Local Variables:
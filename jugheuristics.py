@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# jugheuristics.py
+# Description:
+# -----------------------------------------------------------------------------
+#
+# Started on <dom 18-10-2026 00:02:17.650381925 (1792281737)>
+# Carlos Linares López <carlos.linares@uc3m.es>
+#
+
+"""Admissible heuristics for solving the water jugs problem with informed
+search algorithms
+
+"""
+
+# imports
+# -----------------------------------------------------------------------------
+import math
+
+import jugbezout
+import jugproblem
+
+# error messages
+# -----------------------------------------------------------------------------
+CRITICAL_UNKNOWN_HEURISTIC = "Unknown heuristic '{0}'. Aborting ..."
+
+# constants
+# -----------------------------------------------------------------------------
+
+# heuristic value of states from which no goal can be reached
+INFINITY = math.inf
+
+# functions
+# -----------------------------------------------------------------------------
+
+# All heuristics receive the instance to solve and a packed state (see
+# JUGProblem.pack) and return a lower bound of the number of steps to reach a
+# goal from it, i.e., they are admissible. Besides, all of them are consistent:
+# the heuristic value of any state never exceeds the heuristic value of any of
+# its children plus one. To evaluate an instance of JUGState just pack it first
+def blind(problem: jugproblem.JUGProblem, key: int) -> int:
+    """return zero for every state. With this heuristic, A* behaves as
+       breadth-first search
+
+    """
+
+    return 0
+
+
+def goal(problem: jugproblem.JUGProblem, key: int) -> int:
+    """return zero if the given state is a goal and one otherwise"""
+
+    return 0 if problem.is_goal_packed(key) else 1
+
+
+def modulo(problem: jugproblem.JUGProblem, key: int):
+    """return zero if the given state is a goal, INFINITY if no goal can be
+       reached from it, and one otherwise
+
+    """
+
+    # the volume of every jug modulo the greatest common divisor of all
+    # capacities is always the sum of the volumes of a subset of jugs (see
+    # jugbezout.is_unsolvable). Hence, if the target modulo the greatest common
+    # divisor is not the sum of any subset of jugs, the target can not be
+    # reached from this state, whatever the number of steps is. Note that
+    # successors of these states can not reach the target either, so that the
+    # heuristic is consistent
+    if problem.is_goal_packed(key):
+        return 0
+    if jugbezout.is_unsolvable(problem, problem.unpack_volumes(key)):
+        return INFINITY
+
+    return 1
+
+
+def lookahead(problem: jugproblem.JUGProblem, key: int):
+    """return zero if the given state is a goal, INFINITY if no goal can be
+       reached from it, one if any child is a goal and two otherwise
+
+    """
+
+    # this heuristic refines the previous one by looking one step ahead: if no
+    # child is a goal, then at least two steps are needed to reach a goal
+    value = modulo(problem, key)
+    if value != 1:
+        return value
+    for child in problem.successors(key):
+        if problem.is_goal_packed(child):
+            return 1
+
+    return 2
+
+
+# globals
+# -----------------------------------------------------------------------------
+
+# all heuristics available, indexed by their name
+HEURISTICS = {"blind": blind,
+              "goal": goal,
+              "modulo": modulo,
+              "lookahead": lookahead}
+
+
+def get_heuristic(heuristic):
+    """return the heuristic function with the given name. For the sake of
+       extensibility, callables are returned as they are
+
+    """
+
+    if callable(heuristic):
+        return heuristic
+    if heuristic not in HEURISTICS:
+        raise ValueError(CRITICAL_UNKNOWN_HEURISTIC.format(heuristic))
+
+    return HEURISTICS[heuristic]
+
+
+# Local Variables:
+# mode:python
+# fill-column:80
+# End:
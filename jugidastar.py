@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# jugidastar.py
+# Description:
+# -----------------------------------------------------------------------------
+#
+# Started on <dom 18-10-2026 00:47:03.804116259 (1792284423)>
+# Carlos Linares López <carlos.linares@uc3m.es>
+#
+
+"""Implementation of a solver of the water jugs problem using Iterative
+Deepening A* (IDA*)
+
+"""
+
+# imports
+# -----------------------------------------------------------------------------
+import jugbudget
+import jugheuristics
+import jugproblem
+import jugsearch
+import jugsolution
+
+# classes
+# -----------------------------------------------------------------------------
+
+# -----------------------------------------------------------------------------
+# JUGIDAStar
+#
+# Implementation of Iterative Deepening A* (IDA*) for solving the water jugs
+# problem
+# -----------------------------------------------------------------------------
+class JUGIDAStar(jugsearch.JUGSearch):
+    """Implementation of Iterative Deepening A* (IDA*) for solving the water
+       jugs problem
+
+    """
+
+    def __init__(self, problem: jugproblem.JUGProblem, heuristic="lookahead"):
+        """A solver of the water jugs problem using IDA* is initialized with the
+           instance to solve which has to be an instance of JUGProblem, and the
+           heuristic to use, either the name of one defined in jugheuristics or
+           a callable which receives the instance and a packed state
+
+        """
+
+        super().__init__(problem)
+
+        # store the data members of this instance
+        self._heuristic = jugheuristics.get_heuristic(heuristic)
+
+    @jugbudget.bounded
+    def solve(self) -> jugsolution.JUGSolution:
+        """apply IDA* to solve this instance
+
+           it returns the solution as an instance of JUGSolution
+
+        """
+
+        # IDA* performs a sequence of depth-first searches, each one bounded
+        # by a threshold over f(n) = g(n) + h(n): nodes whose f-value exceeds
+        # the threshold are not expanded. The first threshold is the f-value
+        # of the start state, and every iteration uses as the next threshold
+        # the least f-value that exceeded the current one. With an admissible
+        # heuristic, the first solution found is optimal. Importantly, IDA*
+        # only stores the current path, so that its memory is linear in the
+        # depth of the solution. As in JUGDFS, states in the current path are
+        # also stored in a set to avoid cycles, and the depth-first search is
+        # implemented with an explicit stack
+
+        # -- initialization
+        self._generated, self._duplicates, self._expanded = 0, 0, 0
+        self._successors, self._is_goal = self._get_successors(), self._get_is_goal()
+        problem, heuristic = self._problem, self._heuristic
+        start = problem.pack(problem.get_start())
+
+        # the first threshold is the f-value of the start state, i.e., its
+        # heuristic value
+        threshold = heuristic(problem, start)
+
+        # iterate until the threshold grows infinitely, i.e., until no node
+        # exceeded the threshold in the last iteration
+        while threshold != jugheuristics.INFINITY:
+
+            path, threshold = self._search(start, threshold)
+
+            # if a solution has been found, return it
+            if path is not None:
+
+                # Yeah, we made it!!! Hoorrrayyy!!
+                return jugsolution.from_path(problem, path)
+
+        # at this point, the state space reachable from the start state has
+        # been exhausted, so return failure
+        return None
+
+    def _search(self, start: int, threshold: int) -> tuple:
+        """perform a depth-first search from the given packed state bounded by
+           the given threshold. It returns a tuple with the path to a goal (or
+           None if none was found) and the least f-value which exceeded the
+           threshold
+
+        """
+
+        # -- initialization
+        problem, heuristic = self._problem, self._heuristic
+        next_threshold = jugheuristics.INFINITY
+
+        # the current path consists initially of the start state only, and the
+        # stack contains only an iterator over its children. Note that the
+        # start state is a goal only if its heuristic value is zero
+        if self._is_goal(start):
+            return [start], threshold
+        path = [start]
+        on_path = {start}
+        stack = [iter(self._expand(start))]
+
+        # iterate until the stack is exhausted
+        while len(stack) > 0:
+
+            # get the next child of the state at the top of the stack, and
+            # backtrack if there are none
+            child = next(stack[-1], None)
+            if child is None:
+                stack.pop()
+                on_path.discard(path.pop())
+                continue
+
+            # skip children in the current path
+            if child in on_path:
+                self._duplicates += 1
+                continue
+
+            # prune children whose f-value exceeds the threshold, recording the
+            # least one
+            f = len(path) + heuristic(problem, child)
+            if f > threshold:
+                next_threshold = min(next_threshold, f)
+                continue
+
+            # if this child is a goal then return the current path extended
+            # with it
+            if self._is_goal(child):
+                return path + [child], threshold
+
+            # otherwise, go deeper
+            path.append(child)
+            on_path.add(child)
+            stack.append(iter(self._expand(child)))
+
+        # at this point, no goal has been found within the threshold
+        return None, next_threshold
+
+    def _expand(self, state: int) -> list:
+        """return the children of the given packed state, updating the
+           statistics of the search
+
+        """
+
+        children = self._successors(state)
+        self._expanded += 1
+        self._generated += len(children)
+
+        return children
+
+
+# Local Variables:
+# mode:python
+# fill-column:80
+# End:
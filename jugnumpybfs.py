@@ -0,0 +1,232 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# jugnumpybfs.py
+# Description:
+# -----------------------------------------------------------------------------
+#
+# Started on <sáb 17-10-2026 22:03:51.774310586 (1792274631)>
+# Carlos Linares López <carlos.linares@uc3m.es>
+#
+
+"""Implementation of a solver of the water jugs problem using breadth-first
+search which expands whole layers at once with NumPy
+
+"""
+
+# imports
+# -----------------------------------------------------------------------------
+import jugbfs
+import jugbudget
+import jugproblem
+import jugsolution
+
+# NumPy is an optional dependency. If it is not available, this solver falls
+# back to the pure Python implementation of breadth-first search
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+# constants
+# -----------------------------------------------------------------------------
+
+# placeholder for the children of states which an operator is not applicable to
+NO_CHILD = -1
+
+# classes
+# -----------------------------------------------------------------------------
+
+# -----------------------------------------------------------------------------
+# JUGNumPyBFS
+#
+# Implementation of breadth-first search which expands whole layers at once with
+# NumPy
+# -----------------------------------------------------------------------------
+class JUGNumPyBFS(jugbfs.JUGBFS):
+    """Implementation of breadth-first search which expands whole layers at once
+       with NumPy. If NumPy is not available, it behaves exactly as JUGBFS
+
+    """
+
+    def __init__(self, problem: jugproblem.JUGProblem):
+        """A solver of the water jugs problem using vectorized breadth-first
+           search is initialized with the instance to solve which has to be an
+           instance of JUGProblem
+
+        """
+
+        super().__init__(problem)
+
+    @jugbudget.bounded
+    def solve(self) -> jugsolution.JUGSolution:
+        """apply breadth-first search to solve this instance, expanding whole
+           layers at once
+
+           it returns the solution as an instance of JUGSolution
+
+        """
+
+        # if NumPy is not available, then use the pure Python implementation
+        if numpy is None:
+            return super().solve()
+
+        # breadth-first search expands all nodes at depth d before any node at
+        # depth d+1. Thus, instead of expanding nodes one at a time, all nodes
+        # in the same layer (i.e., at the same depth) can be expanded at once:
+        # the volumes of all states in a layer are stored in a matrix with one
+        # row per state and one column per jug, and every operator is applied
+        # to all rows at once with a few operations over NumPy arrays.
+        #
+        # Every layer is stored as an array of packed states (see
+        # JUGProblem.pack), along with another array with the location of
+        # their parents in the previous layer, so that the path is rebuilt only
+        # once, when a goal is found. Duplicate detection is performed with a
+        # bitmap over all packed states, so that only one bit per state is
+        # used.
+        #
+        # Importantly, children are sorted in exactly the same order they
+        # would be generated by JUGBFS, and thus this solver returns exactly
+        # the same solution. Statistics differ slightly, though, because the
+        # goal test is applied to a whole layer before expanding any of its
+        # nodes, whereas JUGBFS expands the nodes before the first goal in the
+        # same layer
+
+        # -- initialization
+        self._generated, self._duplicates, self._expanded = 0, 0, 0
+        problem = self._problem
+        capacities = numpy.array(problem.get_capacities(), dtype=numpy.int64)
+        strides = numpy.array(problem.get_strides(), dtype=numpy.int64)
+        njugs = len(capacities)
+        noperators = 2 * njugs + njugs * (njugs - 1)
+
+        # the first layer contains only the start state, which has no parent
+        start = problem.pack(problem.get_start())
+        layers = [numpy.array([start], dtype=numpy.int64)]
+        parents = [numpy.array([jugbfs.NO_PARENT], dtype=numpy.int64)]
+
+        # create a bitmap with all states seen so far
+        seen = numpy.zeros((problem.get_nstates() + 7) // 8, dtype=numpy.uint8)
+        self._mark(seen, layers[0])
+
+        # iterate until a layer is empty, checking the budget, if any, before
+        # expanding every layer
+        while len(layers[-1]) > 0:
+
+            # compute the volumes of all states in the current layer
+            keys = layers[-1]
+            volumes = (keys[:, None] // strides[None, :]) % (capacities[None, :] + 1)
+
+            # if this layer contains any goal, then return the solution to the
+            # first one, which is the one that would be expanded first
+            goals = numpy.flatnonzero(self._is_goal(volumes))
+            if len(goals) > 0:
+
+                # Yeah, we made it!!! Hoorrrayyy!!
+                return jugsolution.from_path(problem, self._layers_path(layers, parents, int(goals[0])))
+
+            # otherwise, apply all operators to all states of this layer. The
+            # children are stored in a matrix with one row per state and one
+            # column per operator, where every operator fills in its column
+            # with the packed representation of the children of all states it
+            # is applicable to, or NO_CHILD otherwise. The budget is checked
+            # with all nodes of this layer before expanding them
+            self._check(len(keys))
+            self._expanded += len(keys)
+            children = numpy.full((len(keys), noperators), NO_CHILD, dtype=numpy.int64)
+            operator = 0
+
+            # emptying jugs
+            for i in range(njugs):
+                mask = volumes[:, i] > 0
+                children[mask, operator] = keys[mask] - volumes[mask, i] * strides[i]
+                operator += 1
+
+            # filling up
+            for i in range(njugs):
+                mask = volumes[:, i] < capacities[i]
+                children[mask, operator] = keys[mask] + (capacities[i] - volumes[mask, i]) * strides[i]
+                operator += 1
+
+            # pouring from one jug to another
+            for i in range(njugs):
+                for j in range(njugs):
+                    if i == j:
+                        continue
+                    volume = numpy.minimum(volumes[:, i], capacities[j] - volumes[:, j])
+                    mask = volume > 0
+                    children[mask, operator] = keys[mask] + volume[mask] * (strides[j] - strides[i])
+                    operator += 1
+
+            # traversing the matrix by rows yields the children in exactly the
+            # same order they would have been generated one node at a time.
+            # Along with them, the location of their parent in this layer is
+            # computed from the row they are stored in
+            locations = numpy.repeat(numpy.arange(len(keys), dtype=numpy.int64), noperators)
+            children = children.ravel()
+            mask = children != NO_CHILD
+            children, locations = children[mask], locations[mask]
+            self._generated += len(children)
+
+            # remove all children seen before, and next all duplicates in this
+            # layer, keeping only the first occurrence of every child
+            mask = ~self._contains(seen, children)
+            children, locations = children[mask], locations[mask]
+            _, first = numpy.unique(children, return_index=True)
+            first.sort()
+            self._duplicates += len(mask) - len(first)
+
+            # and the new children make up the next layer
+            layers.append(children[first])
+            parents.append(locations[first])
+            self._mark(seen, layers[-1])
+
+        # at this point, the state space has been exhausted, so return failure
+        return None
+
+    def _contains(self, bitmap, keys):
+        """return a boolean array which tells whether every key is in the given
+           bitmap
+
+        """
+
+        return (bitmap[keys >> 3] >> (keys & 7).astype(numpy.uint8)) & 1 == 1
+
+    def _is_goal(self, volumes):
+        """return a boolean array which tells whether every row of the given
+           matrix of volumes is a goal of this instance
+
+        """
+
+        goal, target = self._problem.get_goal(), self._problem.get_target()
+        if goal == jugproblem.GOAL_ANY:
+            return (volumes == target).any(axis=1)
+        if goal == jugproblem.GOAL_TOTAL:
+            return volumes.sum(axis=1) == target
+        return volumes[:, goal] == target
+
+    def _layers_path(self, layers: list, parents: list, index: int) -> list:
+        """return the path from the start state to the state stored at the given
+           location of the last layer, by following backpointers
+
+        """
+
+        path = []
+        for depth in range(len(layers) - 1, -1, -1):
+            path.append(int(layers[depth][index]))
+            index = int(parents[depth][index])
+
+        # states have been gathered from the goal to the start, so reverse them
+        path.reverse()
+        return path
+
+    def _mark(self, bitmap, keys):
+        """add all the given keys to the bitmap"""
+
+        numpy.bitwise_or.at(bitmap, keys >> 3, (1 << (keys & 7)).astype(numpy.uint8))
+
+
+# Local Variables:
+# mode:python
+# fill-column:80
+# End:
@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# jugobserver.py
+# Description:
+# -----------------------------------------------------------------------------
+#
+# Started on <dom 18-10-2026 07:38:24.771208930 (1792309104)>
+# Carlos Linares López <carlos.linares@uc3m.es>
+#
+
+"""Observers of search algorithms, which are notified of every node expanded,
+generated and found to be a goal
+
+"""
+
+# imports
+# -----------------------------------------------------------------------------
+import time
+
+# classes
+# -----------------------------------------------------------------------------
+
+# -----------------------------------------------------------------------------
+# JUGObserver
+#
+# Base class of all observers of search algorithms. It does nothing at all
+# -----------------------------------------------------------------------------
+class JUGObserver(object):
+    """Base class of all observers of search algorithms. Every method is
+       invoked with packed states (see JUGProblem.pack) and does nothing at
+       all, so that observers only override those they are interested in
+
+    """
+
+    def on_expand(self, key: int):
+        """invoked every time the given packed state is expanded"""
+
+        pass
+
+    def on_generate(self, parent: int, child: int):
+        """invoked every time the given child is generated when expanding its
+           parent, whether it has been seen before or not
+
+        """
+
+        pass
+
+    def on_goal(self, key: int):
+        """invoked every time the given packed state is found to be a goal"""
+
+        pass
+
+
+# -----------------------------------------------------------------------------
+# JUGStatistics
+#
+# Observer which gathers statistics of a search algorithm per layer, i.e., per
+# depth
+# -----------------------------------------------------------------------------
+class JUGStatistics(JUGObserver):
+    """Observer which gathers statistics of a search algorithm per layer, i.e.,
+       per depth: the number of states first seen at every depth, the number
+       of nodes expanded and generated from them, and the time spent expanding
+       them
+
+       The depth of every state is the depth at which it is first generated.
+       It is the length of the shortest path to it for search algorithms which
+       expand nodes in layers (e.g., breadth-first search), but not for others
+       (e.g., depth-first search), where states are usually expanded again at
+       other depths, and whose solutions can be longer than the largest depth
+
+    """
+
+    def __init__(self):
+        """An observer of statistics is initialized with no statistics at all"""
+
+        # the depth of every state is the depth of its parent when it is first
+        # generated plus one. The first state expanded is the start state,
+        # whose depth is zero
+        self._depths = {}
+
+        # statistics are stored per depth, in lists which grow as needed
+        self._states, self._expanded, self._generated, self._elapsed = [], [], [], []
+
+        # the time spent expanding a node is measured from the time it is
+        # expanded until the next node is expanded
+        self._last, self._timestamp = None, None
+        self._goals = 0
+
+    def get_goals(self) -> int:
+        """return the number of goals found"""
+
+        return self._goals
+
+    def get_layers(self) -> list:
+        """return a list of dictionaries with the statistics of every layer, in
+           ascending order of their depth: the number of states first seen at
+           it, and the number of nodes expanded and generated from them along
+           with the time spent (in seconds)
+
+        """
+
+        self._stop()
+        return [{"depth": depth,
+                 "states": self._states[depth],
+                 "expanded": self._expanded[depth],
+                 "generated": self._generated[depth],
+                 "time": self._elapsed[depth]} for depth in range(len(self._states))]
+
+    def get_max_depth(self) -> int:
+        """return the largest depth reached"""
+
+        return len(self._states) - 1
+
+    def on_expand(self, key: int):
+        """invoked every time the given packed state is expanded"""
+
+        self._stop()
+        depth = self._depths.setdefault(key, 0)
+        if depth == 0 and len(self._states) == 0:
+            self._grow(0)
+            self._states[0] += 1
+        self._expanded[depth] += 1
+        self._last, self._timestamp = depth, time.perf_counter()
+
+    def on_generate(self, parent: int, child: int):
+        """invoked every time the given child is generated when expanding its
+           parent, whether it has been seen before or not
+
+        """
+
+        depth = self._depths[parent]
+        self._generated[depth] += 1
+        if child not in self._depths:
+            self._depths[child] = depth + 1
+            self._grow(depth + 1)
+            self._states[depth + 1] += 1
+
+    def on_goal(self, key: int):
+        """invoked every time the given packed state is found to be a goal"""
+
+        self._goals += 1
+
+    def _grow(self, depth: int):
+        """make room for the statistics of the given depth"""
+
+        while len(self._states) <= depth:
+            for statistics in (self._states, self._expanded, self._generated, self._elapsed):
+                statistics.append(0)
+
+    def _stop(self):
+        """add the time spent since the last node was expanded to its layer"""
+
+        if self._last is not None:
+            self._elapsed[self._last] += time.perf_counter() - self._timestamp
+            self._last = None
+
+
+# functions
+# -----------------------------------------------------------------------------
+def observe_goal(observer: JUGObserver, is_goal):
+    """return a goal function which behaves exactly as the given one (see
+       JUGProblem.is_goal_packed) but notifies the given observer of every
+       goal found
+
+    """
+
+    def wrapper(key: int) -> bool:
+        if is_goal(key):
+            observer.on_goal(key)
+            return True
+        return False
+
+    return wrapper
+
+
+def observe_successors(observer: JUGObserver, successors):
+    """return a successor function which behaves exactly as the given one (see
+       JUGProblem.successors) but notifies the given observer of every node
+       expanded and generated
+
+    """
+
+    def wrapper(key: int) -> list:
+        observer.on_expand(key)
+        children = successors(key)
+        for child in children:
+            observer.on_generate(key, child)
+        return children
+
+    return wrapper
+
+
+# Local Variables:
+# mode:python
+# fill-column:80
+# End:
@@ -18,8 +18,16 @@ Parser of the CLI arguments
 import argparse
 import sys
 
+import jugcosts
+import jugheuristics
+import jugproblem
+import jugsolvers
 import version
 
+# error messages
+# -----------------------------------------------------------------------------
+CRITICAL_MISSING_ALGORITHM = "the following arguments are required: -x/--algorithm (unless --batch is given)"
+
 # -----------------------------------------------------------------------------
 # command parser of CLI arguments
 # -----------------------------------------------------------------------------
@@ -32,19 +40,14 @@ class JUGParser(object):
         # initialize a parser for the water jugs problem
         self._parser = argparse.ArgumentParser(description=version.__description__)
 
-        # mandatory arguments
-        # ---------------------------------------------------------------------
-        mandatory = self._parser.add_argument_group("Mandatory arguments", \
-                                                    "The following arguments are required:")
-        mandatory.add_argument('-x', '--algorithm',
-                               choices=['depth-first', 'breadth-first'],
-                               required=True,
-                               help="search algorithm to use. Available options are 'depth-first' and 'breadth-first' search")
-
         # optional arguments
         # ---------------------------------------------------------------------
         optional = self._parser.add_argument_group("Optimal arguments", \
                                                     "The following arguments are optional:")
+        optional.add_argument('-x', '--algorithm',
+                              choices=jugsolvers.get_names(),
+                              help="search algorithm to use. It is required unless --batch is given, in which case it is the default search algorithm of every instance. Available options are: {0}".format(
+                                  ", ".join("'{0}'".format(name) for name in jugsolvers.get_names())))
         optional.add_argument('-s', '--small',
                               type=int,
                               default=3,
@@ -61,14 +64,94 @@ class JUGParser(object):
                               type=int,
                               default=0,
                               help="initial amount of water in the larger jug. By default, 0 gallons")
+        optional.add_argument('-c', '--capacities',
+                              type=int,
+                              nargs='+',
+                              help="capacity of every jug, for solving instances with any number of jugs. If given, it overrides --small and --large")
+        optional.add_argument('-i', '--initial',
+                              type=int,
+                              nargs='+',
+                              help="initial amount of water in every jug. If given, it overrides --small_initial and --large_initial. By default, all jugs given with --capacities are empty")
         optional.add_argument('-t', '--target',
                               type=int,
                               default=4,
-                              help="target amount of water to be achieved in any jug. By default, 4 gallons")
+                              help="target amount of water to be achieved. By default, 4 gallons")
+        optional.add_argument('-g', '--goal',
+                              type=str,
+                              default=jugproblem.GOAL_ANY,
+                              help="where the target amount of water has to be achieved: either '{0}' jug, the '{1}' volume of all jugs, or the index (starting from 0) of a specific jug. By default, '{0}'".format(jugproblem.GOAL_ANY, jugproblem.GOAL_TOTAL))
+
+        optional.add_argument('-e', '--heuristic',
+                              choices=list(jugheuristics.HEURISTICS),
+                              help="heuristic used by informed search algorithms ('astar' and 'idastar'). By default, 'lookahead'")
+        optional.add_argument('-o', '--cost',
+                              type=str,
+                              help="cost of the operators used by cost-aware search algorithms ('uniform-cost'): either {0}, or the costs of emptying, filling up and pouring water separated by commas, e.g., '1,3,1'. By default, 'unit'".format(", ".join("'{0}'".format(name) for name in jugcosts.COSTS)))
+        optional.add_argument('-C', '--closed',
+                              action='store_true',
+                              default=None,
+                              help="if given, depth-first search never expands the same state twice, even if it is reached along a different path")
+        optional.add_argument('-B', '--bitmap',
+                              action='store_true',
+                              default=None,
+                              help="if given, depth-first and breadth-first search store the states seen in a bitmap with one bit per state instead of a set")
+        optional.add_argument('-R', '--transitions',
+                              action='store_true',
+                              help="if given, a table with the child of every state by every operator is built before searching (not timed), so that search algorithms expanding one node at a time look children up instead of computing them. Ignored in batch mode")
+        optional.add_argument('-p', '--precheck',
+                              action='store_true',
+                              help="before searching, check whether the instance can be proven unsolvable analytically, in which case no search is performed at all")
+        optional.add_argument('-d', '--cache-dir',
+                              type=str,
+                              default=None,
+                              help="directory where the tables precomputed by the search algorithm 'table' are stored. By default, ~/.cache/jugs")
+
+        # Batch arguments
+        # ---------------------------------------------------------------------
+        batch = self._parser.add_argument_group("Batch arguments", \
+                                                "The following arguments serve to solve many instances at once:")
+        batch.add_argument('-b', '--batch',
+                           type=argparse.FileType('r'),
+                           help="file with one instance per line, either in CSV (small, large, small_initial, large_initial, target, algorithm) or JSON format. Use '-' to read from the standard input. Solutions are written to the standard output in JSON format, one per line")
+        batch.add_argument('-k', '--cache-size',
+                           type=int,
+                           default=128,
+                           help="maximum number of solutions remembered in batch mode to answer repeated instances. By default, 128")
+        batch.add_argument('-w', '--workers',
+                           type=int,
+                           help="number of processes solving instances in parallel in batch mode (by default, 1, i.e., instances are solved sequentially), or expanding every layer with the search algorithm 'breadth-first-parallel' (by default, as many as cores)")
+        batch.add_argument('-z', '--chunksize',
+                           type=int,
+                           default=64,
+                           help="number of instances sent at once to every process in batch mode. By default, 64")
+        batch.add_argument('-u', '--unordered',
+                           action='store_true',
+                           help="if given, solutions are written in batch mode as soon as they are found by any process, instead of in the same order than the instances")
+
+        # Budget arguments
+        # ---------------------------------------------------------------------
+        budget = self._parser.add_argument_group("Budget arguments", \
+                                                 "The following arguments serve to bound every search, which is interrupted as soon as any bound is exceeded:")
+        budget.add_argument('-T', '--max-time',
+                            type=float,
+                            help="maximum time (in seconds) of every search")
+        budget.add_argument('-N', '--max-nodes',
+                            type=int,
+                            help="maximum number of nodes expanded by every search")
+        budget.add_argument('-M', '--max-memory',
+                            type=int,
+                            help="maximum memory (in bytes) used by every search beyond that used when it starts")
 
         # Miscellaneous arguments
         # ---------------------------------------------------------------------
         misc = self._parser.add_argument_group('Miscellaneous')
+        misc.add_argument('-S', '--stats',
+                          action='store_true',
+                          help="if given, the statistics of the search are shown, per layer in case of depth-first, breadth-first, astar and idastar search")
+        misc.add_argument('-P', '--profile',
+                          nargs='?',
+                          const='-',
+                          help="if given, the search is profiled with cProfile. The report is either shown or written to the given file, which can be read with pstats")
         misc.add_argument('-V', '--version',
                           action='version',
                           version=" %s %s" % (sys.argv [0], version.__version__),
@@ -77,7 +160,14 @@ class JUGParser(object):
     def parse(self, args=None):
         """parse the arguments"""
 
-        return self._parser.parse_args(args)
+        params = self._parser.parse_args(args)
+
+        # the search algorithm is mandatory unless instances are given in batch
+        # mode, where every instance can set its own
+        if params.algorithm is None and params.batch is None:
+            self._parser.error(CRITICAL_MISSING_ALGORITHM)
+
+        return params
 
 
 # Local Variables:
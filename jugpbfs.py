@@ -0,0 +1,363 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# jugpbfs.py
+# Description:
+# -----------------------------------------------------------------------------
+#
+# Started on <dom 18-10-2026 04:07:42.915306524 (1792296462)>
+# Carlos Linares López <carlos.linares@uc3m.es>
+#
+
+"""Implementation of a solver of the water jugs problem using breadth-first
+search which expands every layer in parallel with a number of processes
+
+"""
+
+# imports
+# -----------------------------------------------------------------------------
+import array
+import heapq
+import multiprocessing
+import os
+from multiprocessing import resource_tracker, shared_memory
+
+import jugbudget
+import jugproblem
+import jugsearch
+import jugsolution
+
+# error messages
+# -----------------------------------------------------------------------------
+CRITICAL_WRONG_WORKERS = "The number of workers shall be a positive integer. Aborting ..."
+
+# constants
+# -----------------------------------------------------------------------------
+
+# backpointer of the start state
+NO_PARENT = -1
+
+# order of the first goal found by a worker, if none was found
+NO_GOAL = -1
+
+# size in bytes of every packed state, order or count stored in shared memory
+ITEMSIZE = array.array('q').itemsize
+
+# classes
+# -----------------------------------------------------------------------------
+
+# -----------------------------------------------------------------------------
+# JUGParallelBFS
+#
+# Implementation of a level-synchronous breadth-first search which expands every
+# layer in parallel with a number of processes
+# -----------------------------------------------------------------------------
+class JUGParallelBFS(jugsearch.JUGSearch):
+    """Implementation of a level-synchronous breadth-first search which
+       expands every layer in parallel with a number of processes. It returns
+       exactly the same solution than JUGBFS
+
+    """
+
+    def __init__(self, problem: jugproblem.JUGProblem, workers: int = None):
+        """A solver of the water jugs problem using parallel breadth-first
+           search is initialized with the instance to solve which has to be an
+           instance of JUGProblem, and the number of processes to use. By
+           default, as many as cores
+
+        """
+
+        super().__init__(problem)
+
+        # verify the number of workers
+        workers = os.cpu_count() if workers is None else workers
+        if not isinstance(workers, int) or workers <= 0:
+            raise ValueError(CRITICAL_WRONG_WORKERS)
+
+        # store the data members of this instance
+        self._workers = workers
+
+    @jugbudget.bounded
+    def solve(self) -> jugsolution.JUGSolution:
+        """apply parallel breadth-first search to solve this instance
+
+           it returns the solution as an instance of JUGSolution
+
+        """
+
+        # breadth-first search expands all nodes at depth d before any node at
+        # depth d+1, so that all nodes in the same layer can be expanded in
+        # parallel. Every layer is processed in two phases, each one performed
+        # by all workers at the same time:
+        #
+        #    1. Expansion: the current layer (an array of packed states, see
+        #       JUGProblem.pack) is split in as many consecutive slices as
+        #       workers, and every worker expands its own slice
+        #
+        #    2. Duplicate detection: every state is owned by only one worker,
+        #       the one whose index is the remainder of dividing the packed
+        #       state by the number of workers. Every worker keeps only the set
+        #       of states it owns which have been seen so far, so that the sets
+        #       of all workers have no states in common. Children generated in
+        #       the first phase are sent to their owner, which discards those
+        #       seen before
+        #
+        # Workers do not exchange instances of JUGState (nor pickled Python
+        # objects) but packed states stored in blocks of shared memory, and
+        # only the names of these blocks are sent through pipes.
+        #
+        # To return exactly the same solution than JUGBFS, every child is
+        # generated along with its order, i.e., the location of its parent in
+        # the layer times the number of operators plus its location among the
+        # children of its parent. Sorting children by their order yields
+        # precisely the same order in which JUGBFS generates them, so that
+        # among all copies of the same child, the one with the lowest order is
+        # the one JUGBFS keeps, and among all goals in the same layer, the one
+        # with the lowest order is the one JUGBFS finds first
+        #
+        # Note that the goal is tested once the whole layer has been generated,
+        # so that statistics are not exactly the same than those of JUGBFS
+
+        # -- initialization
+        self._generated, self._duplicates, self._expanded = 0, 0, 0
+        problem = self._problem
+        noperators = problem.get_noperators()
+        start = problem.pack(problem.get_start())
+
+        # if the start state is a goal, then return it right away
+        if problem.is_goal_packed(start):
+            return jugsolution.JUGSolution(problem.get_capacities(), problem.get_start(), [])
+
+        # every layer is stored with the states in it and the location of their
+        # parents in the previous layer
+        states = array.array('q', [start])
+        layers = [(states, array.array('q', [NO_PARENT]))]
+
+        # create all workers, each one connected to this process with a pipe.
+        # Blocks of shared memory are created and removed by different
+        # processes, so that all of them have to share the same tracker of
+        # resources, which is then started before creating them
+        resource_tracker.ensure_running()
+        connections, processes = [], []
+        for index in range(self._workers):
+            connection, remote = multiprocessing.Pipe()
+            process = multiprocessing.Process(target=_work,
+                                              args=(index, self._workers, problem, start, remote),
+                                              daemon=True)
+            process.start()
+            connections.append(connection)
+            processes.append(process)
+
+        try:
+
+            # iterate until doomsday or there are no more states to expand,
+            # checking the budget, if any, with all nodes of every layer before
+            # expanding it. Note that workers are stopped anyway if it is
+            # exceeded
+            while len(states) > 0:
+
+                self._check(len(states))
+
+                # expansion: share the current layer with all workers, and
+                # give every worker a slice of it
+                layer = _share(states)
+                slices = [len(states) * index // self._workers for index in range(1 + self._workers)]
+                for index, connection in enumerate(connections):
+                    connection.send(("expand", layer.name, slices[index], slices[1 + index]))
+                blocks = [connection.recv() for connection in connections]
+                _release(layer)
+                self._expanded += len(states)
+                self._generated += sum(generated for _, _, generated in blocks)
+
+                # duplicate detection: every worker receives the names of the
+                # blocks with the children generated by all workers and keeps
+                # those it owns which have not been seen before
+                for connection in connections:
+                    connection.send(("merge", [(name, size) for name, size, _ in blocks]))
+                results = [connection.recv() for connection in connections]
+                for name, _, _ in blocks:
+                    _release(shared_memory.SharedMemory(name=name))
+
+                # if any goal was found, then the one with the lowest order is
+                # the one found by JUGBFS. Its parent is located in the current
+                # layer
+                goals = [goal for _, _, goal in results if goal != NO_GOAL]
+                if len(goals) > 0:
+                    for name, _, _ in results:
+                        _release(shared_memory.SharedMemory(name=name))
+                    order = min(goals)
+                    child = problem.apply(states[order // noperators],
+                                          _operator(problem, states[order // noperators], order % noperators))
+                    return jugsolution.from_path(problem, self._path(layers, child, order // noperators))
+
+                # otherwise, the next layer consists of all children kept by all
+                # workers, sorted by their order
+                merged = heapq.merge(*[_pairs(name, size) for name, size, _ in results])
+                states, parents = array.array('q'), array.array('q')
+                for order, child in merged:
+                    states.append(child)
+                    parents.append(order // noperators)
+                self._duplicates += sum(generated for _, _, generated in blocks) - len(states)
+                layers.append((states, parents))
+
+        finally:
+
+            # stop all workers
+            for connection in connections:
+                connection.send(("stop",))
+            for process in processes:
+                process.join()
+
+        # at this point, all reachable states have been expanded, so return
+        # failure
+        return None
+
+    def _path(self, layers: list, child: int, index: int) -> list:
+        """return the path from the start state to the given child of the state
+           stored at the given location of the last layer, by following
+           backpointers
+
+        """
+
+        path = [child]
+        for states, parents in reversed(layers):
+            path.append(states[index])
+            index = parents[index]
+
+        # states have been gathered from the goal to the start, so reverse them
+        path.reverse()
+        return path
+
+
+# functions
+# -----------------------------------------------------------------------------
+def _operator(problem: jugproblem.JUGProblem, key: int, location: int) -> int:
+    """return the operator which generates the child at the given location
+       among all children of the given packed state
+
+    """
+
+    # children are generated in ascending order of their operators, skipping
+    # those which are not applicable
+    for operator in range(problem.get_noperators()):
+        if problem.apply(key, operator) != jugproblem.NO_SUCCESSOR:
+            if location == 0:
+                return operator
+            location -= 1
+
+
+def _pairs(name: str, size: int):
+    """return a generator with all pairs (order, child) stored in the block of
+       shared memory with the given name and number of items, which is released
+       afterwards
+
+    """
+
+    block = shared_memory.SharedMemory(name=name)
+    values = array.array('q')
+    values.frombytes(block.buf[:size * ITEMSIZE])
+    _release(block)
+    for index in range(0, size, 2):
+        yield values[index], values[1 + index]
+
+
+def _release(block: shared_memory.SharedMemory):
+    """close and remove the given block of shared memory"""
+
+    block.close()
+    block.unlink()
+
+
+def _share(values: array.array) -> shared_memory.SharedMemory:
+    """return a new block of shared memory with a copy of the given array"""
+
+    block = shared_memory.SharedMemory(create=True, size=max(1, len(values) * ITEMSIZE))
+    block.buf[:len(values) * ITEMSIZE] = values.tobytes()
+    return block
+
+
+def _work(index: int, nworkers: int, problem: jugproblem.JUGProblem, start: int, connection):
+    """main body of every worker, with the given index among the given number of
+       workers, which serves the requests received through the given
+       connection until it is requested to stop
+
+    """
+
+    # every worker only stores the states it owns which have been seen so far
+    successors = problem.successors
+    noperators = problem.get_noperators()
+    seen = {start} if start % nworkers == index else set()
+
+    while True:
+
+        request = connection.recv()
+
+        # expand all states in the given slice of the current layer and send
+        # every child, along with its order, to its owner. Children are stored
+        # in a block of shared memory with the number of items sent to every
+        # worker followed by the items sent to each one
+        if request[0] == "expand":
+            _, name, first, last = request
+            block = shared_memory.SharedMemory(name=name)
+            states = array.array('q')
+            states.frombytes(block.buf[first * ITEMSIZE:last * ITEMSIZE])
+            block.close()
+
+            buckets = [array.array('q') for _ in range(nworkers)]
+            generated = 0
+            for location, key in enumerate(states, start=first):
+                children = successors(key)
+                generated += len(children)
+                for rank, child in enumerate(children):
+                    bucket = buckets[child % nworkers]
+                    bucket.append(child)
+                    bucket.append(location * noperators + rank)
+
+            values = array.array('q', [len(bucket) for bucket in buckets])
+            for bucket in buckets:
+                values.extend(bucket)
+            block = _share(values)
+            block.close()
+            connection.send((block.name, len(values), generated))
+
+        # take all children owned by this worker from the blocks of all workers
+        # and keep those not seen before. Because blocks are given in the same
+        # order than the slices of the layer, children are considered in
+        # ascending order of their order, so that the first copy of every child
+        # is the one with the lowest order. Children kept are stored in a block
+        # of shared memory as pairs (order, child)
+        elif request[0] == "merge":
+            kept = array.array('q')
+            goal = NO_GOAL
+            for name, size in request[1]:
+                block = shared_memory.SharedMemory(name=name)
+                counts = block.buf[:nworkers * ITEMSIZE].cast('q')
+                offset = nworkers + sum(counts[:index])
+                values = array.array('q')
+                values.frombytes(block.buf[offset * ITEMSIZE:(offset + counts[index]) * ITEMSIZE])
+                counts.release()
+                block.close()
+
+                for location in range(0, len(values), 2):
+                    child = values[location]
+                    if child not in seen:
+                        seen.add(child)
+                        kept.append(values[1 + location])
+                        kept.append(child)
+                        if goal == NO_GOAL and problem.is_goal_packed(child):
+                            goal = values[1 + location]
+
+            block = _share(kept)
+            block.close()
+            connection.send((block.name, len(kept), goal))
+
+        # otherwise, stop
+        else:
+            connection.close()
+            return
+
+
+# Local Variables:
+# mode:python
+# fill-column:80
+# End:
@@ -0,0 +1,441 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# jugproblem.py
+# Description:
+# -----------------------------------------------------------------------------
+#
+# Started on <sáb 17-10-2026 20:31:48.540217390 (1792269108)>
+# Carlos Linares López <carlos.linares@uc3m.es>
+#
+
+"""
+Definition of an instance of the water jugs problem
+"""
+
+# imports
+# -----------------------------------------------------------------------------
+import jugstate
+
+# error messages
+# -----------------------------------------------------------------------------
+CRITICAL_WRONG_CAPACITIES_LENGTH = "There should be at least one jug"
+CRITICAL_WRONG_CAPACITY_TYPE = "The capacity of every jug should be an int"
+CRITICAL_WRONG_CAPACITY_VALUE = "The capacity of every jug has to be a strictly positive number"
+CRITICAL_WRONG_GOAL = "The goal should be either '{0}', '{1}' or the index of a jug".format("any", "total")
+CRITICAL_WRONG_START_TYPE = "The start state shall be an instance of JUGState. Aborting ..."
+CRITICAL_WRONG_START_LENGTH = "The start state should have as many jugs as capacities are given"
+CRITICAL_WRONG_START_VALUE = "The initial volume of every jug should be less or equal than its maximum capacity"
+CRITICAL_WRONG_TARGET_TYPE = "The target volume should be an int"
+
+# constants
+# -----------------------------------------------------------------------------
+
+# result of applying an operator to a state it is not applicable to
+NO_SUCCESSOR = -1
+
+# the target volume can be expressed either over any jug, over the total volume
+# of all jugs, or over a specific jug, which is then given with its index
+GOAL_ANY = "any"
+GOAL_TOTAL = "total"
+
+# classes
+# -----------------------------------------------------------------------------
+
+# -----------------------------------------------------------------------------
+# JUGProblem
+#
+# Definition of an instance of the water jugs problem, i.e., the capacity of
+# every jug, the start state and the goal
+# -----------------------------------------------------------------------------
+class JUGProblem(object):
+    """Definition of an instance of the water jugs problem, i.e., the capacity
+       of every jug, the start state and the goal
+
+    """
+
+    def __init__(self, capacities: tuple, start: jugstate.JUGState,
+                 target: int, goal=GOAL_ANY):
+        """An instance of the water jugs problem is initialized with the
+           capacity of every jug, the start state and the target volume. By
+           default, the target volume has to be achieved in any jug, but it can
+           be also requested over the total volume of all jugs (GOAL_TOTAL) or
+           over a specific jug, given with its index
+
+        """
+
+        # the capacities of all jugs should be strictly positive ints
+        capacities = tuple(capacities)
+        if len(capacities) == 0:
+            raise ValueError(CRITICAL_WRONG_CAPACITIES_LENGTH)
+        for capacity in capacities:
+            if not isinstance(capacity, int):
+                raise TypeError(CRITICAL_WRONG_CAPACITY_TYPE)
+            if capacity <= 0:
+                raise ValueError(CRITICAL_WRONG_CAPACITY_VALUE)
+
+        # the start state has to be a state which respects the capacity of all
+        # jugs
+        if not isinstance(start, jugstate.JUGState):
+            raise TypeError(CRITICAL_WRONG_START_TYPE)
+        if len(start) != len(capacities):
+            raise ValueError(CRITICAL_WRONG_START_LENGTH)
+        for volume, capacity in zip(start.get_volumes(), capacities):
+            if volume > capacity:
+                raise ValueError(CRITICAL_WRONG_START_VALUE)
+
+        # Note, in particular, it is allowed to use impossible target values
+        # such as a target which is strictly larger than the maximum capacity
+        # of any jug. That should not be problem and any algorithm ends with no
+        # solution found
+        if not isinstance(target, int):
+            raise TypeError(CRITICAL_WRONG_TARGET_TYPE)
+
+        # the goal should be either any jug, the total volume, or a valid index
+        if goal not in (GOAL_ANY, GOAL_TOTAL) and \
+           (not isinstance(goal, int) or goal < 0 or goal >= len(capacities)):
+            raise ValueError(CRITICAL_WRONG_GOAL)
+
+        # initialize the data members of this class. Every instance stores its
+        # own definition, so that different instances can be solved at the
+        # same time, e.g., in different threads
+        self._capacities = capacities
+        self._start = start
+        self._target = target
+        self._goal = goal
+
+        # states are packed into integers as the digits of a number in a mixed
+        # radix, where the i-th digit is the volume of the i-th jug, and the
+        # base of each digit is the capacity of its jug plus one. The weight of
+        # every digit (or stride) is precomputed here. Note that the first jug
+        # is the most significant one
+        self._strides = [1] * len(capacities)
+        for i in range(len(capacities) - 2, -1, -1):
+            self._strides[i] = self._strides[i+1] * (capacities[i+1] + 1)
+        self._strides = tuple(self._strides)
+
+    def __str__(self) -> str:
+        """return a string representation of this instance"""
+
+        return "capacities: ({0}); start: {1}; target: {2} ({3})".format(
+            ", ".join(str(capacity) for capacity in self._capacities),
+            self._start, self._target, self._goal)
+
+    def apply(self, key: int, operator: int) -> int:
+        """return the packed representation of the child of the state packed in
+           the given integer which results from applying the given operator, or
+           NO_SUCCESSOR if it is not applicable. With n jugs, operators are
+           numbered as follows: [0, n) empty the i-th jug; [n, 2n) fill up the
+           i-th jug; and [2n, n(n+1)) pour water from the i-th jug into the
+           j-th one, sorted first by i and then by j. This is precisely the
+           order in which children are generated
+
+        """
+
+        capacities, strides = self._capacities, self._strides
+        volumes = self.unpack_volumes(key)
+        njugs = len(volumes)
+
+        # emptying jugs
+        if operator < njugs:
+            if volumes[operator] == 0:
+                return NO_SUCCESSOR
+            return key - volumes[operator] * strides[operator]
+
+        # filling up
+        if operator < 2 * njugs:
+            i = operator - njugs
+            if volumes[i] == capacities[i]:
+                return NO_SUCCESSOR
+            return key + (capacities[i] - volumes[i]) * strides[i]
+
+        # pouring from one jug to another
+        i, j = divmod(operator - 2 * njugs, njugs - 1)
+        if j >= i:
+            j += 1
+        volume = min(volumes[i], capacities[j] - volumes[j])
+        if volume == 0:
+            return NO_SUCCESSOR
+        return key + volume * (strides[j] - strides[i])
+
+    def get_capacities(self) -> tuple:
+        """return a tuple with the capacity of every jug"""
+
+        return self._capacities
+
+    def get_goal(self):
+        """return the kind of goal of this instance, i.e., either GOAL_ANY,
+           GOAL_TOTAL or the index of a jug
+
+        """
+
+        return self._goal
+
+    def get_njugs(self) -> int:
+        """return the number of jugs of this instance"""
+
+        return len(self._capacities)
+
+    def get_noperators(self) -> int:
+        """return the number of operators of this instance (see apply)"""
+
+        return len(self._capacities) * (len(self._capacities) + 1)
+
+    def get_nstates(self) -> int:
+        """return the number of states of this instance, i.e., the product of
+           the capacities of all jugs plus one. Packed states are integers in
+           the range [0, get_nstates())
+
+        """
+
+        return self._strides[0] * (self._capacities[0] + 1)
+
+    def get_start(self) -> jugstate.JUGState:
+        """return the start state of this instance"""
+
+        return self._start
+
+    def get_strides(self) -> tuple:
+        """return a tuple with the weight of every jug in the packed
+           representation of states, i.e., a state is packed as the sum of the
+           volume of every jug times its stride
+
+        """
+
+        return self._strides
+
+    def get_target(self) -> int:
+        """return the target volume of this instance"""
+
+        return self._target
+
+    def goals(self):
+        """return a generator with the packed representation of all goal states
+           of this instance. Every goal state is generated exactly once
+
+        """
+
+        capacities, strides, target = self._capacities, self._strides, self._target
+
+        # if the target has to be achieved in the total volume of all jugs, then
+        # generate all combinations of volumes that add up to the target,
+        # filling jugs one at a time. Every item in the stack is the index of
+        # the next jug to fill, the packed representation of the volumes of
+        # all jugs filled so far and the volume remaining
+        if self._goal == GOAL_TOTAL:
+            stack = [(0, 0, target)] if target >= 0 else []
+            while len(stack) > 0:
+                index, key, remaining = stack.pop()
+                if index == len(capacities):
+                    if remaining == 0:
+                        yield key
+                    continue
+                for volume in range(min(remaining, capacities[index]), -1, -1):
+                    stack.append((index + 1, key + volume * strides[index], remaining - volume))
+            return
+
+        # otherwise, the target has to be achieved in one jug (or any of them).
+        # Then, fix the volume of that jug to the target and generate all
+        # combinations of volumes of the other jugs. Note that with any jug,
+        # states where the target is achieved in a preceding jug are skipped,
+        # as they were already generated
+        jugs = range(len(capacities)) if self._goal == GOAL_ANY else [self._goal]
+        for jug in jugs:
+            if target < 0 or target > capacities[jug]:
+                continue
+            others = [(i, capacity) for i, capacity in enumerate(capacities) if i != jug]
+            keys = [target * strides[jug]]
+            for i, capacity in others:
+                skip = target if self._goal == GOAL_ANY and i < jug else None
+                keys = [key + volume * strides[i]
+                        for key in keys
+                        for volume in range(capacity + 1)
+                        if volume != skip]
+            yield from keys
+
+    def is_goal(self, state: jugstate.JUGState) -> bool:
+        """return True if and only if the given state is a goal state of this
+           instance
+
+        """
+
+        return self._is_goal(state.get_volumes())
+
+    def is_goal_packed(self, key: int) -> bool:
+        """return True if and only if the state packed in the given integer is a
+           goal state of this instance
+
+        """
+
+        return self._is_goal(self.unpack_volumes(key))
+
+    def operator(self, parent: int, child: int) -> int:
+        """return the operator which transforms the given packed parent into the
+           given packed child, or None if there is none
+
+        """
+
+        # the operator is recognized by the jugs whose volume changed: only one
+        # jug loses water when it is emptied, only one gains water when it is
+        # filled up, and one loses and another one gains water when pouring.
+        # The candidate operator is then applied to verify it yields the child
+        before, after = self.unpack_volumes(parent), self.unpack_volumes(child)
+        njugs = len(before)
+        lost = [i for i in range(njugs) if after[i] < before[i]]
+        gained = [i for i in range(njugs) if after[i] > before[i]]
+        if len(lost) == 1 and len(gained) == 0:
+            operator = lost[0]
+        elif len(lost) == 0 and len(gained) == 1:
+            operator = njugs + gained[0]
+        elif len(lost) == 1 and len(gained) == 1:
+            i, j = lost[0], gained[0]
+            operator = 2 * njugs + i * (njugs - 1) + (j if j < i else j - 1)
+        else:
+            return None
+
+        return operator if self.apply(parent, operator) == child else None
+
+    def pack(self, state: jugstate.JUGState) -> int:
+        """return an integer which uniquely represents the given state in this
+           instance
+
+        """
+
+        # every state of this instance is represented by an integer in the range
+        # [0, get_nstates()). Search algorithms store these integers instead of
+        # instances of JUGState, which takes far less memory
+        return sum(volume * stride for volume, stride in zip(state.get_volumes(), self._strides))
+
+    def predecessors(self, key: int) -> list:
+        """return a list with the packed representation of all parents of the
+           state packed in the given integer, i.e., those states which have it
+           as a child. This is the successor function of the inverse operators
+
+        """
+
+        # every operator is inverted here. Note that a state can not be the
+        # child of another by means of two different operators, so that every
+        # parent is generated exactly once
+        parents = []
+        capacities, strides = self._capacities, self._strides
+        volumes = self.unpack_volumes(key)
+        njugs = len(volumes)
+
+        # emptying jugs - if a jug is empty, then it could contain any positive
+        # volume before
+        for i in range(njugs):
+            if volumes[i] == 0:
+                for volume in range(1, capacities[i] + 1):
+                    parents.append(key + volume * strides[i])
+
+        # filling up - if a jug is full, then it could contain any volume below
+        # its capacity before
+        for i in range(njugs):
+            if volumes[i] == capacities[i]:
+                for volume in range(capacities[i]):
+                    parents.append(key - (capacities[i] - volume) * strides[i])
+
+        # pouring from one jug to another - after pouring water from i into j,
+        # either i got empty and then j could have contained any smaller volume
+        # before, or j got full and then i (which still contains water) could
+        # have contained any larger volume before
+        for i in range(njugs):
+            for j in range(njugs):
+                if i == j:
+                    continue
+
+                # i -> j
+                if volumes[i] == 0:
+                    volume_max = min(volumes[j], capacities[i])
+                elif volumes[j] == capacities[j]:
+                    volume_max = min(capacities[j], capacities[i] - volumes[i])
+                else:
+                    continue
+                for volume in range(1, volume_max + 1):
+                    parents.append(key - volume * (strides[j] - strides[i]))
+
+        # return all parents computed so far
+        return parents
+
+    def successors(self, key: int) -> list:
+        """return a list with the packed representation of all children of the
+           state packed in the given integer. Children are generated in exactly
+           the same order than JUGState.children
+
+        """
+
+        # this is the very same successor function than JUGState.children but
+        # on packed states. It is used by search algorithms in their hot loop,
+        # and thus no instance of JUGState is created here at all. Note that
+        # every operator modifies the volume of one or two jugs, so that the
+        # packed representation of every child is computed by adding (or
+        # subtracting) the volume of water moved times the stride of every jug
+        # modified
+        children = []
+        capacities, strides = self._capacities, self._strides
+        volumes = self.unpack_volumes(key)
+        njugs = len(volumes)
+
+        # emptying jugs
+        for i in range(njugs):
+            if volumes[i] > 0:
+                children.append(key - volumes[i] * strides[i])
+
+        # filling up
+        for i in range(njugs):
+            if volumes[i] < capacities[i]:
+                children.append(key + (capacities[i] - volumes[i]) * strides[i])
+
+        # pouring from one jug to another. Note that the branching factor grows
+        # quadratically with the number of jugs, so that pouring from an empty
+        # jug is skipped right away
+        for i in range(njugs):
+            if volumes[i] == 0:
+                continue
+            for j in range(njugs):
+                if i == j:
+                    continue
+
+                # i -> j
+                volume = min(volumes[i], capacities[j] - volumes[j])
+                if volume > 0:
+                    children.append(key + volume * (strides[j] - strides[i]))
+
+        # return all children computed so far
+        return children
+
+    def unpack(self, key: int) -> jugstate.JUGState:
+        """return the instance of JUGState packed in the given integer"""
+
+        return jugstate.JUGState(*self.unpack_volumes(key))
+
+    def unpack_volumes(self, key: int) -> list:
+        """return a list with the volume of every jug in the state packed in the
+           given integer
+
+        """
+
+        volumes = []
+        for stride in self._strides:
+            volume, key = divmod(key, stride)
+            volumes.append(volume)
+
+        return volumes
+
+    def _is_goal(self, volumes) -> bool:
+        """return True if and only if the given volumes are a goal of this
+           instance
+
+        """
+
+        if self._goal == GOAL_ANY:
+            return self._target in volumes
+        if self._goal == GOAL_TOTAL:
+            return sum(volumes) == self._target
+        return volumes[self._goal] == self._target
+
+
+# Local Variables:
+# mode:python
+# fill-column:80
+# End:
@@ -14,17 +14,80 @@
 
 # imports
 # -----------------------------------------------------------------------------
+import cProfile
+import pstats
+import sys
 import time
 
-import jugbfs
-import jugdfs
+import jugbatch
+import jugbezout
+import jugbudget
+import jugcache
+import jugcosts
+import jugobserver
 import jugparser
+import jugproblem
+import jugsolution
+import jugsolvers
 import jugstate
+import jugtransitions
 
-# error messages
+# functions
 # -----------------------------------------------------------------------------
-CRITICAL_WRONG_MAX_VOLUME = "Maximum capacity has to be given as a strictly positive number"
-CRITICAL_WRONG_INITIAL_VOLUMNE = "The initial volume of both jugs should be less or equal than its maximum capacity"
+def get_problem(params) -> jugproblem.JUGProblem:
+    """return the instance of JUGProblem described by the given arguments of the
+       command line
+
+    """
+
+    # the capacity of every jug is given either with --capacities or, in case
+    # there are only two jugs, with --small and --large
+    capacities = params.capacities if params.capacities else [params.small, params.large]
+
+    # create the initial state - in the initial state, all jugs are empty by
+    # default but maybe the user came out with a different idea ;)
+    if params.initial:
+        start = jugstate.JUGState(*params.initial)
+    elif params.capacities:
+        start = jugstate.JUGState(*[0] * len(capacities))
+    else:
+        start = jugstate.JUGState(params.small_initial, params.large_initial)
+
+    # the goal is given either as a string or the index of a jug
+    goal = int(params.goal) if params.goal.isdigit() else params.goal
+
+    # and create the instance to solve with the capacities and the target
+    # volume specified by the user. By default they are 3, 5 and 4 but, who
+    # knows? Any wrong value (e.g., a non-positive capacity or an initial volume
+    # exceeding the capacity of its jug) is reported by the instance itself
+    return jugproblem.JUGProblem(capacities, start, params.target, goal)
+
+
+def show_statistics(engine):
+    """show the statistics of the last search of the given search engine,
+       including those gathered per layer by its observer (see JUGStatistics)
+
+    """
+
+    print(" Expanded   : {0}".format(engine.get_expanded()))
+    print(" Generated  : {0}".format(engine.get_generated()))
+    print(" Duplicates : {0}".format(engine.get_duplicates()))
+
+    # only those search algorithms which notify observers gather statistics per
+    # layer. The depth of every state is the depth at which it is first
+    # generated, which is not its depth when expanded by depth-first search
+    # (see JUGStatistics)
+    layers = engine.get_observer().get_layers()
+    if len(layers) > 0:
+        print(" Max depth  : {0} (depth at which states are first generated)".format(
+            len(layers) - 1))
+        print(" {0:>6} {1:>10} {2:>10} {3:>10} {4:>10}".format("depth", "states", "expanded",
+                                                           "generated", "time (s)"))
+        for layer in layers:
+            print(" {0:>6} {1:>10} {2:>10} {3:>10} {4:>10.6f}".format(
+                layer["depth"], layer["states"], layer["expanded"], layer["generated"],
+                layer["time"]))
+
 
 # main
 # -----------------------------------------------------------------------------
@@ -34,36 +97,50 @@ def main():
     # invoke the parser
     params = jugparser.JUGParser().parse()
 
-    # in case the capacity of any jug has been modified, update it now
-    if params.small is not None:
-        if params.small <= 0:
-            raise ValueError(CRITICAL_WRONG_MAX_VOLUME)
-        jugstate.JUGState._smaller_capacity = params.small
-    if params.large is not None:
-        if params.large <= 0:
-            raise ValueError(CRITICAL_WRONG_MAX_VOLUME)
-        jugstate.JUGState._larger_capacity = params.large
-
-    # create the initial state - in the initial state, both jugs are empty by
-    # default but maybe the user came out with a different idea ;)
-    if params.small_initial > jugstate.JUGState._smaller_capacity or \
-       params.large_initial > jugstate.JUGState._larger_capacity:
-        raise ValueError(CRITICAL_WRONG_INITIAL_VOLUME)
-    start = jugstate.JUGState(params.small_initial, params.large_initial)
-
-    # make sure to use the target volume specified by the user. By default it is
-    # 4 but, who knows? Note, in particular, it is allowed to use impossible
-    # values such as a target which is strictly larger than the maximum capacity
-    # of any jug. That should not be problem and any algorithm ends with no
-    # solution found
-    jugstate.JUGState._target_volume = params.target
-
-    # invoke the selected search algorithm
+    # if any bound is given, every search is bounded by a budget
+    budget = None
+    if any(bound is not None for bound in (params.max_time, params.max_nodes, params.max_memory)):
+        budget = jugbudget.JUGBudget(params.max_time, params.max_nodes, params.max_memory)
+
+    # in batch mode, all instances are read from the given file and their
+    # solutions are written to the standard output as soon as they are found
+    if params.batch is not None:
+        jugbatch.run(params.batch, sys.stdout, params.algorithm,
+                     jugcache.JUGCache(params.cache_size), params.precheck,
+                     params.workers or 1, params.chunksize, not params.unordered, budget,
+                     closed=params.closed, heuristic=params.heuristic,
+                     cache_dir=params.cache_dir, bitmap=params.bitmap, cost=params.cost)
+        return
+
+    # create the instance to solve
+    problem = get_problem(params)
+
+    # create a search engine with the selected search algorithm and invoke it.
+    # Only the selected one is run (and timed). If requested, the search is
+    # skipped for instances which are proven unsolvable analytically
+    engine = jugsolvers.create(params.algorithm, problem,
+                               closed=params.closed, heuristic=params.heuristic,
+                               cache_dir=params.cache_dir, workers=params.workers,
+                               bitmap=params.bitmap, cost=params.cost)
+    #
+    # If requested, the search is observed to gather statistics per layer,
+    # bounded by a budget, given a table of transitions, or profiled.
+    # Otherwise, it runs exactly as fast as without these options. Searches
+    # exceeding their budget return a description of the bound exceeded
+    # instead of a solution
+    if params.stats:
+        engine.set_observer(jugobserver.JUGStatistics())
+    engine.set_budget(budget)
+    if params.transitions:
+        engine.set_transitions(jugtransitions.JUGTransitions(problem))
+    profiler = cProfile.Profile() if params.profile else None
     st = time.time()
-    solution = {
-        "depth-first": jugdfs.JUGDFS(start).solve(),
-        "breadth-first": jugbfs.JUGBFS(start).solve()
-    }[params.algorithm]
+    if params.precheck and jugbezout.is_unsolvable(problem):
+        solution = None
+    elif profiler is not None:
+        solution = profiler.runcall(engine.solve)
+    else:
+        solution = engine.solve()
     et = time.time()
 
     if solution is None:
@@ -71,8 +148,23 @@ def main():
     else:
         print(solution)
 
+    # the cost of solutions is shown only if the operators have a cost. It is
+    # computed from the operators applied, as most search algorithms ignore
+    # costs
+    if params.cost is not None and isinstance(solution, jugsolution.JUGSolution):
+        print("Cost: {0}".format(jugcosts.get_path_cost(problem, solution, params.cost)))
+
     print("Elapsed time: {:.3f} seconds".format(et - st))
 
+    if params.stats:
+        show_statistics(engine)
+
+    if profiler is not None:
+        if params.profile == '-':
+            pstats.Stats(profiler).sort_stats(pstats.SortKey.TIME).print_stats(20)
+        else:
+            profiler.dump_stats(params.profile)
+
 
 # -----------------------------------------------------------------------------
 if __name__ == '__main__':
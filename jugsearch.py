@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# jugsearch.py
+# Description:
+# -----------------------------------------------------------------------------
+#
+# Started on <sáb 17-10-2026 20:40:06.912733805 (1792269606)>
+# Carlos Linares López <carlos.linares@uc3m.es>
+#
+
+"""Base class of all search algorithms for solving the water jugs problem
+
+"""
+
+# imports
+# -----------------------------------------------------------------------------
+import jugbudget
+import jugobserver
+import jugproblem
+import jugtransitions
+
+# error messages
+# -----------------------------------------------------------------------------
+CRITICAL_WRONG_PROBLEM_TYPE = "The problem shall be an instance of JUGProblem. Aborting ..."
+CRITICAL_WRONG_TRANSITIONS = "The table of transitions shall be built for the same capacities than the problem. Aborting ..."
+
+# classes
+# -----------------------------------------------------------------------------
+
+# -----------------------------------------------------------------------------
+# JUGSearch
+#
+# Base class of all search algorithms. It stores the instance to solve and the
+# statistics of the last search
+# -----------------------------------------------------------------------------
+class JUGSearch(object):
+    """Base class of all search algorithms. It stores the instance to solve and
+       the statistics of the last search
+
+    """
+
+    def __init__(self, problem: jugproblem.JUGProblem):
+        """A search algorithm is initialized with the instance to solve, which
+           has to be an instance of JUGProblem
+
+        """
+
+        # verify the type of the problem
+        if not isinstance(problem, jugproblem.JUGProblem):
+            raise TypeError(CRITICAL_WRONG_PROBLEM_TYPE)
+
+        # store the data members of this instance
+        self._problem = problem
+
+        # and initialize the statistics of the search: the number of nodes
+        # generated, the number of those which were discarded because they had
+        # already been seen before, and the number of nodes expanded
+        self._generated, self._duplicates, self._expanded = 0, 0, 0
+
+        # search algorithms are neither observed (see set_observer) nor bounded
+        # (see set_budget) by default, and they compute children with the
+        # successor function of the instance unless a table of transitions is
+        # given (see set_transitions)
+        self._observer = None
+        self._budget = None
+        self._transitions = None
+
+    def get_budget(self) -> jugbudget.JUGBudget:
+        """return the budget of this search algorithm, if any"""
+
+        return self._budget
+
+    def get_duplicates(self) -> int:
+        """return the number of nodes generated in the last search which were
+           discarded because they had been seen before
+
+        """
+
+        return self._duplicates
+
+    def get_expanded(self) -> int:
+        """return the number of nodes expanded in the last search"""
+
+        return self._expanded
+
+    def get_generated(self) -> int:
+        """return the number of nodes generated in the last search"""
+
+        return self._generated
+
+    def get_observer(self) -> jugobserver.JUGObserver:
+        """return the observer of this search algorithm, if any"""
+
+        return self._observer
+
+    def get_problem(self) -> jugproblem.JUGProblem:
+        """return the instance solved by this search algorithm"""
+
+        return self._problem
+
+    def get_transitions(self) -> jugtransitions.JUGTransitions:
+        """return the table of transitions of this search algorithm, if any"""
+
+        return self._transitions
+
+    def set_budget(self, budget: jugbudget.JUGBudget):
+        """set the budget of time, nodes and memory of every search performed
+           with solve() (see JUGBudget). If it is exceeded, solve() returns an
+           instance of JUGBudgetExceeded instead of a solution. If None is
+           given, then searches are not bounded at all
+
+        """
+
+        self._budget = budget
+
+    def set_observer(self, observer: jugobserver.JUGObserver):
+        """set the observer of this search algorithm (see JUGObserver), which
+           is notified of every node expanded, generated and found to be a
+           goal. If None is given, then the search is not observed at all
+
+        """
+
+        self._observer = observer
+
+    def set_transitions(self, transitions: jugtransitions.JUGTransitions):
+        """set the table of transitions (see JUGTransitions) used to compute the
+           children of every node, which has to be built for the capacities of
+           the instance to solve. If None is given, then children are computed
+           with the successor function of the instance. Note that search
+           algorithms which expand whole layers at once do not use it
+
+        """
+
+        if transitions is not None and \
+           transitions.get_capacities() != self._problem.get_capacities():
+            raise ValueError(CRITICAL_WRONG_TRANSITIONS)
+
+        self._transitions = transitions
+
+    def _check(self, pending: int = 0):
+        """check the budget, if any, with the number of nodes expanded so far
+           plus the given number of nodes about to be expanded. It is used by
+           search algorithms which expand many nodes at once instead of using
+           the successor function (see _get_successors), so that they never
+           expand more nodes than allowed
+
+        """
+
+        if self._budget is not None:
+            self._budget.check(self._expanded + pending)
+
+    def _get_is_goal(self):
+        """return the goal function over packed states used by search
+           algorithms, which notifies the observer of goals, if any
+
+        """
+
+        # search algorithms do not check whether they are observed (or bounded)
+        # in their hot loop. Instead, if there is an observer, they use a goal
+        # function (and a successor function, see _get_successors) which
+        # notifies it, so that search algorithms which are not observed run
+        # exactly as fast as before. Likewise, budgets are checked by the
+        # successor function
+        if self._observer is None:
+            return self._problem.is_goal_packed
+        return jugobserver.observe_goal(self._observer, self._problem.is_goal_packed)
+
+    def _get_successors(self):
+        """return the successor function over packed states used by search
+           algorithms, which looks children up in the table of transitions, if
+           any, notifies the observer of nodes expanded and generated, if any,
+           and checks the budget, if any
+
+        """
+
+        successors = self._problem.successors
+        if self._transitions is not None:
+            successors = self._transitions.successors
+        if self._observer is not None:
+            successors = jugobserver.observe_successors(self._observer, successors)
+        if self._budget is not None:
+            successors = jugbudget.observe_budget(self._budget, successors)
+
+        return successors
+
+
+# Local Variables:
+# mode:python
+# fill-column:80
+# End:
@@ -0,0 +1,304 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# jugserver.py
+# Description:
+# -----------------------------------------------------------------------------
+#
+# Started on <dom 18-10-2026 09:12:05.318427706 (1792314725)>
+# Carlos Linares López <carlos.linares@uc3m.es>
+#
+
+"""Server which solves instances of the water jugs problem requested in JSON
+format over a Unix domain socket
+
+"""
+
+# imports
+# -----------------------------------------------------------------------------
+import argparse
+import asyncio
+import collections
+import concurrent.futures
+import concurrent.futures.process
+import json
+import os
+import signal
+import stat
+import tempfile
+import time
+
+import jugbatch
+import jugbudget
+import jugcache
+
+# error messages
+# -----------------------------------------------------------------------------
+CRITICAL_WRONG_REQUEST = "Requests shall be JSON objects"
+CRITICAL_UNKNOWN_COMMAND = "Unknown command '{0}'"
+CRITICAL_NOT_A_SOCKET = "'{0}' already exists and it is not a socket. Aborting ..."
+
+# constants
+# -----------------------------------------------------------------------------
+
+# by default, the server listens on a socket in the temporary directory which is
+# different for every user
+DEFAULT_SOCKET = os.path.join(tempfile.gettempdir(), "jugs-{0}.sock".format(os.getuid()))
+
+# number of latencies kept to compute percentiles, i.e., only those of the last
+# requests are considered
+LATENCIES = 10000
+
+# globals
+# -----------------------------------------------------------------------------
+
+# every worker process keeps its own cache of solutions (see _initialize)
+_cache = None
+
+# classes
+# -----------------------------------------------------------------------------
+
+# -----------------------------------------------------------------------------
+# JUGServer
+#
+# Server which solves instances of the water jugs problem requested in JSON
+# format over a Unix domain socket
+# -----------------------------------------------------------------------------
+class JUGServer(object):
+    """Server which solves instances of the water jugs problem requested in
+       JSON format over a Unix domain socket. Every request is a line with a
+       JSON object describing the instance as in batch mode (see
+       jugbatch.get_problem), along with the search algorithm and, optionally,
+       a flag precheck, a dictionary of options given to the search algorithm
+       (see jugsolvers.create), a dictionary with the budget of the search
+       (with keys time, nodes and/or memory, see jugbudget.JUGBudget) and an
+       id which is returned in the response.
+       Every response is a line with a JSON object with the solution as in
+       batch mode (see jugbatch.solve)
+
+       The request {"command": "stats"} returns the statistics of the server
+
+    """
+
+    def __init__(self, path: str = DEFAULT_SOCKET, workers: int = None, cache_size: int = 128):
+        """A server is initialized with the path of the Unix domain socket it
+           listens on, the number of processes which solve instances (by
+           default, as many as cores) and the size of the cache of every one
+           (see JUGCache)
+
+        """
+
+        # store the data members of this instance
+        self._path, self._workers, self._cache_size = path, workers, cache_size
+
+        # requests being solved, indexed by their description, so that
+        # identical requests received while the first one is being solved wait
+        # for it instead of being solved again
+        self._pending = {}
+
+        # and initialize the statistics of the server
+        self._requests, self._coalesced = 0, 0
+        self._latencies = collections.deque(maxlen=LATENCIES)
+
+    def get_statistics(self) -> dict:
+        """return a dictionary with the number of requests served, the number
+           of them which were coalesced with identical requests being solved,
+           and the median (p50) and 99th percentile (p99) of the latency of the
+           last requests, in seconds
+
+        """
+
+        latencies = sorted(self._latencies)
+        return {"requests": self._requests,
+                "coalesced": self._coalesced,
+                "p50": _percentile(latencies, 0.50),
+                "p99": _percentile(latencies, 0.99)}
+
+    async def serve(self):
+        """serve requests until the server is cancelled"""
+
+        # sockets left by previous servers are removed, but any other file is
+        # never overwritten
+        if os.path.exists(self._path):
+            if not stat.S_ISSOCK(os.stat(self._path).st_mode):
+                raise ValueError(CRITICAL_NOT_A_SOCKET.format(self._path))
+            os.unlink(self._path)
+
+        # searches are CPU-bound, and thus they are performed in a pool of
+        # processes, whereas this process only reads requests and writes
+        # responses, which is done asynchronously
+        self._executor = self._create_executor()
+        try:
+            server = await asyncio.start_unix_server(self._handle, path=self._path)
+
+            # the server is stopped either with a keyboard interrupt or when it
+            # is terminated, so that the socket is always removed
+            asyncio.get_running_loop().add_signal_handler(signal.SIGTERM,
+                                                          asyncio.current_task().cancel)
+            try:
+                async with server:
+                    await server.serve_forever()
+            finally:
+                if os.path.exists(self._path):
+                    os.unlink(self._path)
+        finally:
+            self._executor.shutdown()
+
+    def _create_executor(self) -> concurrent.futures.ProcessPoolExecutor:
+        """return a new pool of processes which solve instances, each one with
+           its own cache
+
+        """
+
+        return concurrent.futures.ProcessPoolExecutor(self._workers, initializer=_initialize,
+                                                      initargs=(self._cache_size,))
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        """serve all requests received through the given connection, in the
+           same order they are received
+
+        """
+
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+
+                start = time.perf_counter()
+                response = await self._respond(line)
+                writer.write((json.dumps(response, separators=(',', ':')) + '\n').encode())
+                await writer.drain()
+                self._latencies.append(time.perf_counter() - start)
+        finally:
+            writer.close()
+
+    async def _respond(self, line: bytes) -> dict:
+        """return the response to the request given in the line"""
+
+        try:
+            request = json.loads(line)
+            if not isinstance(request, dict):
+                raise ValueError(CRITICAL_WRONG_REQUEST)
+        except ValueError as error:
+            return {"error": str(error)}
+
+        # commands are served by this process
+        if "command" in request:
+            if request["command"] == "stats":
+                return self.get_statistics()
+            return {"error": CRITICAL_UNKNOWN_COMMAND.format(request["command"])}
+
+        # identical requests (other than their id) are solved only once, and
+        # all of them wait for the same search. Note that every one decodes
+        # its own copy of the response before adding its id. Any failure of
+        # the worker (e.g., a table which can not be written, or a worker
+        # process which died) is reported as the response of every request
+        # waiting for it, so that connections are never closed without a reply
+        self._requests += 1
+        identifier = request.pop("id", None)
+        key = json.dumps(request, sort_keys=True)
+        executor = self._executor
+        try:
+            if key in self._pending:
+                self._coalesced += 1
+                response = await asyncio.shield(self._pending[key])
+            else:
+                future = asyncio.get_running_loop().run_in_executor(executor, _solve, request)
+                self._pending[key] = future
+                try:
+                    response = await future
+                finally:
+                    del self._pending[key]
+        except Exception as error:
+            response = jugbatch.encode({"line": 0, "error": str(error)})
+
+            # if a worker process died (e.g., killed by the system when running
+            # out of memory), the pool can not be used anymore, and it is
+            # replaced with a new one, unless another request did it already
+            if isinstance(error, concurrent.futures.process.BrokenProcessPool) and \
+               self._executor is executor:
+                executor.shutdown(wait=False)
+                self._executor = self._create_executor()
+
+        response = jugbatch.decode(response)
+        del response["line"]
+        if identifier is not None:
+            response["id"] = identifier
+        return response
+
+
+# functions
+# -----------------------------------------------------------------------------
+def _initialize(cache_size: int):
+    """initialize a worker process with its own cache of the given size"""
+
+    global _cache
+    _cache = jugcache.JUGCache(cache_size)
+
+
+def _percentile(values: list, fraction: float) -> float:
+    """return the value below which the given fraction of the given sorted
+       values fall, or None if there are no values
+
+    """
+
+    if len(values) == 0:
+        return None
+    return values[min(len(values) - 1, int(fraction * len(values)))]
+
+
+def _solve(request: dict) -> tuple:
+    """solve the given request in a worker process and return its result
+       encoded (see jugbatch.encode)
+
+    """
+
+    options = request.get("options", {})
+    if not isinstance(options, dict):
+        options = {}
+
+    # wrong budgets are reported as any other error in the request
+    try:
+        limits = request.get("budget")
+        budget = None if limits is None else jugbudget.JUGBudget(
+            limits.get("time"), limits.get("nodes"), limits.get("memory"))
+    except (AttributeError, TypeError, ValueError) as error:
+        return jugbatch.encode({"line": 0, "error": str(error)})
+
+    result = next(jugbatch.solve([(0, request)], cache=_cache,
+                                 precheck=request.get("precheck", False), budget=budget,
+                                 **options))
+    return jugbatch.encode(result)
+
+
+# main
+# -----------------------------------------------------------------------------
+def main():
+    """main body"""
+
+    parser = argparse.ArgumentParser(description="Server which solves instances of the water jugs problem requested over a Unix domain socket")
+    parser.add_argument('-u', '--socket', type=str, default=DEFAULT_SOCKET,
+                        help="path of the Unix domain socket to listen on. By default, '{0}'".format(DEFAULT_SOCKET))
+    parser.add_argument('-w', '--workers', type=int,
+                        help="number of processes solving instances. By default, as many as cores")
+    parser.add_argument('-k', '--cache-size', type=int, default=128,
+                        help="maximum number of solutions remembered by every process. By default, 128")
+    params = parser.parse_args()
+
+    try:
+        asyncio.run(JUGServer(params.socket, params.workers, params.cache_size).serve())
+    except (KeyboardInterrupt, asyncio.CancelledError):
+        pass
+
+
+# -----------------------------------------------------------------------------
+if __name__ == '__main__':
+
+    main()
+
+
+# Local Variables:
+# mode:python
+# fill-column:80
+# End:
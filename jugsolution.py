@@ -15,12 +15,32 @@ Definition of a solution to the water jugs problem
 
 # imports
 # -----------------------------------------------------------------------------
+import array
+import json
+import struct
+import sys
+
+import jugproblem
 import jugstate
 
 # error messages
 # -----------------------------------------------------------------------------
 CRITICAL_WRONG_SOLUTION_LENGTH = "Solutions should consist of at least one state. Aborting ..."
 CRITICAL_WRONG_ITEM_TYPE = "'{0}' is not an instance of a jug state"
+CRITICAL_WRONG_START_LENGTH = "The start state should have as many jugs as capacities are given"
+CRITICAL_WRONG_OPERATOR = "'{0}' is not an operator of an instance with {1} jugs"
+CRITICAL_WRONG_STEP = "There is no operator which transforms '{0}' into '{1}'"
+CRITICAL_TRUNCATED_DATA = "The data given is not a complete solution. Aborting ..."
+CRITICAL_WRONG_TYPECODE = "'{0}' is not the type code of the operators of a solution. Aborting ..."
+
+# constants
+# -----------------------------------------------------------------------------
+
+# every solution is serialized with a header with the number of jugs, the type
+# code of its operators, the number of operators and its cost, followed by the
+# capacity of every jug, the volume of every jug in the start state and the
+# code of every operator (see dumps)
+HEADER = struct.Struct("<HcIQ")
 
 # classes
 # -----------------------------------------------------------------------------
@@ -28,71 +48,301 @@ CRITICAL_WRONG_ITEM_TYPE = "'{0}' is not an instance of a jug state"
 # -----------------------------------------------------------------------------
 # JUGSolution
 #
-# Stores a solution to the water jugs problem as a list of states of JUGState
+# Stores a solution to the water jugs problem as the start state and the
+# sequence of operators applied to it
 # -----------------------------------------------------------------------------
 class JUGSolution(object):
-    """Stores a solution to the water jugs problem as a list of states of
-       JUGState
+    """Stores a solution to the water jugs problem as the start state and the
+       sequence of operators applied to it (see JUGProblem.apply). States are
+       only created when they are requested, e.g., when iterating over it
 
     """
 
-    def __init__(self, states: list):
-        """A solution is initialized with a list of states of JUGState"""
+    def __init__(self, capacities: tuple, start: jugstate.JUGState, operators, cost: int = None):
+        """A solution is initialized with the capacity of every jug, the start
+           state, a sequence with the code of every operator applied (see
+           JUGProblem.apply) and, optionally, its cost. By default, the cost of
+           a solution is its number of steps. Use from_path or from_states to
+           create a solution from a path of states instead
+
+        """
 
-        # verify the list is not empty, that would not make any sense! Even if
-        # one tries to solve a problem from the start state to it, the solution
+        # verify the capacities and the start state exactly as JUGProblem does,
+        # i.e., the start state is an instance of jugstate with as many jugs as
+        # capacities, and no volume exceeds the capacity of its jug. Even if one
+        # tries to solve a problem from the start state to it, the solution
         # should contain at least the start state
-        if len(states) == 0:
-            raise ValueError(CRITICAL_WRONG_SOLUTION_LENGTH)
+        capacities = tuple(capacities)
+        if len(capacities) == 0:
+            raise ValueError(jugproblem.CRITICAL_WRONG_CAPACITIES_LENGTH)
+        for capacity in capacities:
+            if not isinstance(capacity, int):
+                raise TypeError(jugproblem.CRITICAL_WRONG_CAPACITY_TYPE)
+            if capacity <= 0:
+                raise ValueError(jugproblem.CRITICAL_WRONG_CAPACITY_VALUE)
+        if not isinstance(start, jugstate.JUGState):
+            raise TypeError(CRITICAL_WRONG_ITEM_TYPE.format(start))
+        if len(start) != len(capacities):
+            raise ValueError(CRITICAL_WRONG_START_LENGTH)
+        for volume, capacity in zip(start.get_volumes(), capacities):
+            if volume > capacity:
+                raise ValueError(jugproblem.CRITICAL_WRONG_START_VALUE)
 
-        # also, verify the list consist of instances of jugstate
-        for item in states:
-            if not isinstance(item, jugstate.JUGState):
-                raise TypeError(CRITICAL_WRONG_ITEM_TYPE)
+        # operators are stored in an array with the smallest unsigned ints which
+        # can hold any operator, i.e., one byte per step with up to 15 jugs.
+        # They are verified before, so that wrong operators are always reported
+        # as such, whatever their type
+        noperators = len(capacities) * (len(capacities) + 1)
+        if not isinstance(operators, array.array):
+            operators = list(operators)
+        for operator in operators:
+            if not isinstance(operator, int) or not 0 <= operator < noperators:
+                raise ValueError(CRITICAL_WRONG_OPERATOR.format(operator, len(capacities)))
+        operators = array.array(_typecode(noperators), operators)
 
         # initialize the data members of this container
-        self._solution = states
-
-        # also define data members for implementing iterators
-        self._index = 0
+        self._capacities = capacities
+        self._start = start
+        self._operators = operators
+        self._cost = len(operators) if cost is None else cost
 
-    def __len__(self):
+    def __len__(self) -> int:
         """return the numbef of states in this solution, which is by definition
            equal to the step length plus one
 
         """
 
-        return len(self._solution)
+        return len(self._operators) + 1
 
     def __iter__(self):
-        """define the base case for iterators"""
+        """return a new iterator over the states of this solution, which are
+           created only as they are requested. Different iterators are
+           independent of each other
+
+        """
+
+        # operators are applied exactly as in JUGProblem.apply but directly on
+        # the volume of every jug
+        capacities = self._capacities
+        volumes = list(self._start.get_volumes())
+        njugs = len(volumes)
 
-        self._index = 0
-        return self
+        yield self._start
+        for operator in self._operators:
 
-    def __next__(self):
-        """define the next step for iterators"""
+            # emptying jugs
+            if operator < njugs:
+                volumes[operator] = 0
 
-        if self._index >= len(self._solution):
-            raise StopIteration
+            # filling up
+            elif operator < 2 * njugs:
+                volumes[operator - njugs] = capacities[operator - njugs]
 
-        self._index += 1
-        return self._solution[self._index - 1]
+            # pouring from one jug to another
+            else:
+                i, j = divmod(operator - 2 * njugs, njugs - 1)
+                if j >= i:
+                    j += 1
+                volume = min(volumes[i], capacities[j] - volumes[j])
+                volumes[i] -= volume
+                volumes[j] += volume
 
-    def __str__(self):
+            yield jugstate.JUGState(*volumes)
+
+    def __str__(self) -> str:
         """return a string representation of this solution"""
 
-        output = "{0}".format(self._solution[0])
-        for istate in self._solution[1:]:
-            output += " -- {0}".format(istate)
+        return " -- ".join(str(state) for state in self)
+
+    def get_capacities(self) -> tuple:
+        """return the capacity of every jug"""
+
+        return self._capacities
+
+    def get_cost(self) -> int:
+        """return the cost of this solution"""
+
+        return self._cost
+
+    def get_operators(self) -> array.array:
+        """return an array with the code of every operator of this solution (see
+           JUGProblem.apply), which shall not be modified
+
+        """
+
+        return self._operators
+
+    def get_solution(self) -> list:
+        """return a new list with all states of this solution"""
+
+        return list(self)
+
+    def get_start(self) -> jugstate.JUGState:
+        """return the start state of this solution"""
+
+        return self._start
+
+
+# functions
+# -----------------------------------------------------------------------------
+def dump(solution: JUGSolution, stream):
+    """write the given solution to the given binary stream (see dumps).
+       Solutions are self-delimited, so that any number of them can be written
+       one after another to the same stream and read back with load
+
+    """
+
+    stream.write(dumps(solution))
+
+
+def dumps(solution: JUGSolution) -> bytes:
+    """return a compact binary representation of the given solution, which
+       takes a few bytes for the instance and its cost, and then as few as one
+       byte per step. All values are stored in little-endian order
+
+    """
+
+    capacities, operators = solution.get_capacities(), solution.get_operators()
+    njugs = len(capacities)
+    header = HEADER.pack(njugs, operators.typecode.encode(), len(operators), solution.get_cost())
+    jugs = struct.pack("<{0}I".format(2 * njugs), *capacities, *solution.get_start().get_volumes())
+
+    # operators are stored in the native order of arrays, so that they are
+    # swapped in big-endian systems
+    if sys.byteorder == "big" and operators.itemsize > 1:
+        operators = array.array(operators.typecode, operators)
+        operators.byteswap()
+
+    return header + jugs + operators.tobytes()
+
+
+def from_json(text: str) -> JUGSolution:
+    """return the solution represented by the given string in JSON format (see
+       to_json)
 
-        # and return the output string
-        return output
+    """
+
+    data = json.loads(text)
+    return JUGSolution(data["capacities"], jugstate.JUGState(*data["start"]),
+                       data["operators"], data["cost"])
+
+
+def from_path(problem: jugproblem.JUGProblem, path: list, cost: int = None) -> JUGSolution:
+    """return the solution of the given instance which consists of the given
+       path of packed states (see JUGProblem.pack), with the given cost
+
+    """
+
+    if len(path) == 0:
+        raise ValueError(CRITICAL_WRONG_SOLUTION_LENGTH)
+
+    operators = []
+    for parent, child in zip(path, path[1:]):
+        operator = problem.operator(parent, child)
+        if operator is None:
+            raise ValueError(CRITICAL_WRONG_STEP.format(problem.unpack(parent),
+                                                        problem.unpack(child)))
+        operators.append(operator)
+
+    return JUGSolution(problem.get_capacities(), problem.unpack(path[0]), operators, cost)
+
+
+def from_states(capacities: tuple, states: list, cost: int = None) -> JUGSolution:
+    """return the solution with the given capacities which consists of the
+       given list of states of JUGState, with the given cost
+
+    """
+
+    # verify the list is not empty and that it consists of instances of
+    # jugstate
+    if len(states) == 0:
+        raise ValueError(CRITICAL_WRONG_SOLUTION_LENGTH)
+    for item in states:
+        if not isinstance(item, jugstate.JUGState):
+            raise TypeError(CRITICAL_WRONG_ITEM_TYPE.format(item))
+
+    # states are packed in an instance with the given capacities, whose target
+    # and goal are irrelevant here
+    problem = jugproblem.JUGProblem(capacities, states[0], 0)
+    return from_path(problem, [problem.pack(state) for state in states], cost)
+
+
+def load(stream) -> JUGSolution:
+    """return the next solution written to the given binary stream (see dump),
+       or None if the stream is exhausted
+
+    """
+
+    header = stream.read(HEADER.size)
+    if len(header) == 0:
+        return None
+    if len(header) < HEADER.size:
+        raise ValueError(CRITICAL_TRUNCATED_DATA)
+
+    njugs, typecode, length, _ = HEADER.unpack(header)
+    size = 8 * njugs + length * array.array(typecode.decode()).itemsize
+    body = stream.read(size)
+    if len(body) < size:
+        raise ValueError(CRITICAL_TRUNCATED_DATA)
+
+    return loads(header + body)
+
+
+def loads(data: bytes) -> JUGSolution:
+    """return the solution represented by the given bytes (see dumps)"""
+
+    if len(data) < HEADER.size:
+        raise ValueError(CRITICAL_TRUNCATED_DATA)
+    njugs, typecode, length, cost = HEADER.unpack_from(data)
+    if typecode not in (b'B', b'H', b'I', b'L'):
+        raise ValueError(CRITICAL_WRONG_TYPECODE.format(typecode.decode("latin-1")))
+    jugs = struct.unpack_from("<{0}I".format(2 * njugs), data, HEADER.size)
+
+    operators = array.array(typecode.decode())
+    offset = HEADER.size + 8 * njugs
+    end = offset + length * operators.itemsize
+    if len(data) < end:
+        raise ValueError(CRITICAL_TRUNCATED_DATA)
+    operators.frombytes(data[offset:end])
+    if sys.byteorder == "big" and operators.itemsize > 1:
+        operators.byteswap()
+
+    # data written by other means are not trusted: the code of every operator
+    # shall be less than the number of operators with the given number of
+    # jugs, and the capacities and the start state are verified when the
+    # solution is created
+    noperators = njugs * (njugs + 1)
+    if len(operators) > 0 and max(operators) >= noperators:
+        raise ValueError(CRITICAL_WRONG_OPERATOR.format(max(operators), njugs))
+
+    return JUGSolution(jugs[:njugs], jugstate.JUGState(*jugs[njugs:]), operators, cost)
+
+
+def to_json(solution: JUGSolution) -> str:
+    """return a compact representation of the given solution in JSON format,
+       with the capacities, the start state, the code of every operator and
+       its cost
+
+    """
+
+    return json.dumps({"capacities": solution.get_capacities(),
+                       "start": solution.get_start().get_volumes(),
+                       "operators": solution.get_operators().tolist(),
+                       "cost": solution.get_cost()},
+                      separators=(',', ':'))
+
+
+def _typecode(noperators: int) -> str:
+    """return the type code of the smallest unsigned ints which can hold the
+       given number of operators
+
+    """
 
-    def get_solution(self):
-        """return the list of states of this solution"""
+    for typecode in ('B', 'H', 'I'):
+        if noperators <= 1 << (8 * array.array(typecode).itemsize):
+            return typecode
 
-        return self._solution
+    return 'L'
 
 
 # Local Variables:
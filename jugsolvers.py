@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# jugsolvers.py
+# Description:
+# -----------------------------------------------------------------------------
+#
+# Started on <sáb 17-10-2026 20:05:12.318204117 (1792267512)>
+# Carlos Linares López <carlos.linares@uc3m.es>
+#
+
+"""Registry of all the search algorithms available for solving the water jugs
+problem
+
+"""
+
+# imports
+# -----------------------------------------------------------------------------
+import jugastar
+import jugbezout
+import jugbfs
+import jugbibfs
+import jugdfs
+import jugidastar
+import jugnumpybfs
+import jugpbfs
+import jugtable
+import jugucs
+
+# error messages
+# -----------------------------------------------------------------------------
+CRITICAL_DUPLICATE_SOLVER = "The search algorithm '{0}' has already been registered. Aborting ..."
+CRITICAL_UNKNOWN_SOLVER = "Unknown search algorithm '{0}'. Aborting ..."
+CRITICAL_WRONG_SOLVER_TYPE = "The search algorithm '{0}' shall be registered with a callable. Aborting ..."
+
+# globals
+# -----------------------------------------------------------------------------
+
+# the registry maps the name of every search algorithm to a callable which,
+# given the instance to solve, returns a search engine, i.e., an object with a
+# method solve() that returns either an instance of JUGSolution or None. Note
+# that the callable is stored, but never invoked until a search algorithm is
+# selected, so that registering search algorithms has no cost at all.
+#
+# Along with the callable, the registry stores the names of the keyword
+# arguments it accepts (e.g., the heuristic of informed search algorithms), so
+# that the same options can be given to any search algorithm, and each one
+# takes only those it understands
+_SOLVERS = {}
+
+# functions
+# -----------------------------------------------------------------------------
+def register(name: str, solver, options: tuple = ()):
+    """register a new search algorithm with the given name. The solver is a
+       callable (usually, a class) which returns a search engine when invoked
+       with the instance to solve, an instance of JUGProblem, and any of the
+       given keyword arguments
+
+    """
+
+    # verify the solver can be invoked and that the name has not been used
+    # before
+    if not callable(solver):
+        raise TypeError(CRITICAL_WRONG_SOLVER_TYPE.format(name))
+    if name in _SOLVERS:
+        raise ValueError(CRITICAL_DUPLICATE_SOLVER.format(name))
+
+    _SOLVERS[name] = (solver, tuple(options))
+
+
+def create(name: str, problem, **options):
+    """return a search engine of the search algorithm with the given name for
+       solving the given instance. Only those options accepted by the search
+       algorithm are given to it, and all the others are ignored
+
+    """
+
+    solver, accepted = _SOLVERS[get_name(name)]
+    return solver(problem, **{option: value for option, value in options.items()
+                              if option in accepted and value is not None})
+
+
+def get_name(name: str) -> str:
+    """return the given name if a search algorithm has been registered with it,
+       and raise an exception otherwise
+
+    """
+
+    if name not in _SOLVERS:
+        raise ValueError(CRITICAL_UNKNOWN_SOLVER.format(name))
+
+    return name
+
+
+def get_names() -> list:
+    """return the names of all search algorithms registered so far, in the same
+       order they were registered
+
+    """
+
+    return list(_SOLVERS)
+
+
+def get_options(name: str) -> tuple:
+    """return the names of the keyword arguments accepted by the search
+       algorithm registered with the given name
+
+    """
+
+    return _SOLVERS[get_name(name)][1]
+
+
+def get_solver(name: str):
+    """return the callable registered with the given name"""
+
+    return _SOLVERS[get_name(name)][0]
+
+
+# registration of all search algorithms
+# -----------------------------------------------------------------------------
+register("depth-first", jugdfs.JUGDFS, ("closed", "bitmap"))
+register("breadth-first", jugbfs.JUGBFS, ("bitmap",))
+register("breadth-first-numpy", jugnumpybfs.JUGNumPyBFS)
+register("breadth-first-parallel", jugpbfs.JUGParallelBFS, ("workers",))
+register("bezout", jugbezout.JUGBezout)
+register("bidirectional", jugbibfs.JUGBiBFS)
+register("astar", jugastar.JUGAStar, ("heuristic",))
+register("idastar", jugidastar.JUGIDAStar, ("heuristic",))
+register("table", jugtable.JUGTableSearch, ("cache_dir",))
+register("uniform-cost", jugucs.JUGUniformCost, ("cost",))
+
+
+# Local Variables:
+# mode:python
+# fill-column:80
+# End:
@@ -18,8 +18,9 @@ Definition of a state in the water jugs problem
 
 # error messages
 # -----------------------------------------------------------------------------
-CRITICAL_WRONG_VOLUME_TYPE = "The volume used either in the larger or smaller jug should be an int"
-CRITICAL_WRONG_VOLUME_VALUE = "The volume used either in the larger or smaller jug exceeds its capacity"
+CRITICAL_WRONG_STATE_LENGTH = "A state should contain the volume of at least one jug"
+CRITICAL_WRONG_VOLUME_TYPE = "The volume used in every jug should be an int"
+CRITICAL_WRONG_VOLUME_VALUE = "The volume used in every jug can not be negative"
 
 # classes
 # -----------------------------------------------------------------------------
@@ -32,58 +33,44 @@ CRITICAL_WRONG_VOLUME_VALUE = "The volume used either in the larger or smaller j
 class JUGState(object):
     """Definition of a state in the water jugs problem"""
 
-    # static attributes
-    #
-    # all instances of this class refer to different occupations of both water
-    # jugs. Their maximum capacity is therefore an invariant and can be stored
-    # as a static attribute to be shared by all instances
-    _smaller_capacity = 3
-    _larger_capacity = 5
+    # states are created in large numbers, so that they do not use a dictionary
+    # to store their data members. Instead, slots are used which saves a lot of
+    # memory per instance. Note, however, that search algorithms do not store
+    # instances of this class, but integers which pack the state (see
+    # JUGProblem.pack), and instances of JUGState are only created to return
+    # solutions to the user
+    __slots__ = ("_volumes",)
 
-    # also, the target volume of water to get in one of the jugs is an invariant
-    # (ie., no operator modifies this) and thus it can be also shared among all
-    # instances
-    _target_volume = 4
-
-    def __init__(self, smaller: int, larger: int):
-        """A state is initialized explicitly specifying the volume used in the
-           smaller and larger jug, respectively
+    def __init__(self, *volumes: int):
+        """A state is initialized explicitly specifying the volume used in every
+           jug, e.g., JUGState(0, 0) for two empty jugs. Note that states do
+           not know the capacity of the jugs, which is defined by the instance
+           of the problem (see JUGProblem)
 
         """
 
-        # well, both values should be ints, if not, halting ...
-        if not isinstance(smaller, int) or not isinstance(larger, int):
-            raise TypeError(CRITICAL_WRONG_VOLUME_TYPE)
-
-        # likewise, if the volume used in either jug exceeds its capacity then
-        # halting as well ...
-        if smaller > JUGState._smaller_capacity or larger > JUGState._larger_capacity:
-            raise ValueError(CRITICAL_WRONG_VOLUME_VALUE)
-
-        # initialize the data members of this class
-        self._smaller, self._larger = smaller, larger
-
-        # some algorithms might require the state to store the path from the
-        # start state to it. Initialize a data member to store this information
-        # in case it is needed
-        self._path = []
-
+        # there should be at least one jug
+        if len(volumes) == 0:
+            raise ValueError(CRITICAL_WRONG_STATE_LENGTH)
 
-    def __add__(self, other):
-        """add an instance of JUGState to this one, thus growing the path"""
+        # well, all values should be ints, if not, halting ...
+        for volume in volumes:
+            if not isinstance(volume, int):
+                raise TypeError(CRITICAL_WRONG_VOLUME_TYPE)
 
-        # append the new state to the path. Type verification skipped ...
-        self._path.append(other)
+            # likewise, if the volume used in any jug is negative then halting
+            # as well ...
+            if volume < 0:
+                raise ValueError(CRITICAL_WRONG_VOLUME_VALUE)
 
-        # and return this instance
-        return self
+        # initialize the data members of this class
+        self._volumes = tuple(volumes)
 
     def __eq__(self, other) -> bool:
         """return True if and only if this instance is strictly equal to other"""
 
         # skipping type verification ...
-        return self._smaller == other.get_smaller() and \
-            self._larger == other.get_larger()
+        return self._volumes == other.get_volumes()
 
     def __hash__(self) -> int:
         """return the hash of this instance"""
@@ -91,34 +78,30 @@ class JUGState(object):
         # states are likely to be used in frozensets or other structures
         # requiring a partial order. This is achieved by means of a hash code
         # which is then provided here
-        return hash((self._smaller, self._larger))
-
-    def __str__(self) -> str:
-        """return a string representation of this instance"""
+        return hash(self._volumes)
 
-        output = "({0}, {1})".format(self._smaller, self._larger)
+    def __len__(self) -> int:
+        """return the number of jugs of this state"""
 
-        # in case this instance contains a path, show it also
-        if len(self._path) > 0:
+        return len(self._volumes)
 
-            output += " [({0}, {1})".format(self._path[0]._smaller,
-                                            self._path[0]._larger)
-            for istate in range(1, len(self._path)):
-                output += " -- ({0}, {1})".format(self._path[istate]._smaller, \
-                                                  self._path[istate]._larger)
-            output += "]"
+    def __str__(self) -> str:
+        """return a string representation of this instance"""
 
-        # and return the string representation
-        return output
+        return "({0})".format(", ".join(str(volume) for volume in self._volumes))
 
-    def children(self) -> list:
+    def children(self, problem) -> list:
         """return a list with all children of this instance, i.e., instances
-           immediately accessible from this one by means of an operator
+           immediately accessible from this one by means of an operator in the
+           given instance of JUGProblem
 
         """
 
         # -- initialization
         children = []
+        capacities = problem.get_capacities()
+        volumes = self._volumes
+        njugs = len(volumes)
 
         # the "coding" (not programming!) of all operators is always the same:
         #
@@ -131,73 +114,53 @@ class JUGState(object):
         #
         # The postconditions explicitly specify how to generate the child when a
         # specific operator is applicable
+        #
+        # With n jugs there are n operators for emptying jugs, n operators for
+        # filling them up, and n x (n-1) operators for pouring water from one
+        # jug to another. They are always considered in this order
 
         # emptying jugs
         # ---------------------------------------------------------------------
-        if self._smaller > 0:                                   # preconditions
-            children.append(JUGState(0, self._larger))         # postconditions
-        if self._larger > 0:                                    # preconditions
-            children.append(JUGState(self._smaller, 0))        # postconditions
+        for i in range(njugs):
+            if volumes[i] > 0:                                  # preconditions
+                children.append(JUGState(*volumes[:i], 0,      # postconditions
+                                         *volumes[i+1:]))
 
         # filling up
         # ---------------------------------------------------------------------
-        if self._smaller < JUGState._smaller_capacity:          # preconditions
-            children.append(JUGState(JUGState._smaller_capacity,
-                                     self._larger))            # postconditions
-        if self._larger < JUGState._larger_capacity:            # preconditions
-            children.append(JUGState(self._smaller,            # postconditions
-                                     JUGState._larger_capacity))
-
-        # pouring from one jug to the other
+        for i in range(njugs):
+            if volumes[i] < capacities[i]:                      # preconditions
+                children.append(JUGState(*volumes[:i],         # postconditions
+                                         capacities[i], *volumes[i+1:]))
+
+        # pouring from one jug to another
         # ---------------------------------------------------------------------
 
         # The minimum between the volume in one jug and the available volume in
         # the other is the exact volume that can be poured
+        for i in range(njugs):
+            for j in range(njugs):
 
-        # smaller -> larger
-        volume = min(self._smaller, JUGState._larger_capacity - self._larger)
-        if volume > 0:                                          # preconditions
-            children.append(JUGState(self._smaller - volume,   # postconditions
-                                     self._larger + volume))
-
-        # larger -> smaller
-        volume = min(self._larger, JUGState._smaller_capacity - self._smaller)
-        if volume > 0:                                          # preconditions
-            children.append(JUGState(self._smaller + volume,   # postconditions
-                                     self._larger - volume))
+                # i -> j
+                volume = min(volumes[i], capacities[j] - volumes[j])
+                if i != j and volume > 0:                       # preconditions
+                    child = list(volumes)                      # postconditions
+                    child[i] -= volume
+                    child[j] += volume
+                    children.append(JUGState(*child))
 
         # return all children computed so far
         return children
 
-    def get_smaller(self) -> int:
-        """return the volume used in the smaller jug"""
-
-        return self._smaller
-
-    def get_larger(self) -> int:
-        """return the volume used in the larger jug"""
-
-        return self._larger
+    def get_volume(self, index: int) -> int:
+        """return the volume used in the jug with the given index"""
 
-    def get_path(self) -> list:
-        """return the path from the start state to this one"""
+        return self._volumes[index]
 
-        return self._path
-
-    def is_goal(self) -> bool:
-        """return True if and only if this instance is a goal state"""
-
-        return self._smaller == JUGState._target_volume or \
-            self._larger == JUGState._target_volume
-
-
-    def set_path(self, path: list):
-        """set the path from the start state to this one as a list of instances
-           of JUGState
-
-        """
+    def get_volumes(self) -> tuple:
+        """return a tuple with the volume used in every jug"""
 
-        self._path = path
+        return self._volumes
 
 
 # Local Variables:
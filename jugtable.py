@@ -0,0 +1,356 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# jugtable.py
+# Description:
+# -----------------------------------------------------------------------------
+#
+# Started on <dom 18-10-2026 01:26:55.437092818 (1792286815)>
+# Carlos Linares López <carlos.linares@uc3m.es>
+#
+
+"""Precomputed tables with the distance to the goal and the next move for every
+state and target of the water jugs problem, stored on disk
+
+"""
+
+# imports
+# -----------------------------------------------------------------------------
+import array
+import mmap
+import os
+import struct
+import tempfile
+
+import jugbudget
+import jugproblem
+import jugsearch
+import jugsolution
+import jugstate
+
+# error messages
+# -----------------------------------------------------------------------------
+CRITICAL_WRONG_TABLE_FILE = "The file '{0}' is not a valid table for the capacities given. Aborting ..."
+CRITICAL_TOO_MANY_JUGS = "Tables can not be built for {0} jugs, as their next moves are stored in one byte. Use less than 16 jugs. Aborting ..."
+
+# constants
+# -----------------------------------------------------------------------------
+
+# every file starts with a magic string and a version number which is
+# incremented whenever the format changes, so that files written with a
+# different format are rebuilt
+MAGIC = b"JUGT"
+VERSION = 1
+
+# the header consists of the magic string, the version, the number of jugs, the
+# goal (encoded as an integer, see below), the number of targets, the number of
+# states and the typecode of distances. It is followed by the capacity of every
+# jug, and it is padded to a multiple of eight bytes
+HEADER = struct.Struct("<4sHHiIQc")
+
+# encoding of the goal in the header. Specific jugs are encoded with their
+# index
+GOALS = {jugproblem.GOAL_ANY: -1, jugproblem.GOAL_TOTAL: -2}
+
+# distances of states which can not reach the target, and next move of states
+# which are either a goal or can not reach the target
+UNREACHABLE = {'H': 0xFFFF, 'I': 0xFFFFFFFF}
+NO_OPERATOR = 0xFF
+
+# by default, tables are stored in this directory
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "jugs")
+
+# globals
+# -----------------------------------------------------------------------------
+
+# every process keeps the tables opened so far, indexed by their capacities,
+# goal and directory, so that every table is memory-mapped only once, however
+# many instances are solved with it (see JUGTableSearch)
+_tables = {}
+
+# classes
+# -----------------------------------------------------------------------------
+
+# -----------------------------------------------------------------------------
+# JUGTable
+#
+# Table with the distance to the goal and the next move for every state and
+# target of the water jugs problem with some given capacities
+# -----------------------------------------------------------------------------
+class JUGTable(object):
+    """Table with the distance to the goal and the next move for every state and
+       target of the water jugs problem with some given capacities. Tables are
+       built once and stored on disk, where they are memory-mapped from
+
+    """
+
+    def __init__(self, capacities: tuple, goal=jugproblem.GOAL_ANY,
+                 cache_dir: str = DEFAULT_CACHE_DIR, budget: jugbudget.JUGBudget = None):
+        """A table is initialized with the capacity of every jug, and the kind
+           of goal (see JUGProblem). If the table has been already stored in the
+           given directory it is memory-mapped from it. Otherwise, it is built
+           and stored there first, within the given budget, if any (see
+           JUGBudget). If the budget is exceeded, JUGBudgetInterrupt is raised
+           and no file is left behind
+
+        """
+
+        # create an instance just to verify the capacities and the goal, and
+        # also to compute the number of states and the number of targets
+        self._problem = jugproblem.JUGProblem(capacities, jugstate.JUGState(*[0] * len(capacities)),
+                                              0, goal)
+        self._capacities, self._goal = self._problem.get_capacities(), goal
+
+        # next moves are stored in one byte, where NO_OPERATOR is reserved.
+        # Thus, tables can only be built with less than 16 jugs, i.e., with no
+        # more than 240 operators
+        if self._problem.get_noperators() > NO_OPERATOR:
+            raise ValueError(CRITICAL_TOO_MANY_JUGS.format(len(self._capacities)))
+        self._nstates = self._problem.get_nstates()
+        if goal == jugproblem.GOAL_ANY:
+            self._ntargets = 1 + max(self._capacities)
+        elif goal == jugproblem.GOAL_TOTAL:
+            self._ntargets = 1 + sum(self._capacities)
+        else:
+            self._ntargets = 1 + self._capacities[goal]
+
+        # distances are stored as unsigned shorts if possible, and as unsigned
+        # ints otherwise. Note that no distance is larger than the number of
+        # states
+        self._typecode = 'H' if self._nstates < UNREACHABLE['H'] else 'I'
+
+        # tables are stored in files named after their capacities and goal, so
+        # that different capacities never share the same file
+        self._path = os.path.join(cache_dir, "jugs-{0}-{1}.tbl".format(
+            goal, "-".join(str(capacity) for capacity in self._capacities)))
+
+        # if the file does not exist or it is not valid, then build it
+        if not self._is_valid():
+            os.makedirs(cache_dir, exist_ok=True)
+            self._build(budget)
+
+        # and memory-map it
+        self._load()
+
+    def get_distance(self, state: jugstate.JUGState, target: int):
+        """return the number of steps from the given state to the target, or
+           None if it can not be reached
+
+        """
+
+        if target < 0 or target >= self._ntargets:
+            return None
+        distance = self._distances[target * self._nstates + self._problem.pack(state)]
+
+        return None if distance == UNREACHABLE[self._typecode] else distance
+
+    def get_path(self) -> str:
+        """return the path of the file where this table is stored"""
+
+        return self._path
+
+    def solve(self, problem: jugproblem.JUGProblem) -> jugsolution.JUGSolution:
+        """return an optimal solution of the given instance, which should have
+           the same capacities and goal than this table, or None if it has no
+           solution
+
+        """
+
+        # follow the next move of every state from the start state until a goal
+        # is reached. Because solutions consist of the start state and the
+        # operators applied, the states visited are not stored at all
+        target = problem.get_target()
+        if self.get_distance(problem.get_start(), target) is None:
+            return None
+
+        key = self._problem.pack(problem.get_start())
+        operators = []
+        offset = target * self._nstates
+        while self._operators[offset + key] != NO_OPERATOR:
+            operators.append(self._operators[offset + key])
+            key = self._problem.apply(key, operators[-1])
+
+        return jugsolution.JUGSolution(self._capacities, problem.get_start(), operators)
+
+    @staticmethod
+    def estimate(capacities: tuple, goal=jugproblem.GOAL_ANY) -> int:
+        """return the size in bytes of the table of the given capacities and
+           goal, including its header, i.e., the size of its file
+
+        """
+
+        nstates = 1
+        for capacity in capacities:
+            nstates *= capacity + 1
+        if goal == jugproblem.GOAL_ANY:
+            ntargets = 1 + max(capacities)
+        elif goal == jugproblem.GOAL_TOTAL:
+            ntargets = 1 + sum(capacities)
+        else:
+            ntargets = 1 + capacities[goal]
+        itemsize = 2 if nstates < UNREACHABLE['H'] else 4
+
+        # the header is padded to a multiple of eight bytes (see _header)
+        header = HEADER.size + 4 * len(capacities)
+        header += -header % 8
+
+        return header + nstates * ntargets * (itemsize + 1)
+
+    def _build(self, budget: jugbudget.JUGBudget = None):
+        """build the table and write it to its file, checking the given budget,
+           if any, as states are expanded
+
+        """
+
+        # the table is computed with a backward breadth-first search for every
+        # target, starting from all its goal states at once (see
+        # JUGProblem.goals) and using the inverse operators (see
+        # JUGProblem.predecessors). The first time a state is generated, its
+        # distance to the target is the depth of the layer, and its next move
+        # is the operator that transforms it into the state it was generated
+        # from. Budgets are checked by the predecessor function exactly as
+        # search algorithms check them with their successor function
+        predecessors = self._problem.predecessors
+        if budget is not None:
+            predecessors = jugbudget.observe_budget(budget, predecessors)
+        stream = tempfile.NamedTemporaryFile(dir=os.path.dirname(self._path), delete=False)
+        try:
+            with stream:
+                self._write(stream, predecessors)
+
+            # the file is renamed only once it is complete, so that other
+            # processes never read a partial table
+            os.replace(stream.name, self._path)
+
+        # if the build is interrupted for any reason (e.g., its budget is
+        # exceeded), then the partial file is removed
+        except BaseException:
+            os.unlink(stream.name)
+            raise
+
+    def _header(self) -> bytes:
+        """return the header of the file of this table"""
+
+        header = HEADER.pack(MAGIC, VERSION, len(self._capacities),
+                             GOALS.get(self._goal, self._goal), self._ntargets,
+                             self._nstates, self._typecode.encode())
+        header += struct.pack("<{0}I".format(len(self._capacities)), *self._capacities)
+
+        return header + bytes(-len(header) % 8)
+
+    def _is_valid(self) -> bool:
+        """return True if the file of this table exists and it has been written
+           for the same capacities and goal with the current format
+
+        """
+
+        if not os.path.isfile(self._path):
+            return False
+        header = self._header()
+        with open(self._path, "rb") as stream:
+            return stream.read(len(header)) == header
+
+    def _load(self):
+        """memory-map the file of this table"""
+
+        with open(self._path, "rb") as stream:
+            self._mmap = mmap.mmap(stream.fileno(), 0, access=mmap.ACCESS_READ)
+
+        # the distances of all targets follow the header, and the next moves
+        # follow the distances
+        offset = len(self._header())
+        size = self._ntargets * self._nstates * (2 if self._typecode == 'H' else 4)
+        if len(self._mmap) != offset + size + self._ntargets * self._nstates:
+            raise ValueError(CRITICAL_WRONG_TABLE_FILE.format(self._path))
+        view = memoryview(self._mmap)
+        self._distances = view[offset:offset + size].cast(self._typecode)
+        self._operators = view[offset + size:]
+
+    def _write(self, stream, predecessors):
+        """write the table to the given stream, computing the parents of every
+           state with the given predecessor function (see
+           JUGProblem.predecessors)
+
+        """
+
+        # the distances of all targets follow the header, and the next moves
+        # follow the distances (see _load). The distances and next moves of
+        # every target are written to their location as soon as they are
+        # computed, so that only those of one target are kept in memory
+        header = self._header()
+        stream.write(header)
+        size = self._nstates * array.array(self._typecode).itemsize
+        moves_offset = len(header) + self._ntargets * size
+        for target in range(self._ntargets):
+            problem = jugproblem.JUGProblem(self._capacities, self._problem.get_start(),
+                                            target, self._goal)
+            distances = array.array(self._typecode, [UNREACHABLE[self._typecode]]) * self._nstates
+            moves = bytearray([NO_OPERATOR]) * self._nstates
+
+            layer = list(problem.goals())
+            for key in layer:
+                distances[key] = 0
+            depth = 0
+            while len(layer) > 0:
+                depth += 1
+                next_layer = []
+                for key in layer:
+                    for parent in predecessors(key):
+                        if distances[parent] == UNREACHABLE[self._typecode]:
+                            distances[parent] = depth
+                            moves[parent] = problem.operator(parent, key)
+                            next_layer.append(parent)
+                layer = next_layer
+
+            stream.seek(len(header) + target * size)
+            stream.write(distances.tobytes())
+            stream.seek(moves_offset + target * self._nstates)
+            stream.write(moves)
+
+
+# -----------------------------------------------------------------------------
+# JUGTableSearch
+#
+# Solver of the water jugs problem which looks up the solution in a precomputed
+# table
+# -----------------------------------------------------------------------------
+class JUGTableSearch(jugsearch.JUGSearch):
+    """Solver of the water jugs problem which looks up the solution in a
+       precomputed table (see JUGTable). The table is built the first time
+       some capacities are used, and reused afterwards. Tables are opened only
+       once per process
+
+    """
+
+    def __init__(self, problem: jugproblem.JUGProblem, cache_dir: str = DEFAULT_CACHE_DIR):
+        """A solver of the water jugs problem using precomputed tables is
+           initialized with the instance to solve which has to be an instance
+           of JUGProblem, and the directory where tables are stored
+
+        """
+
+        super().__init__(problem)
+
+        # store the data members of this instance
+        self._cache_dir = cache_dir
+
+    @jugbudget.bounded
+    def solve(self) -> jugsolution.JUGSolution:
+        """look up the solution of this instance in the table of its capacities
+
+           it returns the solution as an instance of JUGSolution
+
+        """
+
+        # tables are stored only once they have been opened successfully, so
+        # that tables whose build was interrupted are built again next time
+        key = (self._problem.get_capacities(), self._problem.get_goal(), self._cache_dir)
+        if key not in _tables:
+            _tables[key] = JUGTable(*key, self._budget)
+        return _tables[key].solve(self._problem)
+
+
+# Local Variables:
+# mode:python
+# fill-column:80
+# End:
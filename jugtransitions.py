@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# jugtransitions.py
+# Description:
+# -----------------------------------------------------------------------------
+#
+# Started on <dom 18-10-2026 13:27:40.551902117 (1792330060)>
+# Carlos Linares López <carlos.linares@uc3m.es>
+#
+
+"""Precomputed tables with the child of every state by every operator, which
+turn the successor function into plain lookups
+
+"""
+
+# imports
+# -----------------------------------------------------------------------------
+import array
+
+import jugbitmap
+import jugproblem
+
+# NumPy is an optional dependency. If it is available, tables are built with
+# vectorized operations over all states at once, and otherwise one state at a
+# time
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+# classes
+# -----------------------------------------------------------------------------
+
+# -----------------------------------------------------------------------------
+# JUGTransitions
+#
+# Table with the child of every state by every operator for the capacities of
+# an instance
+# -----------------------------------------------------------------------------
+class JUGTransitions(object):
+    """Table with the child of every state by every operator for the capacities
+       of an instance. It provides the same successor function than
+       JUGProblem, but children are just looked up in the table
+
+    """
+
+    def __init__(self, problem: jugproblem.JUGProblem):
+        """A table of transitions is initialized with an instance of
+           JUGProblem. Only its capacities are relevant, so that the same
+           table serves any start state, target and goal. The table is built
+           right away, and its size can be computed in advance with estimate
+
+        """
+
+        # the table is a flat array with one row per packed state and one column
+        # per operator (see JUGProblem.apply), i.e., the child of the state
+        # packed in key by operator is stored at location key * noperators +
+        # operator. The smallest unsigned ints which can hold any packed state
+        # are used, and the largest value of its type marks operators which are
+        # not applicable. Note that children are stored in the same order than
+        # JUGProblem.successors generates them
+        self._capacities = problem.get_capacities()
+        self._noperators = problem.get_noperators()
+        self._typecode = jugbitmap.get_typecode(problem.get_nstates() + 1)
+        self._sentinel = (1 << (8 * array.array(self._typecode).itemsize)) - 1
+        if numpy is not None:
+            self._table = self._build_numpy(problem)
+        else:
+            self._table = self._build(problem)
+
+    def __len__(self) -> int:
+        """return the number of entries of this table"""
+
+        return len(self._table)
+
+    def apply(self, key: int, operator: int) -> int:
+        """return the packed representation of the child of the state packed in
+           the given integer which results from applying the given operator, or
+           NO_SUCCESSOR if it is not applicable (see JUGProblem.apply)
+
+        """
+
+        child = self._table[key * self._noperators + operator]
+        return jugproblem.NO_SUCCESSOR if child == self._sentinel else child
+
+    def get_capacities(self) -> tuple:
+        """return the capacities this table was built for"""
+
+        return self._capacities
+
+    def get_memory(self) -> int:
+        """return the size in bytes of this table"""
+
+        return len(self._table) * self._table.itemsize
+
+    def successors(self, key: int) -> list:
+        """return a list with the packed representation of all children of the
+           state packed in the given integer, in exactly the same order than
+           JUGProblem.successors
+
+        """
+
+        offset = key * self._noperators
+        sentinel = self._sentinel
+        return [child for child in self._table[offset:offset + self._noperators]
+                if child != sentinel]
+
+    @staticmethod
+    def estimate(capacities: tuple) -> int:
+        """return the size in bytes of the table of the given capacities. It is
+           built in time proportional to its number of entries (the size
+           divided by the bytes per entry), i.e., roughly thirty million entries
+           per second with NumPy, and about two million without it
+
+        """
+
+        nstates = 1
+        for capacity in capacities:
+            nstates *= capacity + 1
+        noperators = len(capacities) * (len(capacities) + 1)
+        itemsize = array.array(jugbitmap.get_typecode(nstates + 1)).itemsize
+
+        return nstates * noperators * itemsize
+
+    def _build(self, problem: jugproblem.JUGProblem) -> array.array:
+        """return the table of the given instance, computed one state at a
+           time
+
+        """
+
+        # this is the very same successor function than JUGProblem.successors,
+        # but every operator is given a column of the table, whether it is
+        # applicable or not
+        capacities, strides = problem.get_capacities(), problem.get_strides()
+        njugs, noperators = len(capacities), self._noperators
+        pours = [(i, j) for i in range(njugs) for j in range(njugs) if i != j]
+        table = array.array(self._typecode, [self._sentinel]) * (problem.get_nstates() * noperators)
+
+        for key in range(problem.get_nstates()):
+            volumes = problem.unpack_volumes(key)
+            offset = key * noperators
+
+            # emptying jugs and filling up
+            for i in range(njugs):
+                if volumes[i] > 0:
+                    table[offset + i] = key - volumes[i] * strides[i]
+                if volumes[i] < capacities[i]:
+                    table[offset + njugs + i] = key + (capacities[i] - volumes[i]) * strides[i]
+
+            # pouring from one jug to another
+            for operator, (i, j) in enumerate(pours, start=offset + 2 * njugs):
+                volume = min(volumes[i], capacities[j] - volumes[j])
+                if volume > 0:
+                    table[operator] = key + volume * (strides[j] - strides[i])
+
+        return table
+
+    def _build_numpy(self, problem: jugproblem.JUGProblem) -> array.array:
+        """return the table of the given instance, computed with NumPy one
+           operator at a time over all states at once
+
+        """
+
+        capacities, strides = problem.get_capacities(), problem.get_strides()
+        njugs = len(capacities)
+        keys = numpy.arange(problem.get_nstates(), dtype=numpy.int64)
+        volumes = [(keys // stride) % (capacity + 1) for capacity, stride in zip(capacities, strides)]
+        table = numpy.full((len(keys), self._noperators), self._sentinel,
+                           dtype=numpy.dtype(self._typecode))
+
+        # emptying jugs and filling up
+        for i in range(njugs):
+            applicable = volumes[i] > 0
+            table[applicable, i] = (keys - volumes[i] * strides[i])[applicable]
+            applicable = volumes[i] < capacities[i]
+            table[applicable, njugs + i] = (keys + (capacities[i] - volumes[i]) * strides[i])[applicable]
+
+        # pouring from one jug to another
+        operator = 2 * njugs
+        for i in range(njugs):
+            for j in range(njugs):
+                if i == j:
+                    continue
+                volume = numpy.minimum(volumes[i], capacities[j] - volumes[j])
+                applicable = volume > 0
+                table[applicable, operator] = (keys + volume * (strides[j] - strides[i]))[applicable]
+                operator += 1
+
+        # the table is returned as a plain array, whose items are Python ints
+        result = array.array(self._typecode)
+        result.frombytes(table.tobytes())
+        return result
+
+
+# Local Variables:
+# mode:python
+# fill-column:80
+# End:
@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# jugucs.py
+# Description:
+# -----------------------------------------------------------------------------
+#
+# Started on <dom 18-10-2026 12:04:51.772610358 (1792325091)>
+# Carlos Linares López <carlos.linares@uc3m.es>
+#
+
+"""Implementation of a solver of the water jugs problem using uniform-cost
+search with a bucket queue
+
+"""
+
+# imports
+# -----------------------------------------------------------------------------
+import jugbudget
+import jugcosts
+import jugproblem
+import jugsearch
+import jugsolution
+
+# constants
+# -----------------------------------------------------------------------------
+
+# backpointer of the start state
+NO_PARENT = -1
+
+# classes
+# -----------------------------------------------------------------------------
+
+# -----------------------------------------------------------------------------
+# JUGUniformCost
+#
+# Implementation of uniform-cost search for solving the water jugs problem
+# -----------------------------------------------------------------------------
+class JUGUniformCost(jugsearch.JUGSearch):
+    """Implementation of uniform-cost search (i.e., Dijkstra's algorithm) for
+       solving the water jugs problem with operator costs
+
+    """
+
+    def __init__(self, problem: jugproblem.JUGProblem, cost="unit"):
+        """A solver of the water jugs problem using uniform-cost search is
+           initialized with the instance to solve which has to be an instance
+           of JUGProblem, and the cost of the operators, either the name of one
+           defined in jugcosts, the costs of emptying, filling up and pouring
+           water, or a callable (see jugcosts.get_cost)
+
+        """
+
+        super().__init__(problem)
+
+        # store the data members of this instance
+        self._cost = jugcosts.get_cost(cost)
+
+    @jugbudget.bounded
+    def solve(self) -> jugsolution.JUGSolution:
+        """apply uniform-cost search to solve this instance
+
+           it returns the solution with the least cost as an instance of
+           JUGSolution, whose cost is available with get_cost
+
+        """
+
+        # uniform-cost search expands nodes in ascending order of g(n), the
+        # cost of the path from the start state to n. Because all costs are
+        # small non-negative ints, the open list is implemented as a bucket
+        # queue (as in Dial's algorithm) rather than a binary heap: the i-th
+        # bucket is a list with all nodes reached with cost i, so that nodes
+        # are inserted and popped in constant time, and buckets are traversed
+        # in ascending order of cost. Operators with no cost insert children
+        # into the bucket being traversed, which are then popped before moving
+        # to the next one. Every bucket is released once traversed.
+        #
+        # As in A* (see JUGAStar), instead of moving nodes to another bucket
+        # when a cheaper path to them is found, they are inserted again, and
+        # the old entry is skipped when popped, as the node has already been
+        # expanded by then
+
+        # -- initialization
+        self._generated, self._duplicates, self._expanded = 0, 0, 0
+        problem, cost = self._problem, self._cost
+        successors = self._get_successors()
+        is_goal = self._get_is_goal()
+        unpack_volumes = problem.unpack_volumes
+        start = problem.pack(problem.get_start())
+
+        # initialize the open list with the start state, and store its g-value
+        # and parent
+        buckets = [[start]]
+        g_values = {start: 0}
+        parents = {start: NO_PARENT}
+        closed = set()
+
+        # traverse all buckets in ascending order of cost
+        g = 0
+        while g < len(buckets):
+
+            bucket = buckets[g]
+            while len(bucket) > 0:
+
+                # get the next node with the least g-value, skipping those which
+                # were already expanded with a lower g-value
+                curr_state = bucket.pop()
+                if curr_state in closed:
+                    continue
+
+                # if this node is a goal, the return the solution immediately
+                if is_goal(curr_state):
+
+                    # Yeah, we made it!!! Hoorrrayyy!!
+                    return jugsolution.from_path(problem, self._path(parents, curr_state), g)
+
+                # otherwise, expand it
+                closed.add(curr_state)
+                children = successors(curr_state)
+                self._expanded += 1
+                self._generated += len(children)
+
+                volumes = unpack_volumes(curr_state)
+                for child in children:
+
+                    # skip children which were already expanded or reached with
+                    # a path which is not more expensive
+                    if child in closed:
+                        self._duplicates += 1
+                        continue
+                    child_g = g + cost(problem, volumes, unpack_volumes(child))
+                    if child_g >= g_values.get(child, child_g + 1):
+                        self._duplicates += 1
+                        continue
+
+                    g_values[child] = child_g
+                    parents[child] = curr_state
+                    while len(buckets) <= child_g:
+                        buckets.append([])
+                    buckets[child_g].append(child)
+
+            # release this bucket and move to the next one
+            buckets[g] = None
+            g += 1
+
+        # at this point, the open list has been exhausted, so return failure
+        return None
+
+    def _path(self, parents: dict, state: int) -> list:
+        """return the path from the start state to the given packed state by
+           following backpointers
+
+        """
+
+        path = []
+        while state != NO_PARENT:
+            path.append(state)
+            state = parents[state]
+
+        # states have been gathered from the goal to the start, so reverse them
+        path.reverse()
+        return path
+
+
+# Local Variables:
+# mode:python
+# fill-column:80
+# End: